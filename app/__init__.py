@@ -1,8 +1,13 @@
 import os
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from flask import Flask
+from flask.logging import default_handler
+from jinja2 import FileSystemBytecodeCache
 from .extensions import db, migrate, login_manager, jwt, cors, limiter, compress
+from .json_provider import ORJSON_AVAILABLE, OrjsonProvider
 from .main import main_bp
 from .api import api_bp
 from .pwa import pwa_bp
@@ -12,6 +17,10 @@ def create_app(config_object='config.Config'):
     app = Flask(__name__)
     app.config.from_object(config_object)
 
+    # Schnellere JSON-Serialisierung, falls orjson installiert ist
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+
     # Extensions initialisieren
     db.init_app(app)
     migrate.init_app(app, db)
@@ -64,7 +73,17 @@ def create_app(config_object='config.Config'):
             datefmt='%Y-%m-%d %H:%M:%S'
         ))
         file_handler.setLevel(logging.INFO)
-        app.logger.addHandler(file_handler)
+
+        # Datei- und stderr-Ausgabe in einem Hintergrund-Thread schreiben,
+        # damit Requests nicht auf Logging-I/O warten
+        log_queue = queue.Queue(-1)
+        queue_listener = QueueListener(
+            log_queue, default_handler, file_handler, respect_handler_level=True
+        )
+        app.logger.removeHandler(default_handler)
+        app.logger.addHandler(QueueHandler(log_queue))
+        queue_listener.start()
+        atexit.register(queue_listener.stop)
 
     # Set log level
     app.logger.setLevel(logging.INFO)
@@ -101,6 +120,13 @@ def create_app(config_object='config.Config'):
     from .cli import register_commands
     register_commands(app)
 
+    # Kompilierte Templates zwischen Worker-Starts wiederverwenden und beim
+    # Start vorkompilieren, damit der erste Request nicht parsen muss
+    if app.config.get('TEMPLATE_BYTECODE_CACHE'):
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+        for template_name in app.jinja_env.list_templates(extensions=['html']):
+            app.jinja_env.get_template(template_name)
+
     # Create default admin user if not exists
     with app.app_context():
         from .models import User
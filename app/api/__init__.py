@@ -1,7 +1,13 @@
-from flask import Blueprint
+from flask import Blueprint, g
 
 api_bp = Blueprint('api', __name__, template_folder='templates', static_folder='static')
 
+
+@api_bp.before_request
+def reset_current_user():
+    """Drop the user cached by get_current_user() when an app context is reused."""
+    g.pop('current_user', None)
+
 # Import legacy routes (for backwards compatibility)
 from . import routes
 
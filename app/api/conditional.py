@@ -0,0 +1,61 @@
+"""
+Conditional GET Helpers for API Endpoints.
+
+Lets polling clients skip unchanged responses via ETag / If-None-Match.
+"""
+
+import hashlib
+
+from flask import make_response, request
+
+
+def compute_etag(*parts) -> str:
+    """
+    Build an ETag value from the parts that identify a resource's state.
+
+    Args:
+        *parts: Values that change whenever the response would change
+            (IDs, timestamps, counts, query parameters)
+
+    Returns:
+        str: Short hex digest usable as ETag
+    """
+    raw = ':'.join(str(part) for part in parts)
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+
+def not_modified(etag: str):
+    """
+    Answer with 304 Not Modified if the client already has this state.
+
+    ETags are weak: they describe the data, not one encoding of it, so they
+    stay valid when the response is compressed.
+
+    Args:
+        etag: ETag of the current state
+
+    Returns:
+        Response with status 304, or None if the client's copy is stale
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+
+    response = make_response('', 304)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def with_etag(result, etag: str):
+    """
+    Attach an ETag to a response built by success_response/paginated_response.
+
+    Args:
+        result: (response, status_code) tuple
+        etag: ETag of the returned state
+
+    Returns:
+        tuple: (response, status_code)
+    """
+    response, status_code = result
+    response.set_etag(etag, weak=True)
+    return response, status_code
@@ -5,9 +5,10 @@ Provides decorators for JWT-based authentication and role-based access control.
 """
 
 from functools import wraps
-from flask import jsonify
+from flask import g, jsonify
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
 from .errors import ForbiddenError, UnauthorizedError
+from ..extensions import db
 from ..models import User
 
 
@@ -27,12 +28,7 @@ def admin_required():
     def wrapper(fn):
         @wraps(fn)
         def decorator(*args, **kwargs):
-            verify_jwt_in_request()
-            user_id = int(get_jwt_identity())
-            user = User.query.get(user_id)
-
-            if not user:
-                raise UnauthorizedError('Benutzer nicht gefunden')
+            user = get_current_user()
 
             if not user.is_admin:
                 raise ForbiddenError('Administrator-Rechte erforderlich')
@@ -46,19 +42,27 @@ def get_current_user() -> User:
     """
     Get the current authenticated user from JWT token.
 
+    The user is kept in ``g`` for the rest of the request, so decorators and
+    the view share a single token check (including the blocklist query).
+
     Returns:
         User: The current user object
 
     Raises:
         UnauthorizedError: If user is not found
     """
+    user = g.get('current_user')
+    if user is not None:
+        return user
+
     verify_jwt_in_request()
     user_id = int(get_jwt_identity())
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         raise UnauthorizedError('Benutzer nicht gefunden')
 
+    g.current_user = user
     return user
 
 
@@ -79,12 +83,8 @@ def self_or_admin_required(user_id_param: str = 'user_id'):
     def wrapper(fn):
         @wraps(fn)
         def decorator(*args, **kwargs):
-            verify_jwt_in_request()
-            current_user_id = int(get_jwt_identity())
-            current_user = User.query.get(current_user_id)
-
-            if not current_user:
-                raise UnauthorizedError('Benutzer nicht gefunden')
+            current_user = get_current_user()
+            current_user_id = current_user.id
 
             # Get the user_id from the route parameters
             target_user_id = kwargs.get(user_id_param)
@@ -102,7 +102,8 @@ def list_owner_or_admin_required():
     """
     Decorator that requires the user to be the list owner or an admin.
 
-    Expects 'list_id' in the route parameters.
+    Expects 'list_id' in the route parameters. The loaded list (including
+    soft-deleted ones) is stored in ``g.shopping_list`` for the view.
 
     Usage:
         @app.route('/lists/<int:list_id>')
@@ -116,15 +117,11 @@ def list_owner_or_admin_required():
         def decorator(*args, **kwargs):
             from ..models import ShoppingList
 
-            verify_jwt_in_request()
-            current_user_id = int(get_jwt_identity())
-            current_user = User.query.get(current_user_id)
-
-            if not current_user:
-                raise UnauthorizedError('Benutzer nicht gefunden')
+            current_user = get_current_user()
+            current_user_id = current_user.id
 
             list_id = kwargs.get('list_id')
-            shopping_list = ShoppingList.query.get(list_id)
+            shopping_list = db.session.get(ShoppingList, list_id)
 
             if not shopping_list:
                 from .errors import NotFoundError
@@ -134,6 +131,8 @@ def list_owner_or_admin_required():
             if not (current_user.is_admin or shopping_list.user_id == current_user_id):
                 raise ForbiddenError('Zugriff nur auf eigene Listen erlaubt')
 
+            g.shopping_list = shopping_list
+
             return fn(*args, **kwargs)
         return decorator
     return wrapper
@@ -143,6 +142,9 @@ def list_access_required(allow_shared: bool = True):
     """
     Decorator that checks if user has access to a list (owner, admin, or shared).
 
+    Soft-deleted lists are reported as not found. The loaded list is stored
+    in ``g.shopping_list`` for the view.
+
     Args:
         allow_shared: If True, allows access to shared lists
 
@@ -158,15 +160,11 @@ def list_access_required(allow_shared: bool = True):
         def decorator(*args, **kwargs):
             from ..models import ShoppingList
 
-            verify_jwt_in_request()
-            current_user_id = int(get_jwt_identity())
-            current_user = User.query.get(current_user_id)
-
-            if not current_user:
-                raise UnauthorizedError('Benutzer nicht gefunden')
+            current_user = get_current_user()
+            current_user_id = current_user.id
 
             list_id = kwargs.get('list_id')
-            shopping_list = ShoppingList.query.get(list_id)
+            shopping_list = db.session.get(ShoppingList, list_id)
 
             if not shopping_list:
                 from .errors import NotFoundError
@@ -180,6 +178,71 @@ def list_access_required(allow_shared: bool = True):
             if not (is_owner or is_admin or is_shared_access):
                 raise ForbiddenError('Zugriff auf diese Liste nicht erlaubt')
 
+            # Lists in the trash are only reachable through the restore endpoints
+            if shopping_list.is_deleted:
+                from .errors import NotFoundError
+                raise NotFoundError('Einkaufsliste nicht gefunden')
+
+            # Hand the loaded list to the view so it doesn't query it again
+            g.shopping_list = shopping_list
+
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+
+def item_access_required(allow_shared: bool = True,
+                         forbidden_message: str = 'Zugriff auf diesen Artikel nicht erlaubt'):
+    """
+    Decorator that checks if user has access to an item's list (owner, admin, or shared).
+
+    Expects 'item_id' in the route parameters. The item is loaded together
+    with its list; both are stored in ``g.item`` and ``g.shopping_list``.
+    Soft-deleted items are reported as not found.
+
+    Args:
+        allow_shared: If True, allows access to items of shared lists
+        forbidden_message: Error message used when access is denied
+
+    Usage:
+        @app.route('/items/<int:item_id>')
+        @jwt_required()
+        @item_access_required(allow_shared=True)
+        def view_item(item_id):
+            ...
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            from sqlalchemy.orm import joinedload
+            from ..models import ShoppingListItem
+
+            current_user = get_current_user()
+            current_user_id = current_user.id
+
+            item_id = kwargs.get('item_id')
+            item = db.session.get(
+                ShoppingListItem, item_id,
+                options=[joinedload(ShoppingListItem.shopping_list)]
+            )
+
+            if not item or item.is_deleted:
+                from .errors import NotFoundError
+                raise NotFoundError('Artikel nicht gefunden')
+
+            shopping_list = item.shopping_list
+
+            # Check access permissions
+            is_owner = shopping_list.user_id == current_user_id
+            is_admin = current_user.is_admin
+            is_shared_access = allow_shared and shopping_list.is_shared
+
+            if not (is_owner or is_admin or is_shared_access):
+                raise ForbiddenError(forbidden_message)
+
+            g.item = item
+            g.shopping_list = shopping_list
+
             return fn(*args, **kwargs)
         return decorator
     return wrapper
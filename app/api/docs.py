@@ -242,9 +242,21 @@ update_item_request = api.model('UpdateItemRequest', {
 })
 
 reorder_item_request = api.model('ReorderItemRequest', {
+    'order_index': fields.Integer(description='New order index (must be >= 0)', min=0, example=10),
+    'before_id': fields.Integer(description='Alternative to order_index: ID of the item shown directly above', example=3),
+    'after_id': fields.Integer(description='Alternative to order_index: ID of the item shown directly below', example=4)
+})
+
+bulk_reorder_entry = api.model('BulkReorderEntry', {
+    'id': fields.Integer(required=True, description='Item ID', example=3),
     'order_index': fields.Integer(required=True, description='New order index (must be >= 0)', min=0, example=10)
 })
 
+bulk_reorder_request = api.model('BulkReorderRequest', {
+    'items': fields.List(fields.Nested(bulk_reorder_entry), required=True,
+                         description='New order indexes (1-500 entries, each item once)')
+})
+
 # Response Models
 list_response = api.model('ListResponse', {
     'success': fields.Boolean(description='Success status', example=True),
@@ -271,7 +283,8 @@ pagination_meta = api.model('PaginationMeta', {
     'total': fields.Integer(description='Total number of items', example=45),
     'pages': fields.Integer(description='Total number of pages', example=3),
     'has_next': fields.Boolean(description='Has next page', example=True),
-    'has_prev': fields.Boolean(description='Has previous page', example=False)
+    'has_prev': fields.Boolean(description='Has previous page', example=False),
+    'next_cursor': fields.String(description='Cursor of the next page (cursor pagination only, null on the last page)')
 })
 
 paginated_lists_response = api.model('PaginatedListsResponse', {
@@ -570,7 +583,9 @@ class UserLists(Resource):
                   description='Get all shopping lists for a specific user.',
                   params={
                       'page': 'Page number (default: 1)',
-                      'per_page': 'Items per page (default: 20, max: 100)'
+                      'per_page': 'Items per page (default: 20, max: 100)',
+                      'cursor': 'Keyset pagination instead of page numbers: empty for the first page, '
+                                'then next_cursor from the previous response (no total/pages)'
                   },
                   responses={
                       200: ('Lists retrieved successfully', paginated_lists_response),
@@ -595,10 +610,13 @@ class ListCollection(Resource):
                   description='Get all shopping lists for the current user (paginated, active lists only).',
                   params={
                       'page': 'Page number (default: 1)',
-                      'per_page': 'Items per page (default: 20, max: 100)'
+                      'per_page': 'Items per page (default: 20, max: 100)',
+                      'cursor': 'Keyset pagination instead of page numbers: empty for the first page, '
+                                'then next_cursor from the previous response (no total/pages)'
                   },
                   responses={
                       200: ('Lists retrieved successfully', paginated_lists_response),
+                      400: ('Invalid cursor', error_response),
                       401: ('Unauthorized', error_response)
                   },
                   security='Bearer')
@@ -786,6 +804,26 @@ class ClearCheckedItems(Resource):
         pass
 
 
+@items_ns.route('/lists/<int:list_id>/items/reorder-bulk')
+@items_ns.param('list_id', 'Shopping list ID')
+class BulkReorderItems(Resource):
+    @items_ns.doc('reorder_items_bulk',
+                  description='Change the order index of several items of a list in one request (e.g. after drag-and-drop).',
+                  responses={
+                      200: ('Items reordered successfully', success_response_model),
+                      400: ('Validation error', error_response),
+                      401: ('Unauthorized', error_response),
+                      403: ('Forbidden - Owner or admin only', error_response),
+                      404: ('List or item not found', error_response)
+                  },
+                  security='Bearer')
+    @items_ns.expect(bulk_reorder_request, validate=True)
+    @items_ns.marshal_with(success_response_model)
+    def post(self, list_id):
+        """Reorder several items"""
+        pass
+
+
 @items_ns.route('/items/<int:item_id>')
 @items_ns.param('item_id', 'Item ID')
 class ItemResource(Resource):
@@ -877,7 +915,7 @@ class ToggleItem(Resource):
 @items_ns.param('item_id', 'Item ID')
 class ReorderItem(Resource):
     @items_ns.doc('reorder_item',
-                  description='Change the order index of an item for custom sorting.',
+                  description='Change the order index of an item for custom sorting, either directly or by naming the neighbours it was moved between.',
                   responses={
                       200: ('Item reordered successfully', success_response_model),
                       400: ('Validation error', error_response),
@@ -985,6 +1023,10 @@ class TrashListResource(Resource):
 class TrashItems(Resource):
     @trash_ns.doc('get_trash_items',
                   description='Get all deleted items for the current user.',
+                  params={
+                      'page': 'Page number (default: 1)',
+                      'per_page': 'Items per page (default: 20, max: 100)'
+                  },
                   responses={
                       200: ('Deleted items retrieved successfully', success_response_model),
                       401: ('Unauthorized', error_response)
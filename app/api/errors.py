@@ -96,6 +96,31 @@ def paginated_response(items, pagination, schema=None):
     return jsonify(payload), 200
 
 
+def cursor_response(items, next_cursor: str = None, per_page: int = None):
+    """
+    Create a response for a page fetched with keyset pagination.
+
+    Args:
+        items: List of items to return
+        next_cursor: Cursor for the following page (None on the last page)
+        per_page: Requested page size
+
+    Returns:
+        tuple: (response, status_code)
+    """
+    payload = {
+        'success': True,
+        'data': items,
+        'pagination': {
+            'per_page': per_page,
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None
+        }
+    }
+
+    return jsonify(payload), 200
+
+
 # ============================================================================
 # Error Code Constants
 # ============================================================================
@@ -0,0 +1,85 @@
+"""
+Keyset (Cursor) Pagination Helpers for API Endpoints.
+
+Pages through rows ordered by ``(updated_at DESC, id DESC)``. Each page
+continues after the last row of the previous one, so the database neither
+skips OFFSET rows nor counts the whole result.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from sqlalchemy import tuple_
+
+from .errors import ValidationError
+
+
+def encode_cursor(updated_at: datetime, row_id: int) -> str:
+    """
+    Build an opaque cursor pointing after the given row.
+
+    Args:
+        updated_at: updated_at of the last row on the page
+        row_id: ID of the last row on the page
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    # Timestamps are stored as naive UTC
+    raw = f'{updated_at.replace(tzinfo=None).isoformat()}|{row_id}'
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    Parse a cursor created by encode_cursor().
+
+    Args:
+        cursor: Cursor string from a previous response
+
+    Returns:
+        tuple: (updated_at, row_id)
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        updated_at, row_id = raw.split('|')
+        return datetime.fromisoformat(updated_at), int(row_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValidationError('Ungültiger Cursor', details={'cursor': ['Ungültiger Wert']})
+
+
+def keyset_paginate(query, model, cursor: str, per_page: int) -> tuple:
+    """
+    Fetch the page after the cursor, newest first.
+
+    Reads one extra row to find out whether another page follows.
+
+    Args:
+        query: Query whose first entity is ``model``
+        model: Model with ``updated_at`` and ``id`` columns
+        cursor: Cursor from a previous page, empty for the first page
+        per_page: Number of rows per page
+
+    Returns:
+        tuple: (rows, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    if cursor:
+        updated_at, row_id = decode_cursor(cursor)
+        query = query.filter(tuple_(model.updated_at, model.id) < (updated_at, row_id))
+
+    rows = query.order_by(model.updated_at.desc(), model.id.desc()).limit(per_page + 1).all()
+
+    if len(rows) <= per_page:
+        return rows, None
+
+    rows = rows[:per_page]
+    last = rows[-1] if isinstance(rows[-1], model) else rows[-1][0]
+
+    return rows, encode_cursor(last.updated_at, last.id)
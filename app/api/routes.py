@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from flask import abort, jsonify, request
 from flask_login import current_user, login_required
 from sqlalchemy import desc
+from sqlalchemy.orm import joinedload
 
 from . import api_bp
 from ..extensions import db, limiter
@@ -68,7 +69,9 @@ def get_list(list_id: int):
     if not check_list_access(shopping_list, allow_shared=True):
         abort(403)
 
-    items = shopping_list.items.order_by(ShoppingListItem.order_index.desc()).all()
+    items = shopping_list.items.order_by(
+        ShoppingListItem.order_index.desc(), ShoppingListItem.id.desc()
+    ).all()
 
     return jsonify({
         'success': True,
@@ -179,7 +182,9 @@ def get_items(list_id: int):
     if not check_list_access(shopping_list, allow_shared=True):
         abort(403)
 
-    items = shopping_list.items.order_by(ShoppingListItem.order_index.desc()).all()
+    items = shopping_list.items.order_by(
+        ShoppingListItem.order_index.desc(), ShoppingListItem.id.desc()
+    ).all()
 
     return jsonify({
         'success': True,
@@ -241,7 +246,9 @@ def create_item(list_id: int):
 @login_required
 def update_item(item_id: int):
     """Update a shopping list item."""
-    item = ShoppingListItem.query.get_or_404(item_id)
+    item = ShoppingListItem.query.options(
+        joinedload(ShoppingListItem.shopping_list)
+    ).filter_by(id=item_id).first_or_404()
     shopping_list = item.shopping_list
 
     if not check_list_access(shopping_list, allow_shared=True):
@@ -274,7 +281,9 @@ def update_item(item_id: int):
 @login_required
 def toggle_item(item_id: int):
     """Toggle the checked status of an item."""
-    item = ShoppingListItem.query.get_or_404(item_id)
+    item = ShoppingListItem.query.options(
+        joinedload(ShoppingListItem.shopping_list)
+    ).filter_by(id=item_id).first_or_404()
     shopping_list = item.shopping_list
 
     if not check_list_access(shopping_list, allow_shared=True):
@@ -297,7 +306,9 @@ def toggle_item(item_id: int):
 @login_required
 def delete_item(item_id: int):
     """Delete a shopping list item."""
-    item = ShoppingListItem.query.get_or_404(item_id)
+    item = ShoppingListItem.query.options(
+        joinedload(ShoppingListItem.shopping_list)
+    ).filter_by(id=item_id).first_or_404()
     shopping_list = item.shopping_list
 
     if not check_list_access(shopping_list, allow_shared=True):
@@ -322,7 +333,9 @@ def get_shared_list(guid: str):
     if not shopping_list.is_shared:
         abort(404)
 
-    items = shopping_list.items.order_by(ShoppingListItem.order_index.desc()).all()
+    items = shopping_list.items.order_by(
+        ShoppingListItem.order_index.desc(), ShoppingListItem.id.desc()
+    ).all()
 
     return jsonify({
         'success': True,
@@ -2,6 +2,8 @@
 Marshmallow Schemas for API Request/Response Validation and Serialization.
 
 These schemas define the structure and validation rules for all API endpoints.
+They keep no per-call state in load()/dump(), so the endpoint modules build
+each schema once at import time and reuse it across requests.
 """
 
 from marshmallow import Schema, fields, validate, ValidationError, validates, validates_schema
@@ -127,10 +129,62 @@ class ShoppingListItemUpdateSchema(Schema):
 
 
 class ShoppingListItemReorderSchema(Schema):
-    """Schema for reordering items."""
+    """Schema for reordering items (absolute index or between two neighbours)."""
+    order_index = fields.Int(validate=validate.Range(min=0))
+    before_id = fields.Int(allow_none=True)
+    after_id = fields.Int(allow_none=True)
+
+    @validates_schema
+    def validate_target(self, data, **kwargs):
+        """Validate that either order_index or a neighbour is given."""
+        if 'order_index' not in data and data.get('before_id') is None and data.get('after_id') is None:
+            raise ValidationError('order_index oder before_id/after_id erforderlich', field_name='order_index')
+
+
+class ShoppingListItemBulkReorderEntrySchema(Schema):
+    """Schema for one entry of a bulk reorder."""
+    id = fields.Int(required=True)
     order_index = fields.Int(required=True, validate=validate.Range(min=0))
 
 
+class ShoppingListItemBulkReorderSchema(Schema):
+    """Schema for reordering several items of a list at once."""
+    items = fields.List(
+        fields.Nested(ShoppingListItemBulkReorderEntrySchema),
+        required=True,
+        validate=validate.Length(min=1, max=500)
+    )
+
+    @validates_schema
+    def validate_unique_ids(self, data, **kwargs):
+        """Validate that every item appears only once."""
+        ids = [entry['id'] for entry in data.get('items', [])]
+        if len(ids) != len(set(ids)):
+            raise ValidationError('Jeder Artikel darf nur einmal vorkommen', field_name='items')
+
+
+class ShoppingListItemBulkToggleEntrySchema(Schema):
+    """Schema for one entry of a bulk check/uncheck."""
+    id = fields.Int(required=True)
+    is_checked = fields.Bool(required=True)
+
+
+class ShoppingListItemBulkToggleSchema(Schema):
+    """Schema for setting the checked status of several items at once."""
+    items = fields.List(
+        fields.Nested(ShoppingListItemBulkToggleEntrySchema),
+        required=True,
+        validate=validate.Length(min=1, max=500)
+    )
+
+    @validates_schema
+    def validate_unique_ids(self, data, **kwargs):
+        """Validate that every item appears only once."""
+        ids = [entry['id'] for entry in data.get('items', [])]
+        if len(ids) != len(set(ids)):
+            raise ValidationError('Jeder Artikel darf nur einmal vorkommen', field_name='items')
+
+
 class ShoppingListSchema(Schema):
     """Schema for shopping list responses."""
     id = fields.Int(dump_only=True)
@@ -7,6 +7,7 @@ Administrative endpoints for system management and statistics.
 from flask import request
 from flask_jwt_extended import jwt_required
 from sqlalchemy import func, desc
+from sqlalchemy.orm import selectinload
 
 from . import v1_bp
 from ...extensions import db
@@ -136,10 +137,21 @@ def get_all_lists():
     per_page = min(request.args.get('per_page', 20, type=int), 100)
     shared_only = request.args.get('shared_only', 'false').lower() == 'true'
 
-    query = ShoppingList.query
+    # Fetch the item counts with the page instead of one COUNT per list;
+    # trashed lists are included here, so count their items too
+    counts = ShoppingListItem.count_by_list(include_deleted=True)
+    query = db.session.query(
+        ShoppingList,
+        func.coalesce(counts.c.item_count, 0)
+    ).outerjoin(
+        counts, counts.c.shopping_list_id == ShoppingList.id
+    ).options(
+        # Load the owners of the whole page in one IN query
+        selectinload(ShoppingList.owner).load_only(User.username)
+    )
 
     if shared_only:
-        query = query.filter_by(is_shared=True)
+        query = query.filter(ShoppingList.is_shared.is_(True))
 
     pagination = query.order_by(desc(ShoppingList.updated_at)).paginate(
         page=page,
@@ -148,9 +160,8 @@ def get_all_lists():
     )
 
     # Serialize lists with owner and item count
-    lists_data = []
-    for shopping_list in pagination.items:
-        list_data = {
+    lists_data = [
+        {
             'id': shopping_list.id,
             'guid': shopping_list.guid,
             'title': shopping_list.title,
@@ -159,9 +170,10 @@ def get_all_lists():
             'owner_username': shopping_list.owner.username,
             'created_at': shopping_list.created_at.isoformat(),
             'updated_at': shopping_list.updated_at.isoformat(),
-            'item_count': shopping_list.items.count()
+            'item_count': item_count
         }
-        lists_data.append(list_data)
+        for shopping_list, item_count in pagination.items
+    ]
 
     return paginated_response(lists_data, pagination)
 
@@ -184,7 +196,7 @@ def admin_delete_list(list_id: int):
         403: Forbidden (not admin)
         404: List not found
     """
-    shopping_list = ShoppingList.query.get(list_id)
+    shopping_list = db.session.get(ShoppingList, list_id)
 
     if not shopping_list:
         raise NotFoundError('Einkaufsliste nicht gefunden')
@@ -293,7 +305,7 @@ def get_user_activity(user_id: int):
         403: Forbidden (not admin)
         404: User not found
     """
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         raise NotFoundError('Benutzer nicht gefunden')
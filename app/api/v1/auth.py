@@ -33,6 +33,11 @@ from ..errors import (
 )
 from ..decorators import get_current_user
 
+_login_schema = LoginSchema()
+_register_schema = RegisterSchema()
+_change_password_schema = ChangePasswordSchema()
+_user_schema = UserSchema()
+
 
 # ============================================================================
 # Registration
@@ -60,9 +65,8 @@ def register():
     data = request.get_json()
 
     # Validate request data
-    schema = RegisterSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _register_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -71,18 +75,21 @@ def register():
             details=err.messages
         )
 
-    # Check if username or email already exists
-    if User.query.filter_by(username=validated_data['username']).first():
+    # Check username and email conflicts in one query
+    conflict = User.find_conflict(username=validated_data['username'], email=validated_data['email'])
+    if conflict == 'username':
         current_app.logger.warning(
-            f'Registrierungsversuch mit bereits vergebenem Benutzernamen: '
-            f'"{validated_data["username"]}" von IP: {request.remote_addr}'
+            'Registrierungsversuch mit bereits vergebenem Benutzernamen: '
+            '"%s" von IP: %s',
+            validated_data['username'], request.remote_addr
         )
         raise ConflictError('Benutzername bereits vergeben')
 
-    if User.query.filter_by(email=validated_data['email']).first():
+    if conflict == 'email':
         current_app.logger.warning(
-            f'Registrierungsversuch mit bereits registrierter E-Mail: '
-            f'"{validated_data["email"]}" von IP: {request.remote_addr}'
+            'Registrierungsversuch mit bereits registrierter E-Mail: '
+            '"%s" von IP: %s',
+            validated_data['email'], request.remote_addr
         )
         raise ConflictError('E-Mail-Adresse bereits registriert')
 
@@ -98,16 +105,18 @@ def register():
     db.session.commit()
 
     current_app.logger.info(
-        f'Neuer Benutzer registriert: "{user.username}" (ID: {user.id}, E-Mail: {user.email})'
+        'Neuer Benutzer registriert: "%s" (ID: %s, E-Mail: %s)',
+        user.username, user.id, user.email
     )
 
     # Create tokens (convert user.id to string for JWT)
-    access_token = create_access_token(identity=str(user.id))
-    refresh_token = create_refresh_token(identity=str(user.id))
+    # Username is embedded as claim so logout can log it without a DB lookup
+    claims = {'username': user.username}
+    access_token = create_access_token(identity=str(user.id), additional_claims=claims)
+    refresh_token = create_refresh_token(identity=str(user.id), additional_claims=claims)
 
     # Serialize user data
-    user_schema = UserSchema()
-    user_data = user_schema.dump(user)
+    user_data = _user_schema.dump(user)
 
     return success_response(
         data={
@@ -146,9 +155,8 @@ def login():
     data = request.get_json()
 
     # Validate request data
-    schema = LoginSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _login_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -157,14 +165,13 @@ def login():
             details=err.messages
         )
 
-    # Find user
-    user = User.query.filter_by(username=validated_data['username']).first()
-
     # Check credentials
-    if not user or not user.check_password(validated_data['password']):
+    user = User.authenticate(validated_data['username'], validated_data['password'])
+    if user is None:
         current_app.logger.warning(
-            f'Fehlgeschlagener API-Anmeldeversuch für Benutzername: '
-            f'"{validated_data["username"]}" von IP: {request.remote_addr}'
+            'Fehlgeschlagener API-Anmeldeversuch für Benutzername: '
+            '"%s" von IP: %s',
+            validated_data['username'], request.remote_addr
         )
         return error_response(
             status_code=401,
@@ -172,17 +179,24 @@ def login():
             error_code=ErrorCodes.INVALID_CREDENTIALS
         )
 
+    # Upgrade hashes created with an outdated method or cost
+    if user.password_needs_rehash():
+        user.set_password(validated_data['password'])
+        db.session.commit()
+
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat sich via API erfolgreich angemeldet'
+        'Benutzer "%s" (ID: %s) hat sich via API erfolgreich angemeldet',
+        user.username, user.id
     )
 
     # Create tokens (convert user.id to string for JWT)
-    access_token = create_access_token(identity=str(user.id))
-    refresh_token = create_refresh_token(identity=str(user.id))
+    # Username is embedded as claim so logout can log it without a DB lookup
+    claims = {'username': user.username}
+    access_token = create_access_token(identity=str(user.id), additional_claims=claims)
+    refresh_token = create_refresh_token(identity=str(user.id), additional_claims=claims)
 
     # Serialize user data
-    user_schema = UserSchema()
-    user_data = user_schema.dump(user)
+    user_data = _user_schema.dump(user)
 
     return success_response(
         data={
@@ -214,9 +228,12 @@ def refresh():
         401: Invalid or expired refresh token
     """
     current_user_id = get_jwt_identity()
+    user = db.session.get(User, int(current_user_id))
 
-    # Create new access token
-    access_token = create_access_token(identity=current_user_id)
+    # Take the username from the current row; the refresh token's claim
+    # may predate a rename
+    claims = {'username': user.username} if user else None
+    access_token = create_access_token(identity=current_user_id, additional_claims=claims)
 
     return success_response(
         data={
@@ -249,8 +266,9 @@ def logout():
     user_id = int(get_jwt_identity())
     expires_at = datetime.fromtimestamp(jwt_data['exp'], tz=timezone.utc)
 
-    user = User.query.get(user_id)
-    username = user.username if user else f"ID:{user_id}"
+    # The token's claim is only a fallback, it may predate a rename
+    user = db.session.get(User, user_id)
+    username = user.username if user else jwt_data.get('username', f'ID:{user_id}')
 
     # Add token to blacklist
     RevokedToken.add_to_blacklist(
@@ -261,7 +279,8 @@ def logout():
     )
 
     current_app.logger.info(
-        f'Benutzer "{username}" (ID: {user_id}) hat sich via API abgemeldet'
+        'Benutzer "%s" (ID: %s) hat sich via API abgemeldet',
+        username, user_id
     )
 
     return success_response(
@@ -324,8 +343,7 @@ def get_current_user_info():
     """
     user = get_current_user()
 
-    user_schema = UserSchema()
-    user_data = user_schema.dump(user)
+    user_data = _user_schema.dump(user)
 
     return success_response(data=user_data)
 
@@ -354,24 +372,24 @@ def update_current_user():
     user = get_current_user()
     data = request.get_json()
 
-    # Check for username conflict
-    if 'username' in data and data['username'] != user.username:
-        existing_user = User.query.filter_by(username=data['username']).first()
-        if existing_user:
-            raise ConflictError('Benutzername bereits vergeben')
-        user.username = data['username']
+    new_username = data['username'] if 'username' in data and data['username'] != user.username else None
+    new_email = data['email'] if 'email' in data and data['email'] != user.email else None
+
+    # Check username and email conflicts in one query
+    conflict = User.find_conflict(username=new_username, email=new_email, exclude_id=user.id)
+    if conflict == 'username':
+        raise ConflictError('Benutzername bereits vergeben')
+    if conflict == 'email':
+        raise ConflictError('E-Mail-Adresse bereits registriert')
 
-    # Check for email conflict
-    if 'email' in data and data['email'] != user.email:
-        existing_user = User.query.filter_by(email=data['email']).first()
-        if existing_user:
-            raise ConflictError('E-Mail-Adresse bereits registriert')
-        user.email = data['email']
+    if new_username is not None:
+        user.username = new_username
+    if new_email is not None:
+        user.email = new_email
 
     db.session.commit()
 
-    user_schema = UserSchema()
-    user_data = user_schema.dump(user)
+    user_data = _user_schema.dump(user)
 
     return success_response(
         data=user_data,
@@ -409,9 +427,8 @@ def change_password():
     data = request.get_json()
 
     # Validate request data
-    schema = ChangePasswordSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _change_password_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -423,8 +440,9 @@ def change_password():
     # Verify old password
     if not user.check_password(validated_data['old_password']):
         current_app.logger.warning(
-            f'Benutzer "{user.username}" (ID: {user.id}) hat ein falsches altes Passwort '
-            f'beim Passwort-Änderungsversuch eingegeben'
+            'Benutzer "%s" (ID: %s) hat ein falsches altes Passwort '
+            'beim Passwort-Änderungsversuch eingegeben',
+            user.username, user.id
         )
         return error_response(
             status_code=401,
@@ -437,7 +455,8 @@ def change_password():
     db.session.commit()
 
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat sein Passwort geändert'
+        'Benutzer "%s" (ID: %s) hat sein Passwort geändert',
+        user.username, user.id
     )
 
     return success_response(
@@ -5,9 +5,11 @@ Handles all operations related to shopping list items.
 """
 
 from datetime import datetime, timezone
-from flask import request, current_app
+from flask import g, request, current_app
 from flask_jwt_extended import jwt_required
 from marshmallow import ValidationError
+from sqlalchemy import update
+from sqlalchemy.orm import contains_eager, joinedload
 
 from . import v1_bp
 from ...extensions import db, limiter
@@ -16,16 +18,24 @@ from ..schemas import (
     ShoppingListItemSchema,
     ShoppingListItemCreateSchema,
     ShoppingListItemUpdateSchema,
-    ShoppingListItemReorderSchema
+    ShoppingListItemReorderSchema,
+    ShoppingListItemBulkReorderSchema
 )
 from ..errors import (
     error_response,
     success_response,
+    paginated_response,
     NotFoundError,
     ForbiddenError,
     ErrorCodes
 )
-from ..decorators import get_current_user, list_access_required
+from ..conditional import compute_etag, not_modified, with_etag
+from ..decorators import get_current_user, item_access_required, list_access_required
+
+_item_create_schema = ShoppingListItemCreateSchema()
+_item_update_schema = ShoppingListItemUpdateSchema()
+_item_reorder_schema = ShoppingListItemReorderSchema()
+_item_bulk_reorder_schema = ShoppingListItemBulkReorderSchema()
 
 
 # ============================================================================
@@ -42,18 +52,26 @@ def get_items(list_id: int):
     Path Parameters:
         list_id (int): Shopping list ID
 
+    Headers:
+        If-None-Match: ETag from a previous response (optional)
+
     Returns:
         200: List of items
+        304: Items unchanged since the given ETag
         401: Unauthorized
         403: Forbidden
         404: List not found
     """
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first()
+    shopping_list = g.shopping_list
 
-    if not shopping_list:
-        raise NotFoundError('Einkaufsliste nicht gefunden')
+    # Polling clients send back the last ETag; every item change bumps the
+    # list's updated_at, so unchanged lists are answered without loading items
+    etag = compute_etag(shopping_list.id, shopping_list.updated_at.isoformat())
+    response = not_modified(etag)
+    if response is not None:
+        return response
 
-    items = ShoppingListItem.active().filter_by(shopping_list_id=list_id).order_by(ShoppingListItem.order_index.desc()).all()
+    items = ShoppingListItem.active_rows(list_id)
 
     items_data = [
         {
@@ -68,7 +86,7 @@ def get_items(list_id: int):
         for item in items
     ]
 
-    return success_response(data=items_data)
+    return with_etag(success_response(data=items_data), etag)
 
 
 @v1_bp.route('/lists/<int:list_id>/items', methods=['POST'])
@@ -95,17 +113,13 @@ def create_item(list_id: int):
         403: Forbidden
         404: List not found
     """
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first()
-
-    if not shopping_list:
-        raise NotFoundError('Einkaufsliste nicht gefunden')
+    shopping_list = g.shopping_list
 
     data = request.get_json()
 
     # Validate request data
-    schema = ShoppingListItemCreateSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _item_create_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -114,18 +128,13 @@ def create_item(list_id: int):
             details=err.messages
         )
 
-    # Get the highest order_index and add 1 (only from active items)
-    max_order = db.session.query(db.func.max(ShoppingListItem.order_index)).filter(
-        ShoppingListItem.shopping_list_id == list_id,
-        ShoppingListItem.deleted_at.is_(None)
-    ).scalar() or 0
-
     # Create new item
     item = ShoppingListItem(
         shopping_list_id=list_id,
         name=validated_data['name'],
         quantity=validated_data.get('quantity', '1'),
-        order_index=max_order + 1
+        # Highest active order_index + 1, computed within the INSERT
+        order_index=ShoppingListItem.next_order_index(list_id)
     )
 
     db.session.add(item)
@@ -134,8 +143,9 @@ def create_item(list_id: int):
 
     user = get_current_user()
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat via API Artikel '
-        f'"{item.name}" (ID: {item.id}) zu Liste {list_id} hinzugefügt'
+        'Benutzer "%s" (ID: %s) hat via API Artikel '
+        '"%s" (ID: %s) zu Liste %s hinzugefügt',
+        user.username, user.id, item.name, item.id, list_id
     )
 
     item_data = {
@@ -157,6 +167,7 @@ def create_item(list_id: int):
 
 @v1_bp.route('/items/<int:item_id>', methods=['GET'])
 @jwt_required()
+@item_access_required(allow_shared=True)
 def get_item(item_id: int):
     """
     Get a specific item.
@@ -170,21 +181,8 @@ def get_item(item_id: int):
         403: Forbidden
         404: Item not found
     """
-    item = ShoppingListItem.active().filter_by(id=item_id).first()
-
-    if not item:
-        raise NotFoundError('Artikel nicht gefunden')
-
-    shopping_list = item.shopping_list
-    user = get_current_user()
-
-    # Check access permissions
-    is_owner = shopping_list.user_id == user.id
-    is_admin = user.is_admin
-    is_shared = shopping_list.is_shared
-
-    if not (is_owner or is_admin or is_shared):
-        raise ForbiddenError('Zugriff auf diesen Artikel nicht erlaubt')
+    item = g.item
+    shopping_list = g.shopping_list
 
     item_data = {
         'id': item.id,
@@ -204,6 +202,7 @@ def get_item(item_id: int):
 @v1_bp.route('/items/<int:item_id>', methods=['PUT'])
 @jwt_required()
 @limiter.limit("30 per minute")
+@item_access_required(allow_shared=True)
 def update_item(item_id: int):
     """
     Update a shopping list item.
@@ -225,28 +224,14 @@ def update_item(item_id: int):
         403: Forbidden
         404: Item not found
     """
-    item = ShoppingListItem.active().filter_by(id=item_id).first()
-
-    if not item:
-        raise NotFoundError('Artikel nicht gefunden')
-
-    shopping_list = item.shopping_list
-    user = get_current_user()
-
-    # Check access permissions
-    is_owner = shopping_list.user_id == user.id
-    is_admin = user.is_admin
-    is_shared = shopping_list.is_shared
-
-    if not (is_owner or is_admin or is_shared):
-        raise ForbiddenError('Zugriff auf diesen Artikel nicht erlaubt')
+    item = g.item
+    shopping_list = g.shopping_list
 
     data = request.get_json()
 
     # Validate request data
-    schema = ShoppingListItemUpdateSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _item_update_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -276,8 +261,9 @@ def update_item(item_id: int):
 
     user = get_current_user()
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat via API Artikel '
-        f'{item_id} aktualisiert (Version: {item.version})'
+        'Benutzer "%s" (ID: %s) hat via API Artikel '
+        '%s aktualisiert (Version: %s)',
+        user.username, user.id, item_id, item.version
     )
 
     item_data = {
@@ -299,6 +285,7 @@ def update_item(item_id: int):
 @v1_bp.route('/items/<int:item_id>', methods=['DELETE'])
 @jwt_required()
 @limiter.limit("30 per minute")
+@item_access_required(allow_shared=True)
 def delete_item(item_id: int):
     """
     Soft delete a shopping list item (move to trash).
@@ -312,22 +299,10 @@ def delete_item(item_id: int):
         403: Forbidden
         404: Item not found
     """
-    item = ShoppingListItem.active().filter_by(id=item_id).first()
-
-    if not item:
-        raise NotFoundError('Artikel nicht gefunden')
-
-    shopping_list = item.shopping_list
+    item = g.item
+    shopping_list = g.shopping_list
     user = get_current_user()
 
-    # Check access permissions
-    is_owner = shopping_list.user_id == user.id
-    is_admin = user.is_admin
-    is_shared = shopping_list.is_shared
-
-    if not (is_owner or is_admin or is_shared):
-        raise ForbiddenError('Zugriff auf diesen Artikel nicht erlaubt')
-
     item_name = item.name
 
     item.soft_delete()
@@ -335,8 +310,9 @@ def delete_item(item_id: int):
     db.session.commit()
 
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat via API Artikel '
-        f'"{item_name}" (ID: {item_id}) in den Papierkorb verschoben'
+        'Benutzer "%s" (ID: %s) hat via API Artikel '
+        '"%s" (ID: %s) in den Papierkorb verschoben',
+        user.username, user.id, item_name, item_id
     )
 
     return success_response(
@@ -350,6 +326,7 @@ def delete_item(item_id: int):
 
 @v1_bp.route('/items/<int:item_id>/toggle', methods=['POST'])
 @jwt_required()
+@item_access_required(allow_shared=True)
 def toggle_item(item_id: int):
     """
     Toggle the checked status of an item.
@@ -363,52 +340,50 @@ def toggle_item(item_id: int):
         403: Forbidden
         404: Item not found
     """
-    item = ShoppingListItem.active().filter_by(id=item_id).first()
-
-    if not item:
-        raise NotFoundError('Artikel nicht gefunden')
-
-    shopping_list = item.shopping_list
-    user = get_current_user()
-
-    # Check access permissions
-    is_owner = shopping_list.user_id == user.id
-    is_admin = user.is_admin
-    is_shared = shopping_list.is_shared
-
-    if not (is_owner or is_admin or is_shared):
-        raise ForbiddenError('Zugriff auf diesen Artikel nicht erlaubt')
+    item = g.item
+    shopping_list = g.shopping_list
 
-    # Toggle checked status
-    item.is_checked = not item.is_checked
+    # Toggle checked status; keep the values for the response, since the
+    # commit expires the item and reading it again would reload the row
+    is_checked = not item.is_checked
+    item_name = item.name
+    item.is_checked = is_checked
     shopping_list.updated_at = datetime.now(timezone.utc)
     db.session.commit()
 
-    status_text = 'abgehakt' if item.is_checked else 'nicht abgehakt'
+    status_text = 'abgehakt' if is_checked else 'nicht abgehakt'
 
     return success_response(
         data={
-            'id': item.id,
-            'is_checked': item.is_checked
+            'id': item_id,
+            'is_checked': is_checked
         },
-        message=f'Artikel "{item.name}" {status_text}'
+        message=f'Artikel "{item_name}" {status_text}'
     )
 
 
 @v1_bp.route('/items/<int:item_id>/reorder', methods=['PUT'])
 @jwt_required()
+@item_access_required(
+    allow_shared=False,
+    forbidden_message='Nur der Besitzer kann die Reihenfolge ändern'
+)
 def reorder_item(item_id: int):
     """
     Change the order index of an item.
 
-    This allows for custom sorting of items in the list.
+    This allows for custom sorting of items in the list. Either set the
+    index directly or pass the neighbours the item was dropped between;
+    the latter only updates this item in the common case.
 
     Path Parameters:
         item_id (int): Item ID
 
     Request Body:
         {
-            "order_index": integer
+            "order_index": integer (optional),
+            "before_id": integer (optional, item shown directly above),
+            "after_id": integer (optional, item shown directly below)
         }
 
     Returns:
@@ -418,27 +393,14 @@ def reorder_item(item_id: int):
         403: Forbidden
         404: Item not found
     """
-    item = ShoppingListItem.active().filter_by(id=item_id).first()
-
-    if not item:
-        raise NotFoundError('Artikel nicht gefunden')
-
-    shopping_list = item.shopping_list
-    user = get_current_user()
-
-    # Check access permissions (only owner or admin can reorder)
-    is_owner = shopping_list.user_id == user.id
-    is_admin = user.is_admin
-
-    if not (is_owner or is_admin):
-        raise ForbiddenError('Nur der Besitzer kann die Reihenfolge ändern')
+    item = g.item
+    shopping_list = g.shopping_list
 
     data = request.get_json()
 
     # Validate request data
-    schema = ShoppingListItemReorderSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _item_reorder_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -447,15 +409,41 @@ def reorder_item(item_id: int):
             details=err.messages
         )
 
-    # Update order index
-    item.order_index = validated_data['order_index']
+    if 'order_index' in validated_data:
+        item.order_index = validated_data['order_index']
+    else:
+        neighbours = []
+        for key in ('before_id', 'after_id'):
+            neighbour_id = validated_data.get(key)
+            neighbour = None
+
+            if neighbour_id is not None:
+                neighbour = db.session.get(ShoppingListItem, neighbour_id)
+
+                if (not neighbour or neighbour.is_deleted or neighbour.id == item.id
+                        or neighbour.shopping_list_id != shopping_list.id):
+                    raise NotFoundError('Nachbarartikel nicht gefunden')
+
+            neighbours.append(neighbour)
+
+        try:
+            item.move_between(*neighbours)
+        except ValueError:
+            return error_response(
+                status_code=400,
+                message='Validierungsfehler',
+                error_code=ErrorCodes.VALIDATION_ERROR,
+                details={'before_id': ['Muss oberhalb von after_id stehen']}
+            )
+
+    order_index = item.order_index
     shopping_list.updated_at = datetime.now(timezone.utc)
     db.session.commit()
 
     return success_response(
         data={
-            'id': item.id,
-            'order_index': item.order_index
+            'id': item_id,
+            'order_index': order_index
         },
         message='Reihenfolge erfolgreich geändert'
     )
@@ -465,6 +453,60 @@ def reorder_item(item_id: int):
 # Bulk Operations
 # ============================================================================
 
+@v1_bp.route('/lists/<int:list_id>/items/reorder-bulk', methods=['POST'])
+@jwt_required()
+@list_access_required(allow_shared=False)
+def reorder_items_bulk(list_id: int):
+    """
+    Change the order index of several items at once.
+
+    Drag-and-drop usually moves more than one item; all new indexes are
+    written with a single UPDATE instead of one request per item.
+
+    Path Parameters:
+        list_id (int): Shopping list ID
+
+    Request Body:
+        {
+            "items": [{"id": integer, "order_index": integer}, ...]
+        }
+
+    Returns:
+        200: Items reordered successfully
+        400: Validation error
+        401: Unauthorized
+        403: Forbidden
+        404: List or one of the items not found
+    """
+    shopping_list = g.shopping_list
+
+    data = request.get_json()
+
+    # Validate request data
+    try:
+        validated_data = _item_bulk_reorder_schema.load(data)
+    except ValidationError as err:
+        return error_response(
+            status_code=400,
+            message='Validierungsfehler',
+            error_code=ErrorCodes.VALIDATION_ERROR,
+            details=err.messages
+        )
+
+    order_by_id = {entry['id']: entry['order_index'] for entry in validated_data['items']}
+
+    if not ShoppingListItem.bulk_set(list_id, 'order_index', order_by_id):
+        raise NotFoundError('Artikel nicht gefunden')
+
+    shopping_list.updated_at = datetime.now(timezone.utc)
+    db.session.commit()
+
+    return success_response(
+        data={'updated_count': len(order_by_id)},
+        message='Reihenfolge erfolgreich geändert'
+    )
+
+
 @v1_bp.route('/lists/<int:list_id>/items/clear-checked', methods=['POST'])
 @jwt_required()
 @list_access_required(allow_shared=False)
@@ -483,22 +525,25 @@ def clear_checked_items(list_id: int):
         403: Forbidden
         404: List not found
     """
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first()
-
-    if not shopping_list:
-        raise NotFoundError('Einkaufsliste nicht gefunden')
-
-    # Soft delete all checked items
-    checked_items = ShoppingListItem.active().filter_by(
-        shopping_list_id=list_id,
-        is_checked=True
-    ).all()
-
-    for item in checked_items:
-        item.soft_delete()
+    shopping_list = g.shopping_list
+
+    now = datetime.now(timezone.utc)
+
+    # Soft delete all checked items with a single UPDATE instead of loading them;
+    # the commit below expires the session, so no in-memory synchronization needed
+    result = db.session.execute(
+        update(ShoppingListItem)
+        .where(
+            ShoppingListItem.shopping_list_id == list_id,
+            ShoppingListItem.is_checked.is_(True),
+            ShoppingListItem.deleted_at.is_(None)
+        )
+        .values(deleted_at=now)
+        .execution_options(synchronize_session=False)
+    )
 
-    deleted_count = len(checked_items)
-    shopping_list.updated_at = datetime.now(timezone.utc)
+    deleted_count = result.rowcount
+    shopping_list.updated_at = now
     db.session.commit()
 
     return success_response(
@@ -517,16 +562,50 @@ def get_trash_items():
     """
     Get all deleted items for the current user (trash).
 
+    Query Parameters:
+        page (int): Page number (default: 1)
+        per_page (int): Items per page (default: 20, max: 100)
+
+    Headers:
+        If-None-Match: ETag from a previous response (optional)
+
     Returns:
-        200: List of deleted items
+        200: Paginated list of deleted items
+        304: Trash unchanged since the given ETag
         401: Unauthorized
     """
     user = get_current_user()
 
-    # Get all deleted items from user's lists
-    deleted_items = ShoppingListItem.deleted().join(ShoppingList).filter(
+    page = request.args.get('page', 1, type=int)
+    per_page = min(request.args.get('per_page', 20, type=int), 100)
+
+    # Deleting or restoring an item bumps its list's updated_at, purging
+    # changes the count; list titles are covered by updated_at too
+    item_count, latest_delete, latest_update = db.session.query(
+        db.func.count(ShoppingListItem.id),
+        db.func.max(ShoppingListItem.deleted_at),
+        db.func.max(ShoppingList.updated_at)
+    ).join(ShoppingListItem.shopping_list).filter(
+        ShoppingListItem.deleted_at.isnot(None),
+        ShoppingList.user_id == user.id
+    ).one()
+
+    etag = compute_etag(user.id, item_count, latest_delete, latest_update, page, per_page)
+    response = not_modified(etag)
+    if response is not None:
+        return response
+
+    # Get deleted items from user's lists; the join also fills item.shopping_list
+    # (only its title is serialized)
+    pagination = ShoppingListItem.deleted().join(ShoppingListItem.shopping_list).options(
+        contains_eager(ShoppingListItem.shopping_list).load_only(ShoppingList.title)
+    ).filter(
         ShoppingList.user_id == user.id
-    ).order_by(ShoppingListItem.deleted_at.desc()).all()
+    ).order_by(ShoppingListItem.deleted_at.desc()).paginate(
+        page=page,
+        per_page=per_page,
+        error_out=False
+    )
 
     items_data = [
         {
@@ -538,13 +617,13 @@ def get_trash_items():
             'version': item.version,
             'created_at': item.created_at.isoformat(),
             'deleted_at': item.deleted_at.isoformat(),
-            'list_id': item.shopping_list.id,
+            'list_id': item.shopping_list_id,
             'list_title': item.shopping_list.title
         }
-        for item in deleted_items
+        for item in pagination.items
     ]
 
-    return success_response(data=items_data)
+    return with_etag(paginated_response(items_data, pagination), etag)
 
 
 @v1_bp.route('/items/<int:item_id>/restore', methods=['POST'])
@@ -563,7 +642,9 @@ def restore_item(item_id: int):
         403: Forbidden
         404: Item not found
     """
-    item = ShoppingListItem.deleted().filter_by(id=item_id).first()
+    item = ShoppingListItem.deleted().options(
+        joinedload(ShoppingListItem.shopping_list)
+    ).filter_by(id=item_id).first()
 
     if not item:
         raise NotFoundError('Artikel nicht im Papierkorb gefunden')
@@ -584,8 +665,9 @@ def restore_item(item_id: int):
     db.session.commit()
 
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat via API Artikel '
-        f'"{item_name}" (ID: {item_id}) aus dem Papierkorb wiederhergestellt'
+        'Benutzer "%s" (ID: %s) hat via API Artikel '
+        '"%s" (ID: %s) aus dem Papierkorb wiederhergestellt',
+        user.username, user.id, item_name, item_id
     )
 
     return success_response(
@@ -5,14 +5,15 @@ Handles all operations related to shopping lists.
 """
 
 from datetime import datetime, timezone
-from flask import request, current_app
+from flask import g, request, current_app
 from flask_jwt_extended import jwt_required
 from marshmallow import ValidationError
-from sqlalchemy import desc
+from sqlalchemy import desc, select
+from sqlalchemy.orm import load_only, selectinload
 
 from . import v1_bp
 from ...extensions import db, limiter
-from ...models import ShoppingList, ShoppingListItem
+from ...models import ShoppingList, ShoppingListItem, User
 from ..schemas import (
     ShoppingListSchema,
     ShoppingListDetailSchema,
@@ -24,17 +25,51 @@ from ..errors import (
     error_response,
     success_response,
     paginated_response,
+    cursor_response,
     NotFoundError,
     ForbiddenError,
     ErrorCodes
 )
+from ..conditional import compute_etag, not_modified, with_etag
+from ..pagination import keyset_paginate
 from ..decorators import get_current_user, list_owner_or_admin_required, list_access_required
 
+_list_create_schema = ShoppingListCreateSchema()
+_list_update_schema = ShoppingListUpdateSchema()
+_share_schema = ShareListSchema()
+
 
 # ============================================================================
 # Shopping Lists CRUD
 # ============================================================================
 
+def _serialize_list(shopping_list: ShoppingList, owner_username: str, **extra) -> dict:
+    """
+    Serialize the fields shared by all shopping list responses.
+
+    Args:
+        shopping_list: The shopping list
+        owner_username: Username of the owner; passed in so callers that
+            already know it don't go through the owner relationship
+        **extra: Endpoint-specific fields (item_count, items, deleted_at)
+
+    Returns:
+        dict: Serialized list data
+    """
+    return {
+        'id': shopping_list.id,
+        'guid': shopping_list.guid,
+        'title': shopping_list.title,
+        'is_shared': shopping_list.is_shared,
+        'owner_id': shopping_list.user_id,
+        'owner_username': owner_username,
+        'version': shopping_list.version,
+        'created_at': shopping_list.created_at.isoformat(),
+        'updated_at': shopping_list.updated_at.isoformat(),
+        **extra
+    }
+
+
 @v1_bp.route('/lists', methods=['GET'])
 @jwt_required()
 def get_lists():
@@ -44,41 +79,82 @@ def get_lists():
     Query Parameters:
         page (int): Page number (default: 1)
         per_page (int): Items per page (default: 20, max: 100)
+        cursor (str): Use keyset pagination instead of page numbers; empty
+            for the first page, then ``next_cursor`` of the previous response
+
+    Headers:
+        If-None-Match: ETag from a previous response (optional)
 
     Returns:
         200: Paginated list of shopping lists
+        304: Lists unchanged since the given ETag
+        400: Invalid cursor
         401: Unauthorized
     """
     user = get_current_user()
 
     page = request.args.get('page', 1, type=int)
     per_page = min(request.args.get('per_page', 20, type=int), 100)
-
-    pagination = ShoppingList.active().filter_by(user_id=user.id).order_by(desc(ShoppingList.updated_at)).paginate(
-        page=page,
-        per_page=per_page,
-        error_out=False
+    cursor = request.args.get('cursor')
+
+    # Every list and item change bumps a list's updated_at; together with the
+    # number of lists this identifies the state of the overview
+    latest_update, list_count = db.session.query(
+        db.func.max(ShoppingList.updated_at),
+        db.func.count(ShoppingList.id)
+    ).filter(
+        ShoppingList.user_id == user.id,
+        ShoppingList.deleted_at.is_(None)
+    ).one()
+
+    etag = compute_etag(user.id, user.username, latest_update, list_count, page, per_page, cursor)
+    response = not_modified(etag)
+    if response is not None:
+        return response
+
+    # Fetch the page together with the active item counts in one statement
+    counts = ShoppingListItem.count_by_list()
+    query = db.session.query(
+        ShoppingList,
+        db.func.coalesce(counts.c.item_count, 0)
+    ).outerjoin(
+        counts, counts.c.shopping_list_id == ShoppingList.id
+    ).filter(
+        ShoppingList.user_id == user.id,
+        ShoppingList.deleted_at.is_(None)
+    ).options(
+        # deleted_at is known to be NULL here, skip it
+        load_only(
+            ShoppingList.id, ShoppingList.guid, ShoppingList.title,
+            ShoppingList.is_shared, ShoppingList.user_id, ShoppingList.version,
+            ShoppingList.created_at, ShoppingList.updated_at
+        )
     )
 
-    # Serialize lists with item count (only active items)
-    lists_data = []
-    for shopping_list in pagination.items:
-        item_count = ShoppingListItem.active().filter_by(shopping_list_id=shopping_list.id).count()
-        list_data = {
-            'id': shopping_list.id,
-            'guid': shopping_list.guid,
-            'title': shopping_list.title,
-            'is_shared': shopping_list.is_shared,
-            'owner_id': shopping_list.user_id,
-            'owner_username': shopping_list.owner.username,
-            'version': shopping_list.version,
-            'created_at': shopping_list.created_at.isoformat(),
-            'updated_at': shopping_list.updated_at.isoformat(),
-            'item_count': item_count
-        }
-        lists_data.append(list_data)
+    if cursor is not None:
+        rows, next_cursor = keyset_paginate(query, ShoppingList, cursor, per_page)
+    else:
+        # The ETag query above already counted the lists; skip paginate()'s COUNT
+        pagination = query.order_by(desc(ShoppingList.updated_at)).paginate(
+            page=page,
+            per_page=per_page,
+            error_out=False,
+            count=False
+        )
+        pagination.total = list_count
+        rows = pagination.items
 
-    return paginated_response(lists_data, pagination)
+    # Serialize lists with item count (only active items); all lists belong
+    # to the current user, so the owner needs no per-row lookup
+    lists_data = [
+        _serialize_list(shopping_list, user.username, item_count=item_count)
+        for shopping_list, item_count in rows
+    ]
+
+    if cursor is not None:
+        return with_etag(cursor_response(lists_data, next_cursor, per_page), etag)
+
+    return with_etag(paginated_response(lists_data, pagination), etag)
 
 
 @v1_bp.route('/lists/<int:list_id>', methods=['GET'])
@@ -91,30 +167,31 @@ def get_list(list_id: int):
     Path Parameters:
         list_id (int): Shopping list ID
 
+    Headers:
+        If-None-Match: ETag from a previous response (optional)
+
     Returns:
         200: Shopping list with items
+        304: List unchanged since the given ETag
         401: Unauthorized
         403: Forbidden
         404: List not found
     """
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first()
+    shopping_list = g.shopping_list
 
-    if not shopping_list:
-        raise NotFoundError('Einkaufsliste nicht gefunden')
+    # Item changes bump the list's updated_at as well
+    etag = compute_etag(
+        shopping_list.id, shopping_list.updated_at.isoformat(), shopping_list.owner.username
+    )
+    response = not_modified(etag)
+    if response is not None:
+        return response
 
-    items = ShoppingListItem.active().filter_by(shopping_list_id=shopping_list.id).order_by(ShoppingListItem.order_index.desc()).all()
+    items = ShoppingListItem.active_rows(shopping_list.id)
 
-    list_data = {
-        'id': shopping_list.id,
-        'guid': shopping_list.guid,
-        'title': shopping_list.title,
-        'is_shared': shopping_list.is_shared,
-        'owner_id': shopping_list.user_id,
-        'owner_username': shopping_list.owner.username,
-        'version': shopping_list.version,
-        'created_at': shopping_list.created_at.isoformat(),
-        'updated_at': shopping_list.updated_at.isoformat(),
-        'items': [
+    list_data = _serialize_list(
+        shopping_list, shopping_list.owner.username,
+        items=[
             {
                 'id': item.id,
                 'name': item.name,
@@ -126,9 +203,9 @@ def get_list(list_id: int):
             }
             for item in items
         ]
-    }
+    )
 
-    return success_response(data=list_data)
+    return with_etag(success_response(data=list_data), etag)
 
 
 @v1_bp.route('/lists', methods=['POST'])
@@ -153,9 +230,8 @@ def create_list():
     data = request.get_json()
 
     # Validate request data
-    schema = ShoppingListCreateSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _list_create_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -165,6 +241,7 @@ def create_list():
         )
 
     # Create new shopping list
+    username = user.username
     shopping_list = ShoppingList(
         title=validated_data['title'],
         user_id=user.id,
@@ -175,22 +252,13 @@ def create_list():
     db.session.commit()
 
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat via API Liste '
-        f'"{shopping_list.title}" (ID: {shopping_list.id}) erstellt'
+        'Benutzer "%s" (ID: %s) hat via API Liste '
+        '"%s" (ID: %s) erstellt',
+        username, shopping_list.user_id, shopping_list.title, shopping_list.id
     )
 
-    list_data = {
-        'id': shopping_list.id,
-        'guid': shopping_list.guid,
-        'title': shopping_list.title,
-        'is_shared': shopping_list.is_shared,
-        'owner_id': shopping_list.user_id,
-        'owner_username': shopping_list.owner.username,
-        'version': shopping_list.version,
-        'created_at': shopping_list.created_at.isoformat(),
-        'updated_at': shopping_list.updated_at.isoformat(),
-        'item_count': 0
-    }
+    # The creator is the owner, no need to load the relationship after commit
+    list_data = _serialize_list(shopping_list, username, item_count=0)
 
     return success_response(
         data=list_data,
@@ -223,17 +291,17 @@ def update_list(list_id: int):
         403: Forbidden
         404: List not found
     """
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first()
+    user = get_current_user()
+    shopping_list = g.shopping_list
 
-    if not shopping_list:
+    if shopping_list.is_deleted:
         raise NotFoundError('Einkaufsliste nicht gefunden')
 
     data = request.get_json()
 
     # Validate request data
-    schema = ShoppingListUpdateSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _list_update_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -246,47 +314,57 @@ def update_list(list_id: int):
     if 'version' in validated_data:
         shopping_list.check_version(validated_data['version'])
 
+    # Only fields whose value differs count as a change; a repeated request
+    # leaves version and updated_at (and with them the ETags) untouched
+    changes = {
+        field: validated_data[field]
+        for field in ('title', 'is_shared')
+        if field in validated_data and getattr(shopping_list, field) != validated_data[field]
+    }
+
     # Update fields
-    if 'title' in validated_data:
-        shopping_list.title = validated_data['title']
+    if 'title' in changes:
+        shopping_list.title = changes['title']
 
-    if 'is_shared' in validated_data:
-        # If is_shared status changes, regenerate GUID
+    if 'is_shared' in changes:
+        # Sharing status changes, so regenerate GUID
         # This invalidates the old sharing URL for security
-        if shopping_list.is_shared != validated_data['is_shared']:
-            import uuid
-            shopping_list.guid = str(uuid.uuid4())
-            current_app.logger.info(
-                f'GUID regenerated for list {list_id} due to sharing status change '
-                f'(was_shared: {shopping_list.is_shared}, now_shared: {validated_data["is_shared"]})'
-            )
+        shopping_list.regenerate_guid()
+        current_app.logger.info(
+            'GUID regenerated for list %s due to sharing status change '
+            '(was_shared: %s, now_shared: %s)',
+            list_id, shopping_list.is_shared, changes['is_shared']
+        )
 
-        shopping_list.is_shared = validated_data['is_shared']
+        shopping_list.is_shared = changes['is_shared']
 
-    # Increment version after successful update
-    shopping_list.increment_version()
-    shopping_list.updated_at = datetime.now(timezone.utc)
-    db.session.commit()
+    # Capture names before commit() expires the loaded objects; the owner
+    # relationship is only needed when an admin edits someone else's list
+    user_id, username = user.id, user.username
+    owner_username = username if user_id == shopping_list.user_id else shopping_list.owner.username
+
+    if changes:
+        # Increment version after successful update
+        # The version bump dirties the row, so the column's onupdate stamps updated_at
+        shopping_list.increment_version()
+        db.session.commit()
+
+    # Reload the expired list and count its items in the same statement
+    item_count_query = select(db.func.count(ShoppingListItem.id)).where(
+        ShoppingListItem.shopping_list_id == ShoppingList.id,
+        ShoppingListItem.deleted_at.is_(None)
+    ).scalar_subquery()
+    shopping_list, item_count = db.session.query(
+        ShoppingList, item_count_query
+    ).filter(ShoppingList.id == list_id).one()
 
-    user = get_current_user()
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat via API Liste '
-        f'{list_id} aktualisiert (Version: {shopping_list.version})'
+        'Benutzer "%s" (ID: %s) hat via API Liste '
+        '%s aktualisiert (Version: %s)',
+        username, user_id, list_id, shopping_list.version
     )
 
-    item_count = ShoppingListItem.active().filter_by(shopping_list_id=shopping_list.id).count()
-    list_data = {
-        'id': shopping_list.id,
-        'guid': shopping_list.guid,
-        'title': shopping_list.title,
-        'is_shared': shopping_list.is_shared,
-        'owner_id': shopping_list.user_id,
-        'owner_username': shopping_list.owner.username,
-        'version': shopping_list.version,
-        'created_at': shopping_list.created_at.isoformat(),
-        'updated_at': shopping_list.updated_at.isoformat(),
-        'item_count': item_count
-    }
+    list_data = _serialize_list(shopping_list, owner_username, item_count=item_count)
 
     return success_response(
         data=list_data,
@@ -313,21 +391,22 @@ def delete_list(list_id: int):
         403: Forbidden
         404: List not found
     """
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first()
+    shopping_list = g.shopping_list
 
-    if not shopping_list:
+    if shopping_list.is_deleted:
         raise NotFoundError('Einkaufsliste nicht gefunden')
 
     title = shopping_list.title
     user = get_current_user()
-    item_count = ShoppingListItem.active().filter_by(shopping_list_id=list_id).count()
 
-    shopping_list.soft_delete()
+    # The cascading UPDATE reports how many items went to the trash
+    item_count = shopping_list.soft_delete()
     db.session.commit()
 
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat via API Liste '
-        f'"{title}" (ID: {list_id}) mit {item_count} Artikeln in den Papierkorb verschoben'
+        'Benutzer "%s" (ID: %s) hat via API Liste '
+        '"%s" (ID: %s) mit %s Artikeln in den Papierkorb verschoben',
+        user.username, user.id, title, list_id, item_count
     )
 
     return success_response(
@@ -361,17 +440,16 @@ def toggle_share_list(list_id: int):
         403: Forbidden
         404: List not found
     """
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first()
+    shopping_list = g.shopping_list
 
-    if not shopping_list:
+    if shopping_list.is_deleted:
         raise NotFoundError('Einkaufsliste nicht gefunden')
 
     data = request.get_json()
 
     # Validate request data
-    schema = ShareListSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _share_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -380,15 +458,17 @@ def toggle_share_list(list_id: int):
             details=err.messages
         )
 
-    # If changing from shared to private, regenerate GUID
-    # This invalidates the old sharing URL
-    if shopping_list.is_shared and not validated_data['is_shared']:
-        import uuid
-        shopping_list.guid = str(uuid.uuid4())
+    # Nothing to write if the list already has the requested status; this
+    # keeps updated_at (and the ETags derived from it) unchanged
+    if shopping_list.is_shared != validated_data['is_shared']:
+        # If changing from shared to private, regenerate GUID
+        # This invalidates the old sharing URL
+        if shopping_list.is_shared:
+            shopping_list.regenerate_guid()
 
-    shopping_list.is_shared = validated_data['is_shared']
-    shopping_list.updated_at = datetime.now(timezone.utc)
-    db.session.commit()
+        shopping_list.is_shared = validated_data['is_shared']
+        shopping_list.updated_at = datetime.now(timezone.utc)
+        db.session.commit()
 
     message = 'Liste ist jetzt geteilt' if shopping_list.is_shared else 'Liste ist jetzt privat'
 
@@ -417,25 +497,29 @@ def get_share_url(list_id: int):
         403: Forbidden
         404: List not found
     """
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first()
+    shopping_list = g.shopping_list
 
-    if not shopping_list:
+    if shopping_list.is_deleted:
         raise NotFoundError('Einkaufsliste nicht gefunden')
 
     # Generate share URL
     # Note: In production, you might want to use url_for with _external=True
     # For API, we return the GUID and let the client construct the URL
-    api_url = f"/api/v1/shared/{shopping_list.guid}"
-    web_url = f"/shared/{shopping_list.guid}"  # For web frontend
+    guid = shopping_list.guid
+    api_url = f"/api/v1/shared/{guid}"
+    web_url = f"/shared/{guid}"  # For web frontend
+
+    # host_url is rebuilt from the WSGI environ on every access
+    base_url = request.host_url.rstrip('/')
 
     return success_response(
         data={
-            'guid': shopping_list.guid,
+            'guid': guid,
             'is_shared': shopping_list.is_shared,
             'api_url': api_url,
             'web_url': web_url,
-            'full_api_url': request.host_url.rstrip('/') + api_url,
-            'full_web_url': request.host_url.rstrip('/') + web_url
+            'full_api_url': base_url + api_url,
+            'full_web_url': base_url + web_url
         }
     )
 
@@ -455,8 +539,12 @@ def get_trash_lists():
         page (int): Page number (default: 1)
         per_page (int): Items per page (default: 20, max: 100)
 
+    Headers:
+        If-None-Match: ETag from a previous response (optional, own trash only)
+
     Returns:
         200: Paginated list of deleted shopping lists
+        304: Trash unchanged since the given ETag
         401: Unauthorized
     """
     user = get_current_user()
@@ -464,38 +552,64 @@ def get_trash_lists():
     page = request.args.get('page', 1, type=int)
     per_page = min(request.args.get('per_page', 20, type=int), 100)
 
+    # Moving a list in or out of the trash bumps its updated_at, purging it
+    # changes the count. Admins also see other owners' names, which this
+    # does not cover, so their view is not cached.
+    etag = None
+    if not user.is_admin:
+        latest_update, list_count = db.session.query(
+            db.func.max(ShoppingList.updated_at),
+            db.func.count(ShoppingList.id)
+        ).filter(
+            ShoppingList.user_id == user.id,
+            ShoppingList.deleted_at.isnot(None)
+        ).one()
+
+        etag = compute_etag(user.id, user.username, latest_update, list_count, page, per_page)
+        response = not_modified(etag)
+        if response is not None:
+            return response
+
+    # Items of a trashed list are soft-deleted with it, so count all of them
+    counts = ShoppingListItem.count_by_list(include_deleted=True)
+    query = db.session.query(
+        ShoppingList,
+        db.func.coalesce(counts.c.item_count, 0)
+    ).outerjoin(
+        counts, counts.c.shopping_list_id == ShoppingList.id
+    ).filter(
+        ShoppingList.deleted_at.isnot(None)
+    ).options(
+        # Admins see lists of many users; load all owners in one IN query
+        selectinload(ShoppingList.owner).load_only(User.username)
+    )
+
     # Bug Fix #3: Admin can see all trash lists, regular users only their own
-    if user.is_admin:
-        query = ShoppingList.deleted()
-    else:
-        query = ShoppingList.deleted().filter_by(user_id=user.id)
+    if not user.is_admin:
+        query = query.filter(ShoppingList.user_id == user.id)
 
+    # Users' own trash was already counted for the ETag; skip paginate()'s COUNT
     pagination = query.order_by(desc(ShoppingList.deleted_at)).paginate(
         page=page,
         per_page=per_page,
-        error_out=False
+        error_out=False,
+        count=user.is_admin
     )
+    if not user.is_admin:
+        pagination.total = list_count
 
     # Serialize lists with item count
-    lists_data = []
-    for shopping_list in pagination.items:
-        item_count = shopping_list.items.count()
-        list_data = {
-            'id': shopping_list.id,
-            'guid': shopping_list.guid,
-            'title': shopping_list.title,
-            'is_shared': shopping_list.is_shared,
-            'owner_id': shopping_list.user_id,
-            'owner_username': shopping_list.owner.username,
-            'version': shopping_list.version,
-            'created_at': shopping_list.created_at.isoformat(),
-            'updated_at': shopping_list.updated_at.isoformat(),
-            'deleted_at': shopping_list.deleted_at.isoformat(),
-            'item_count': item_count
-        }
-        lists_data.append(list_data)
+    lists_data = [
+        _serialize_list(
+            shopping_list, shopping_list.owner.username,
+            deleted_at=shopping_list.deleted_at.isoformat(),
+            item_count=item_count
+        )
+        for shopping_list, item_count in pagination.items
+    ]
 
-    return paginated_response(lists_data, pagination)
+    result = paginated_response(lists_data, pagination)
+    return with_etag(result, etag) if etag else result
 
 
 @v1_bp.route('/lists/<int:list_id>/restore', methods=['POST'])
@@ -517,9 +631,9 @@ def restore_list(list_id: int):
         403: Forbidden
         404: List not found
     """
-    shopping_list = ShoppingList.deleted().filter_by(id=list_id).first()
+    shopping_list = g.shopping_list
 
-    if not shopping_list:
+    if not shopping_list.is_deleted:
         raise NotFoundError('Einkaufsliste nicht im Papierkorb gefunden')
 
     title = shopping_list.title
@@ -529,8 +643,9 @@ def restore_list(list_id: int):
     db.session.commit()
 
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat via API Liste '
-        f'"{title}" (ID: {list_id}) aus dem Papierkorb wiederhergestellt'
+        'Benutzer "%s" (ID: %s) hat via API Liste '
+        '"%s" (ID: %s) aus dem Papierkorb wiederhergestellt',
+        user.username, user.id, title, list_id
     )
 
     return success_response(
@@ -562,20 +677,24 @@ def permanent_delete_list(list_id: int):
     if not user.is_admin:
         raise ForbiddenError('Nur Administratoren können Listen endgültig löschen')
 
-    shopping_list = ShoppingList.deleted().filter_by(id=list_id).first()
+    row = ShoppingList.with_item_count().filter(
+        ShoppingList.id == list_id,
+        ShoppingList.deleted_at.isnot(None)
+    ).first()
 
-    if not shopping_list:
+    if not row:
         raise NotFoundError('Einkaufsliste nicht im Papierkorb gefunden')
 
+    shopping_list, item_count = row
     title = shopping_list.title
-    item_count = shopping_list.items.count()
 
     db.session.delete(shopping_list)
     db.session.commit()
 
     current_app.logger.warning(
-        f'Admin "{user.username}" (ID: {user.id}) hat via API Liste '
-        f'"{title}" (ID: {list_id}) mit {item_count} Artikeln endgültig gelöscht'
+        'Admin "%s" (ID: %s) hat via API Liste '
+        '"%s" (ID: %s) mit %s Artikeln endgültig gelöscht',
+        user.username, user.id, title, list_id, item_count
     )
 
     return success_response(
@@ -608,9 +727,9 @@ def printer_status():
 
 @v1_bp.route('/lists/<int:list_id>/print', methods=['POST'])
 @jwt_required()
-@list_access_required
+@list_access_required(allow_shared=True)
 @limiter.limit("10 per minute")
-def print_shopping_list(list_id: int, shopping_list):
+def print_shopping_list(list_id: int):
     """
     Print a shopping list to a thermal receipt printer.
 
@@ -630,6 +749,7 @@ def print_shopping_list(list_id: int, shopping_list):
     from ...services.printer_service import get_printer_service
 
     user = get_current_user()
+    shopping_list = g.shopping_list
 
     # Get optional parameters
     data = request.get_json() or {}
@@ -654,8 +774,9 @@ def print_shopping_list(list_id: int, shopping_list):
 
     if not success:
         current_app.logger.error(
-            f'Fehler beim Drucken der Liste "{shopping_list.title}" (ID: {list_id}) '
-            f'durch Benutzer "{user.username}" (ID: {user.id}): {message}'
+            'Fehler beim Drucken der Liste "%s" (ID: %s) '
+            'durch Benutzer "%s" (ID: %s): %s',
+            shopping_list.title, list_id, user.username, user.id, message
         )
         return error_response(
             message=message,
@@ -664,9 +785,10 @@ def print_shopping_list(list_id: int, shopping_list):
         )
 
     current_app.logger.info(
-        f'Benutzer "{user.username}" (ID: {user.id}) hat via API Liste '
-        f'"{shopping_list.title}" (ID: {list_id}) gedruckt '
-        f'(include_checked: {include_checked})'
+        'Benutzer "%s" (ID: %s) hat via API Liste '
+        '"%s" (ID: %s) gedruckt '
+        '(include_checked: %s)',
+        user.username, user.id, shopping_list.title, list_id, include_checked
     )
 
     return success_response(
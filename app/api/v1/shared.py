@@ -5,15 +5,18 @@ Public endpoints for accessing shared shopping lists without authentication.
 """
 
 from flask import request
+from sqlalchemy.orm import joinedload
 
 from . import v1_bp
-from ...models import ShoppingList, ShoppingListItem
+from ...extensions import db
+from ...models import ShoppingList, ShoppingListItem, User, count_if
 from ..errors import (
     success_response,
     NotFoundError,
     ErrorCodes,
     error_response
 )
+from ..conditional import compute_etag, not_modified, with_etag
 
 
 # ============================================================================
@@ -30,12 +33,19 @@ def get_shared_list(guid: str):
     Path Parameters:
         guid (string): Shopping list GUID
 
+    Headers:
+        If-None-Match: ETag from a previous response (optional)
+
     Returns:
         200: Shopping list with items
+        304: List unchanged since the given ETag
         404: List not found or not shared
     """
-    # Bug Fix #2: Filter out soft-deleted lists using active() query
-    shopping_list = ShoppingList.active().filter_by(guid=guid).first()
+    # Bug Fix #2: Filter out soft-deleted lists using active() query;
+    # the owner's name is serialized, so fetch it with the same query
+    shopping_list = ShoppingList.active().options(
+        joinedload(ShoppingList.owner).load_only(User.username)
+    ).filter_by(guid=guid).first()
 
     if not shopping_list:
         raise NotFoundError('Einkaufsliste nicht gefunden')
@@ -48,10 +58,14 @@ def get_shared_list(guid: str):
             error_code=ErrorCodes.LIST_NOT_SHARED
         )
 
-    # Bug Fix #1: Filter out soft-deleted items using active() query
-    items = ShoppingListItem.active().filter_by(
-        shopping_list_id=shopping_list.id
-    ).order_by(ShoppingListItem.order_index.desc()).all()
+    # Item changes bump the list's updated_at as well
+    etag = compute_etag(shopping_list.id, shopping_list.updated_at.isoformat(), shopping_list.owner.username)
+    response = not_modified(etag)
+    if response is not None:
+        return response
+
+    # Bug Fix #1: Filter out soft-deleted items
+    items = ShoppingListItem.active_rows(shopping_list.id)
 
     list_data = {
         'id': shopping_list.id,
@@ -73,7 +87,7 @@ def get_shared_list(guid: str):
         ]
     }
 
-    return success_response(data=list_data)
+    return with_etag(success_response(data=list_data), etag)
 
 
 @v1_bp.route('/shared/<string:guid>/items', methods=['GET'])
@@ -84,8 +98,12 @@ def get_shared_list_items(guid: str):
     Path Parameters:
         guid (string): Shopping list GUID
 
+    Headers:
+        If-None-Match: ETag from a previous response (optional)
+
     Returns:
         200: List of items
+        304: List unchanged since the given ETag
         404: List not found or not shared
     """
     # Filter out soft-deleted lists using active() query
@@ -102,10 +120,14 @@ def get_shared_list_items(guid: str):
             error_code=ErrorCodes.LIST_NOT_SHARED
         )
 
-    # Filter out soft-deleted items using active() query
-    items = ShoppingListItem.active().filter_by(
-        shopping_list_id=shopping_list.id
-    ).order_by(ShoppingListItem.order_index.desc()).all()
+    # Item changes bump the list's updated_at as well
+    etag = compute_etag(shopping_list.id, shopping_list.updated_at.isoformat())
+    response = not_modified(etag)
+    if response is not None:
+        return response
+
+    # Filter out soft-deleted items
+    items = ShoppingListItem.active_rows(shopping_list.id)
 
     items_data = [
         {
@@ -119,7 +141,7 @@ def get_shared_list_items(guid: str):
         for item in items
     ]
 
-    return success_response(data=items_data)
+    return with_etag(success_response(data=items_data), etag)
 
 
 @v1_bp.route('/shared/<string:guid>/info', methods=['GET'])
@@ -132,12 +154,19 @@ def get_shared_list_info(guid: str):
     Path Parameters:
         guid (string): Shopping list GUID
 
+    Headers:
+        If-None-Match: ETag from a previous response (optional)
+
     Returns:
         200: List information
+        304: List unchanged since the given ETag
         404: List not found or not shared
     """
-    # Filter out soft-deleted lists using active() query
-    shopping_list = ShoppingList.active().filter_by(guid=guid).first()
+    # Filter out soft-deleted lists using active() query;
+    # the owner's name is serialized, so fetch it with the same query
+    shopping_list = ShoppingList.active().options(
+        joinedload(ShoppingList.owner).load_only(User.username)
+    ).filter_by(guid=guid).first()
 
     if not shopping_list:
         raise NotFoundError('Einkaufsliste nicht gefunden')
@@ -150,8 +179,20 @@ def get_shared_list_info(guid: str):
             error_code=ErrorCodes.LIST_NOT_SHARED
         )
 
-    # Count only active items (not soft-deleted)
-    active_items = ShoppingListItem.active().filter_by(shopping_list_id=shopping_list.id)
+    # Item changes bump the list's updated_at as well
+    etag = compute_etag(shopping_list.id, shopping_list.updated_at.isoformat(), shopping_list.owner.username)
+    response = not_modified(etag)
+    if response is not None:
+        return response
+
+    # Count only active items (not soft-deleted); both counts in one query
+    item_count, checked_count = db.session.query(
+        db.func.count(ShoppingListItem.id),
+        count_if(ShoppingListItem.is_checked)
+    ).filter(
+        ShoppingListItem.shopping_list_id == shopping_list.id,
+        ShoppingListItem.deleted_at.is_(None)
+    ).one()
 
     list_data = {
         'id': shopping_list.id,
@@ -161,8 +202,8 @@ def get_shared_list_info(guid: str):
         'is_shared': shopping_list.is_shared,
         'created_at': shopping_list.created_at.isoformat(),
         'updated_at': shopping_list.updated_at.isoformat(),
-        'item_count': active_items.count(),
-        'checked_count': active_items.filter_by(is_checked=True).count()
+        'item_count': item_count,
+        'checked_count': checked_count
     }
 
-    return success_response(data=list_data)
+    return with_etag(success_response(data=list_data), etag)
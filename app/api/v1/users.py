@@ -11,7 +11,7 @@ from sqlalchemy import desc
 
 from . import v1_bp
 from ...extensions import db, limiter
-from ...models import User, ShoppingList
+from ...models import User, ShoppingList, ShoppingListItem
 from ..schemas import (
     UserSchema,
     UserCreateSchema,
@@ -22,12 +22,17 @@ from ..errors import (
     error_response,
     success_response,
     paginated_response,
+    cursor_response,
     NotFoundError,
     ConflictError,
     ForbiddenError,
     ErrorCodes
 )
 from ..decorators import admin_required, get_current_user, self_or_admin_required
+from ..pagination import keyset_paginate
+
+_user_schema = UserSchema()
+_user_create_schema = UserCreateSchema()
 
 
 # ============================================================================
@@ -59,8 +64,7 @@ def get_users():
         error_out=False
     )
 
-    user_schema = UserSchema()
-    users_data = user_schema.dump(pagination.items, many=True)
+    users_data = _user_schema.dump(pagination.items, many=True)
 
     return paginated_response(users_data, pagination)
 
@@ -83,13 +87,12 @@ def get_user(user_id: int):
         403: Forbidden
         404: User not found
     """
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         raise NotFoundError('Benutzer nicht gefunden')
 
-    user_schema = UserSchema()
-    user_data = user_schema.dump(user)
+    user_data = _user_schema.dump(user)
 
     return success_response(data=user_data)
 
@@ -120,9 +123,8 @@ def create_user():
     data = request.get_json()
 
     # Validate request data
-    schema = UserCreateSchema()
     try:
-        validated_data = schema.load(data)
+        validated_data = _user_create_schema.load(data)
     except ValidationError as err:
         return error_response(
             status_code=400,
@@ -131,11 +133,11 @@ def create_user():
             details=err.messages
         )
 
-    # Check if username or email already exists
-    if User.query.filter_by(username=validated_data['username']).first():
+    # Check username and email conflicts in one query
+    conflict = User.find_conflict(username=validated_data['username'], email=validated_data['email'])
+    if conflict == 'username':
         raise ConflictError('Benutzername bereits vergeben')
-
-    if User.query.filter_by(email=validated_data['email']).first():
+    if conflict == 'email':
         raise ConflictError('E-Mail-Adresse bereits registriert')
 
     # Create new user
@@ -151,13 +153,13 @@ def create_user():
 
     admin = get_current_user()
     current_app.logger.info(
-        f'Admin "{admin.username}" (ID: {admin.id}) hat via API Benutzer '
-        f'"{user.username}" (ID: {user.id}) erstellt (Admin: {user.is_admin})'
+        'Admin "%s" (ID: %s) hat via API Benutzer '
+        '"%s" (ID: %s) erstellt (Admin: %s)',
+        admin.username, admin.id, user.username, user.id, user.is_admin
     )
 
     # Serialize user data
-    user_schema = UserSchema()
-    user_data = user_schema.dump(user)
+    user_data = _user_schema.dump(user)
 
     return success_response(
         data=user_data,
@@ -194,7 +196,7 @@ def update_user(user_id: int):
         404: User not found
         409: Username or email already exists
     """
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         raise NotFoundError('Benutzer nicht gefunden')
@@ -208,24 +210,24 @@ def update_user(user_id: int):
             raise ForbiddenError('Nur Administratoren können den Admin-Status ändern')
         user.is_admin = data['is_admin']
 
-    # Check for username conflict
-    if 'username' in data and data['username'] != user.username:
-        existing_user = User.query.filter_by(username=data['username']).first()
-        if existing_user:
-            raise ConflictError('Benutzername bereits vergeben')
-        user.username = data['username']
+    new_username = data['username'] if 'username' in data and data['username'] != user.username else None
+    new_email = data['email'] if 'email' in data and data['email'] != user.email else None
+
+    # Check username and email conflicts in one query
+    conflict = User.find_conflict(username=new_username, email=new_email, exclude_id=user.id)
+    if conflict == 'username':
+        raise ConflictError('Benutzername bereits vergeben')
+    if conflict == 'email':
+        raise ConflictError('E-Mail-Adresse bereits registriert')
 
-    # Check for email conflict
-    if 'email' in data and data['email'] != user.email:
-        existing_user = User.query.filter_by(email=data['email']).first()
-        if existing_user:
-            raise ConflictError('E-Mail-Adresse bereits registriert')
-        user.email = data['email']
+    if new_username is not None:
+        user.username = new_username
+    if new_email is not None:
+        user.email = new_email
 
     db.session.commit()
 
-    user_schema = UserSchema()
-    user_data = user_schema.dump(user)
+    user_data = _user_schema.dump(user)
 
     return success_response(
         data=user_data,
@@ -252,11 +254,13 @@ def delete_user(user_id: int):
         403: Forbidden (not admin)
         404: User not found
     """
-    user = User.query.get(user_id)
+    row = User.with_list_count().filter(User.id == user_id).first()
 
-    if not user:
+    if not row:
         raise NotFoundError('Benutzer nicht gefunden')
 
+    user, list_count = row
+
     # Prevent deleting yourself
     current_user_id = int(get_jwt_identity())
     if user_id == current_user_id:
@@ -267,15 +271,15 @@ def delete_user(user_id: int):
         )
 
     username = user.username
-    list_count = user.shopping_lists.count()
     admin = get_current_user()
 
     db.session.delete(user)
     db.session.commit()
 
     current_app.logger.info(
-        f'Admin "{admin.username}" (ID: {admin.id}) hat via API Benutzer '
-        f'"{username}" (ID: {user_id}) und {list_count} zugehörige Listen gelöscht'
+        'Admin "%s" (ID: %s) hat via API Benutzer '
+        '"%s" (ID: %s) und %s zugehörige Listen gelöscht',
+        admin.username, admin.id, username, user_id, list_count
     )
 
     return success_response(
@@ -300,39 +304,62 @@ def get_user_lists(user_id: int):
     Query Parameters:
         page (int): Page number (default: 1)
         per_page (int): Items per page (default: 20, max: 100)
+        cursor (str): Use keyset pagination instead of page numbers; empty
+            for the first page, then ``next_cursor`` of the previous response
 
     Returns:
         200: Paginated list of shopping lists
+        400: Invalid cursor
         401: Unauthorized
         403: Forbidden
         404: User not found
     """
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         raise NotFoundError('Benutzer nicht gefunden')
 
     page = request.args.get('page', 1, type=int)
     per_page = min(request.args.get('per_page', 20, type=int), 100)
-
-    pagination = user.shopping_lists.order_by(desc(ShoppingList.updated_at)).paginate(
-        page=page,
-        per_page=per_page,
-        error_out=False
+    cursor = request.args.get('cursor')
+
+    # Fetch the item counts with the page instead of one COUNT per list;
+    # trashed lists are included here, so count their items too
+    counts = ShoppingListItem.count_by_list(include_deleted=True)
+    query = db.session.query(
+        ShoppingList,
+        db.func.coalesce(counts.c.item_count, 0)
+    ).outerjoin(
+        counts, counts.c.shopping_list_id == ShoppingList.id
+    ).filter(
+        ShoppingList.user_id == user.id
     )
 
+    if cursor is not None:
+        rows, next_cursor = keyset_paginate(query, ShoppingList, cursor, per_page)
+    else:
+        pagination = query.order_by(desc(ShoppingList.updated_at)).paginate(
+            page=page,
+            per_page=per_page,
+            error_out=False
+        )
+        rows = pagination.items
+
     # Serialize lists with item count
-    lists_data = []
-    for shopping_list in pagination.items:
-        list_data = {
+    lists_data = [
+        {
             'id': shopping_list.id,
             'guid': shopping_list.guid,
             'title': shopping_list.title,
             'is_shared': shopping_list.is_shared,
             'created_at': shopping_list.created_at.isoformat(),
             'updated_at': shopping_list.updated_at.isoformat(),
-            'item_count': shopping_list.items.count()
+            'item_count': item_count
         }
-        lists_data.append(list_data)
+        for shopping_list, item_count in rows
+    ]
+
+    if cursor is not None:
+        return cursor_response(lists_data, next_cursor, per_page)
 
     return paginated_response(lists_data, pagination)
@@ -4,9 +4,11 @@ import click
 from datetime import datetime, timedelta, timezone
 from flask import Flask
 from flask.cli import with_appcontext
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import joinedload
 
 from .extensions import db
-from .models import User, ShoppingList, ShoppingListItem
+from .models import User, ShoppingList, ShoppingListItem, count_if
 
 
 @click.command('init-db')
@@ -39,12 +41,13 @@ def init_db_command():
 @with_appcontext
 def create_admin_command(username: str, email: str, password: str):
     """Create a new admin user."""
-    # Check if user already exists
-    if User.query.filter_by(username=username).first():
+    # Check username and email conflicts in one query
+    conflict = User.find_conflict(username=username, email=email)
+    if conflict == 'username':
         click.echo(f'Error: User "{username}" already exists.', err=True)
         return
 
-    if User.query.filter_by(email=email).first():
+    if conflict == 'email':
         click.echo(f'Error: Email "{email}" is already in use.', err=True)
         return
 
@@ -67,12 +70,13 @@ def create_admin_command(username: str, email: str, password: str):
 @with_appcontext
 def create_user_command(username: str, email: str, password: str):
     """Create a new regular user."""
-    # Check if user already exists
-    if User.query.filter_by(username=username).first():
+    # Check username and email conflicts in one query
+    conflict = User.find_conflict(username=username, email=email)
+    if conflict == 'username':
         click.echo(f'Error: User "{username}" already exists.', err=True)
         return
 
-    if User.query.filter_by(email=email).first():
+    if conflict == 'email':
         click.echo(f'Error: Email "{email}" is already in use.', err=True)
         return
 
@@ -92,7 +96,22 @@ def create_user_command(username: str, email: str, password: str):
 @with_appcontext
 def list_users_command():
     """List all users."""
-    users = User.query.order_by(User.username).all()
+    # List counts (including trashed lists) come from the same statement
+    list_counts = db.session.query(
+        ShoppingList.user_id,
+        db.func.count(ShoppingList.id).label('list_count')
+    ).group_by(ShoppingList.user_id).subquery()
+
+    # Only the printed columns, no User objects (and no password hashes)
+    users = db.session.query(
+        User.id,
+        User.username,
+        User.email,
+        User.is_admin,
+        db.func.coalesce(list_counts.c.list_count, 0).label('list_count')
+    ).outerjoin(
+        list_counts, list_counts.c.user_id == User.id
+    ).order_by(User.username).all()
 
     if not users:
         click.echo('No users found.')
@@ -101,27 +120,34 @@ def list_users_command():
     click.echo(f'{"ID":<5} {"Username":<20} {"Email":<30} {"Admin":<10} {"Lists":<10}')
     click.echo('-' * 80)
 
-    for user in users:
-        lists_count = user.shopping_lists.count()
-        click.echo(
-            f'{user.id:<5} {user.username:<20} {user.email:<30} '
-            f'{"Yes" if user.is_admin else "No":<10} {lists_count:<10}'
-        )
+    # One write for all rows; click.echo flushes after every call
+    click.echo('\n'.join(
+        f'{user.id:<5} {user.username:<20} {user.email:<30} '
+        f'{"Yes" if user.is_admin else "No":<10} {user.list_count:<10}'
+        for user in users
+    ))
 
 
 @click.command('stats')
 @with_appcontext
 def stats_command():
     """Show application statistics."""
-    total_users = User.query.count()
-    total_admins = User.query.filter_by(is_admin=True).count()
-    total_lists = ShoppingList.active().count()
-    total_shared_lists = ShoppingList.active().filter_by(is_shared=True).count()
-    total_items = ShoppingListItem.active().count()
-
-    # Trash statistics
-    trashed_lists = ShoppingList.deleted().count()
-    trashed_items = ShoppingListItem.deleted().count()
+    # One aggregate per table instead of one COUNT per figure
+    total_users, total_admins = db.session.query(
+        db.func.count(User.id),
+        count_if(User.is_admin)
+    ).one()
+
+    total_lists, total_shared_lists, trashed_lists = db.session.query(
+        count_if(ShoppingList.deleted_at.is_(None)),
+        count_if(and_(ShoppingList.deleted_at.is_(None), ShoppingList.is_shared)),
+        count_if(ShoppingList.deleted_at.isnot(None))
+    ).one()
+
+    total_items, trashed_items = db.session.query(
+        count_if(ShoppingListItem.deleted_at.is_(None)),
+        count_if(ShoppingListItem.deleted_at.isnot(None))
+    ).one()
 
     click.echo('Application Statistics:')
     click.echo('-' * 40)
@@ -145,42 +171,55 @@ def cleanup_trash_command(days: int, dry_run: bool):
     """Permanently delete items that have been in trash for N days."""
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # Find old items
-    old_items = ShoppingListItem.deleted().filter(
-        ShoppingListItem.deleted_at < cutoff
-    ).all()
-
-    # Find old lists
-    old_lists = ShoppingList.deleted().filter(
+    expired_lists = ShoppingList.deleted().filter(
         ShoppingList.deleted_at < cutoff
-    ).all()
+    )
+    # Bulk DELETEs skip the ORM cascade, so the items of expired lists are
+    # removed explicitly; the dry run previews exactly the same rows
+    expired_list_ids = expired_lists.with_entities(ShoppingList.id)
+    expired_items = ShoppingListItem.query.filter(
+        or_(
+            ShoppingListItem.deleted_at < cutoff,
+            ShoppingListItem.shopping_list_id.in_(expired_list_ids)
+        )
+    )
 
     if dry_run:
         click.echo(f'DRY RUN: Would permanently delete items older than {days} days (before {cutoff.isoformat()}):')
         click.echo('-' * 80)
-        click.echo(f'Lists to delete:  {len(old_lists)}')
-        if old_lists:
-            for shopping_list in old_lists:
-                click.echo(f'  - [{shopping_list.id}] "{shopping_list.title}" (deleted: {shopping_list.deleted_at.isoformat()})')
-
-        click.echo(f'Items to delete:  {len(old_items)}')
-        if old_items:
-            for item in old_items:
-                click.echo(f'  - [{item.id}] "{item.name}" from list {item.shopping_list.title} (deleted: {item.deleted_at.isoformat()})')
+        # Only the printed columns are streamed, and rows are counted as they
+        # are printed instead of with a separate COUNT query
+        click.echo('Lists to delete:')
+        list_rows = expired_lists.with_entities(
+            ShoppingList.id, ShoppingList.title, ShoppingList.deleted_at
+        )
+        list_count = 0
+        for list_count, row in enumerate(list_rows.yield_per(1000), start=1):
+            click.echo(f'  - [{row.id}] "{row.title}" (deleted: {row.deleted_at.isoformat()})')
+        click.echo(f'  Total: {list_count}')
+
+        click.echo('Items to delete:')
+        item_rows = expired_items.join(ShoppingListItem.shopping_list).with_entities(
+            ShoppingListItem.id, ShoppingListItem.name, ShoppingListItem.deleted_at,
+            ShoppingList.title.label('list_title')
+        )
+        item_count = 0
+        for item_count, row in enumerate(item_rows.yield_per(1000), start=1):
+            # Items of an expired list may not be in the trash themselves
+            deleted = row.deleted_at.isoformat() if row.deleted_at else 'with list'
+            click.echo(f'  - [{row.id}] "{row.name}" from list {row.list_title} (deleted: {deleted})')
+        click.echo(f'  Total: {item_count}')
 
         click.echo('\nTo actually delete, run without --dry-run flag.')
         return
 
-    # Actually delete
-    for item in old_items:
-        db.session.delete(item)
-
-    for shopping_list in old_lists:
-        db.session.delete(shopping_list)
+    # Items go first, before the lists they reference
+    deleted_items = expired_items.delete(synchronize_session=False)
+    deleted_lists = expired_lists.delete(synchronize_session=False)
 
     db.session.commit()
 
-    click.echo(f'Permanently deleted {len(old_items)} items and {len(old_lists)} lists older than {days} days.')
+    click.echo(f'Permanently deleted {deleted_items} items and {deleted_lists} lists older than {days} days.')
     click.echo(f'Cutoff date: {cutoff.isoformat()}')
 
 
@@ -188,8 +227,13 @@ def cleanup_trash_command(days: int, dry_run: bool):
 @with_appcontext
 def trash_stats_command():
     """Show detailed trash statistics."""
-    trashed_lists = ShoppingList.deleted().all()
-    trashed_items = ShoppingListItem.deleted().all()
+    # Owners and parent lists are printed per row, so load them in the same query
+    trashed_lists = ShoppingList.deleted().options(joinedload(ShoppingList.owner)).all()
+    # Only the newest 20 items are printed; the rest is just counted
+    trashed_item_count = ShoppingListItem.deleted().count()
+    trashed_items = ShoppingListItem.deleted().options(
+        joinedload(ShoppingListItem.shopping_list)
+    ).order_by(ShoppingListItem.deleted_at.desc()).limit(20).all()
 
     click.echo('Trash Statistics (Papierkorb):')
     click.echo('=' * 80)
@@ -200,29 +244,29 @@ def trash_stats_command():
     if trashed_lists:
         click.echo(f'{"ID":<5} {"Title":<30} {"Owner":<15} {"Deleted At":<25}')
         click.echo('-' * 80)
-        for shopping_list in trashed_lists:
-            click.echo(
-                f'{shopping_list.id:<5} {shopping_list.title[:28]:<30} '
-                f'{shopping_list.owner.username[:13]:<15} '
-                f'{shopping_list.deleted_at.isoformat():<25}'
-            )
+        click.echo('\n'.join(
+            f'{shopping_list.id:<5} {shopping_list.title[:28]:<30} '
+            f'{shopping_list.owner.username[:13]:<15} '
+            f'{shopping_list.deleted_at.isoformat():<25}'
+            for shopping_list in trashed_lists
+        ))
     else:
         click.echo('No deleted lists in trash.')
 
     # Items in trash
-    click.echo(f'\nDeleted Items: {len(trashed_items)}')
+    click.echo(f'\nDeleted Items: {trashed_item_count}')
     click.echo('-' * 80)
     if trashed_items:
         click.echo(f'{"ID":<5} {"Name":<25} {"List":<25} {"Deleted At":<25}')
         click.echo('-' * 80)
-        for item in trashed_items[:20]:  # Show first 20
-            click.echo(
-                f'{item.id:<5} {item.name[:23]:<25} '
-                f'{item.shopping_list.title[:23]:<25} '
-                f'{item.deleted_at.isoformat():<25}'
-            )
-        if len(trashed_items) > 20:
-            click.echo(f'... and {len(trashed_items) - 20} more')
+        click.echo('\n'.join(
+            f'{item.id:<5} {item.name[:23]:<25} '
+            f'{item.shopping_list.title[:23]:<25} '
+            f'{item.deleted_at.isoformat():<25}'
+            for item in trashed_items
+        ))
+        if trashed_item_count > len(trashed_items):
+            click.echo(f'... and {trashed_item_count - len(trashed_items)} more')
     else:
         click.echo('No deleted items in trash.')
 
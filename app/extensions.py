@@ -16,9 +16,8 @@ cors = CORS()
 compress = Compress()
 
 # Rate limiter with IP-based tracking
+# Storage backend and strategy come from RATELIMIT_* config (Redis in Docker)
 limiter = Limiter(
     key_func=get_remote_address,
-    default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://",
-    strategy="fixed-window"
+    default_limits=["200 per day", "50 per hour"]
 )
@@ -0,0 +1,70 @@
+"""
+Fast JSON Provider based on orjson.
+
+Replaces Flask's stdlib-based JSON provider for API responses. Falls back
+to Flask's default provider when orjson is not installed.
+"""
+
+import decimal
+from datetime import date
+
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj):
+    """Serialize types orjson does not handle natively or like Flask does."""
+    if isinstance(obj, date):
+        return http_date(obj)
+
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes and decodes with orjson.
+
+    Keeps the output of Flask's default provider: keys are sorted
+    (``sort_keys``), non-string keys are allowed, dates and datetimes are
+    emitted as HTTP dates and Decimals as strings.
+    """
+
+    def _options(self) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+
+        return options
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize data as a JSON string."""
+        return orjson.dumps(obj, default=_default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response without decoding the encoded bytes to str."""
+        obj = self._prepare_response_obj(args, kwargs)
+        options = self._options()
+
+        # Indent like the default provider: in debug mode unless compact is set
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            options |= orjson.OPT_INDENT_2
+
+        body = orjson.dumps(obj, default=_default, option=options)
+        return self._app.response_class(body, mimetype=self.mimetype)
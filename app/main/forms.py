@@ -17,7 +17,14 @@ class LoginForm(FlaskForm):
     """Form for user login."""
 
     username = StringField('Benutzername', validators=[DataRequired(message='Benutzername ist erforderlich.')])
-    password = PasswordField('Passwort', validators=[DataRequired(message='Passwort ist erforderlich.')])
+    # Overlong input is rejected before it reaches the password hasher
+    password = PasswordField(
+        'Passwort',
+        validators=[
+            DataRequired(message='Passwort ist erforderlich.'),
+            Length(max=255, message='Passwort darf höchstens 255 Zeichen lang sein.')
+        ]
+    )
     submit = SubmitField('Anmelden')
 
 
@@ -77,7 +84,7 @@ class CreateUserForm(FlaskForm):
         'Passwort',
         validators=[
             DataRequired(message='Passwort ist erforderlich.'),
-            Length(min=6, message='Passwort muss mindestens 6 Zeichen lang sein.')
+            Length(min=6, max=255, message='Passwort muss zwischen 6 und 255 Zeichen lang sein.')
         ]
     )
     password_confirm = PasswordField(
@@ -123,7 +130,7 @@ class EditUserForm(FlaskForm):
         'Neues Passwort (optional)',
         validators=[
             Optional(),
-            Length(min=6, message='Passwort muss mindestens 6 Zeichen lang sein.')
+            Length(min=6, max=255, message='Passwort muss zwischen 6 und 255 Zeichen lang sein.')
         ]
     )
     password_confirm = PasswordField(
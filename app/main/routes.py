@@ -1,3 +1,4 @@
+import logging
 from datetime import datetime, timezone
 
 from flask import (
@@ -5,13 +6,17 @@ from flask import (
     current_app,
     flash,
     jsonify,
+    make_response,
     redirect,
     render_template,
     request,
+    session,
     url_for,
 )
 from flask_login import current_user, login_required, login_user, logout_user
+from marshmallow import ValidationError
 from sqlalchemy import desc
+from sqlalchemy.orm import joinedload, selectinload
 
 from . import main_bp
 from .forms import (
@@ -21,10 +26,17 @@ from .forms import (
     ShoppingListForm,
     ShoppingListItemForm,
 )
+from ..api.conditional import compute_etag, not_modified
+from ..api.schemas import ShoppingListItemBulkToggleSchema
 from ..extensions import db, limiter
 from ..models import ShoppingList, ShoppingListItem, User
 from ..utils import admin_required, check_list_access
 
+_item_bulk_toggle_schema = ShoppingListItemBulkToggleSchema()
+
+# Child of the app logger ('app'), so records reach its handlers
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Public Routes
@@ -47,11 +59,17 @@ def login():
 
     form = LoginForm()
     if form.validate_on_submit():
-        user = User.query.filter_by(username=form.username.data).first()
-        if user and user.check_password(form.password.data):
+        user = User.authenticate(form.username.data, form.password.data)
+        if user is not None:
+            # Upgrade hashes created with an outdated method or cost
+            if user.password_needs_rehash():
+                user.set_password(form.password.data)
+                db.session.commit()
+
             login_user(user)
-            current_app.logger.info(
-                f'Benutzer "{user.username}" (ID: {user.id}) hat sich erfolgreich angemeldet'
+            logger.info(
+                'Benutzer "%s" (ID: %s) hat sich erfolgreich angemeldet',
+                user.username, user.id
             )
             flash('Erfolgreich angemeldet.', 'success')
             next_page = request.args.get('next')
@@ -60,8 +78,9 @@ def login():
             return redirect(next_page)
 
         # Log failed login attempt
-        current_app.logger.warning(
-            f'Fehlgeschlagener Anmeldeversuch für Benutzername: "{form.username.data}" von IP: {request.remote_addr}'
+        logger.warning(
+            'Fehlgeschlagener Anmeldeversuch für Benutzername: "%s" von IP: %s',
+            form.username.data, request.remote_addr
         )
         flash('Ungültige Anmeldedaten.', 'danger')
 
@@ -75,7 +94,7 @@ def logout():
     username = current_user.username
     user_id = current_user.id
     logout_user()
-    current_app.logger.info(f'Benutzer "{username}" (ID: {user_id}) hat sich abgemeldet')
+    logger.info('Benutzer "%s" (ID: %s) hat sich abgemeldet', username, user_id)
     flash('Du wurdest abgemeldet.', 'info')
     return redirect(url_for('main.index'))
 
@@ -88,25 +107,47 @@ def view_shared_list(guid: str):
     Args:
         guid: The GUID of the shared list
     """
-    shopping_list = ShoppingList.active().filter_by(guid=guid).first_or_404()
+    shopping_list = ShoppingList.active().options(
+        joinedload(ShoppingList.owner).load_only(User.username)
+    ).filter_by(guid=guid).first_or_404()
 
     if not shopping_list.is_shared:
         flash('Diese Liste ist nicht öffentlich geteilt.', 'warning')
         abort(404)
 
-    # Get items ordered by order_index (only active items)
-    items = ShoppingListItem.active().filter_by(shopping_list_id=shopping_list.id).order_by(ShoppingListItem.order_index.desc()).all()
+    # Anonymous visitors all get the same page, so they can revalidate it via
+    # ETag; pages for logged-in users carry their name and CSRF tokens.
+    # Pending flash messages must be rendered, not answered with 304.
+    etag = None
+    if not current_user.is_authenticated and '_flashes' not in session:
+        etag = compute_etag(
+            shopping_list.id, shopping_list.updated_at.isoformat(), shopping_list.owner.username
+        )
+        response = not_modified(etag)
+        if response is not None:
+            return response
+
+    # Get items ordered by order_index (only active items); the template only
+    # reads columns, so plain rows are enough
+    items = ShoppingListItem.active_rows(shopping_list.id)
 
     # Item form for authenticated users
     item_form = ShoppingListItemForm() if current_user.is_authenticated else None
 
-    return render_template(
+    response = make_response(render_template(
         'shared_list.html',
         shopping_list=shopping_list,
         items=items,
         item_form=item_form,
         can_edit=current_user.is_authenticated
-    )
+    ))
+
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+        # Edits by others must show up on reload, so always revalidate
+        response.cache_control.no_cache = True
+
+    return response
 
 
 @main_bp.route('/impressum')
@@ -149,9 +190,10 @@ def create_list():
         db.session.add(shopping_list)
         db.session.commit()
 
-        current_app.logger.info(
-            f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Liste '
-            f'"{shopping_list.title}" (ID: {shopping_list.id}) erstellt'
+        logger.info(
+            'Benutzer "%s" (ID: %s) hat Liste '
+            '"%s" (ID: %s) erstellt',
+            current_user.username, current_user.id, shopping_list.title, shopping_list.id
         )
         flash(f'Liste "{shopping_list.title}" erfolgreich erstellt.', 'success')
         return redirect(url_for('main.view_list', list_id=shopping_list.id))
@@ -163,7 +205,10 @@ def create_list():
 @login_required
 def view_list(list_id: int):
     """View a shopping list with all its items."""
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first_or_404()
+    # The header shows the owner's name, which is not the viewer for shared lists
+    shopping_list = ShoppingList.active().options(
+        joinedload(ShoppingList.owner).load_only(User.username)
+    ).filter_by(id=list_id).first_or_404()
 
     # Check access permissions
     if not check_list_access(shopping_list, allow_shared=True):
@@ -171,7 +216,7 @@ def view_list(list_id: int):
         abort(403)
 
     # Get items ordered by order_index (descending, so newest first) - only active items
-    items = ShoppingListItem.active().filter_by(shopping_list_id=shopping_list.id).order_by(ShoppingListItem.order_index.desc()).all()
+    items = ShoppingListItem.active_rows(shopping_list.id)
 
     item_form = ShoppingListItemForm()
 
@@ -216,16 +261,18 @@ def print_list(list_id: int):
 
     if success:
         flash(message, 'success')
-        current_app.logger.info(
-            f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Liste '
-            f'"{shopping_list.title}" (ID: {list_id}) gedruckt '
-            f'(include_checked: {include_checked})'
+        logger.info(
+            'Benutzer "%s" (ID: %s) hat Liste '
+            '"%s" (ID: %s) gedruckt '
+            '(include_checked: %s)',
+            current_user.username, current_user.id, shopping_list.title, list_id, include_checked
         )
     else:
         flash(f'Fehler beim Drucken: {message}', 'danger')
-        current_app.logger.error(
-            f'Fehler beim Drucken der Liste "{shopping_list.title}" (ID: {list_id}) '
-            f'durch Benutzer "{current_user.username}" (ID: {current_user.id}): {message}'
+        logger.error(
+            'Fehler beim Drucken der Liste "%s" (ID: %s) '
+            'durch Benutzer "%s" (ID: %s): %s',
+            shopping_list.title, list_id, current_user.username, current_user.id, message
         )
 
     return redirect(url_for('main.view_list', list_id=list_id))
@@ -240,9 +287,10 @@ def edit_list(list_id: int):
 
     # Only owner or admin can edit list settings
     if shopping_list.user_id != current_user.id and not current_user.is_admin:
-        current_app.logger.warning(
-            f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat versucht, '
-            f'Liste {list_id} zu bearbeiten (Zugriff verweigert)'
+        logger.warning(
+            'Benutzer "%s" (ID: %s) hat versucht, '
+            'Liste %s zu bearbeiten (Zugriff verweigert)',
+            current_user.username, current_user.id, list_id
         )
         flash('Sie haben keine Berechtigung, diese Liste zu bearbeiten.', 'danger')
         abort(403)
@@ -252,38 +300,45 @@ def edit_list(list_id: int):
     if form.validate_on_submit():
         old_title = shopping_list.title
         old_shared = shopping_list.is_shared
+        new_title = form.title.data
+        new_shared = form.is_shared.data
 
-        shopping_list.title = form.title.data
+        changes = []
+        if old_title != new_title:
+            changes.append(f'Titel: "{old_title}" → "{new_title}"')
+        if old_shared != new_shared:
+            shared_status = "geteilt" if new_shared else "privat"
+            changes.append(f'Freigabe: {shared_status}')
+
+        # Nothing to write, so skip the transaction entirely
+        if not changes:
+            flash('Keine Änderungen.', 'info')
+            return redirect(url_for('main.view_list', list_id=list_id))
+
+        shopping_list.title = new_title
 
         # If is_shared status changes, regenerate GUID
         # This invalidates the old sharing URL for security
-        if old_shared != form.is_shared.data:
-            import uuid
-            shopping_list.guid = str(uuid.uuid4())
-            current_app.logger.info(
-                f'GUID regenerated for list {list_id} due to sharing status change '
-                f'(was_shared: {old_shared}, now_shared: {form.is_shared.data})'
+        if old_shared != new_shared:
+            shopping_list.regenerate_guid()
+            logger.info(
+                'GUID regenerated for list %s due to sharing status change '
+                '(was_shared: %s, now_shared: %s)',
+                list_id, old_shared, new_shared
             )
 
-        shopping_list.is_shared = form.is_shared.data
-        shopping_list.updated_at = datetime.now(timezone.utc)
+        shopping_list.is_shared = new_shared
+        # updated_at is stamped by the column's onupdate
         db.session.commit()
 
-        changes = []
-        if old_title != shopping_list.title:
-            changes.append(f'Titel: "{old_title}" → "{shopping_list.title}"')
-        if old_shared != shopping_list.is_shared:
-            shared_status = "geteilt" if shopping_list.is_shared else "privat"
-            changes.append(f'Freigabe: {shared_status}')
-
-        if changes:
-            current_app.logger.info(
-                f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Liste '
-                f'{list_id} bearbeitet: {", ".join(changes)}'
-            )
+        logger.info(
+            'Benutzer "%s" (ID: %s) hat Liste '
+            '%s bearbeitet: %s',
+            current_user.username, current_user.id, list_id, ', '.join(changes)
+        )
 
-        flash(f'Liste "{shopping_list.title}" erfolgreich aktualisiert.', 'success')
-        return redirect(url_for('main.view_list', list_id=shopping_list.id))
+        flash(f'Liste "{new_title}" erfolgreich aktualisiert.', 'success')
+        return redirect(url_for('main.view_list', list_id=list_id))
 
     return render_template('edit_list.html', form=form, shopping_list=shopping_list)
 
@@ -297,9 +352,10 @@ def delete_list(list_id: int):
 
     # Only owner or admin can delete
     if shopping_list.user_id != current_user.id and not current_user.is_admin:
-        current_app.logger.warning(
-            f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat versucht, '
-            f'Liste {list_id} zu löschen (Zugriff verweigert)'
+        logger.warning(
+            'Benutzer "%s" (ID: %s) hat versucht, '
+            'Liste %s zu löschen (Zugriff verweigert)',
+            current_user.username, current_user.id, list_id
         )
         flash('Sie haben keine Berechtigung, diese Liste zu löschen.', 'danger')
         abort(403)
@@ -308,9 +364,10 @@ def delete_list(list_id: int):
     shopping_list.soft_delete()
     db.session.commit()
 
-    current_app.logger.info(
-        f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Liste '
-        f'"{title}" (ID: {list_id}) in den Papierkorb verschoben'
+    logger.info(
+        'Benutzer "%s" (ID: %s) hat Liste '
+        '"%s" (ID: %s) in den Papierkorb verschoben',
+        current_user.username, current_user.id, title, list_id
     )
     flash(f'Liste "{title}" wurde in den Papierkorb verschoben.', 'success')
     return redirect(url_for('main.dashboard'))
@@ -329,9 +386,10 @@ def add_item(list_id: int):
 
     # Check access permissions
     if not check_list_access(shopping_list, allow_shared=True):
-        current_app.logger.warning(
-            f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat versucht, '
-            f'Artikel zu Liste {list_id} hinzuzufügen (Zugriff verweigert)'
+        logger.warning(
+            'Benutzer "%s" (ID: %s) hat versucht, '
+            'Artikel zu Liste %s hinzuzufügen (Zugriff verweigert)',
+            current_user.username, current_user.id, list_id
         )
         flash('Sie haben keine Berechtigung, Artikel zu dieser Liste hinzuzufügen.', 'danger')
         abort(403)
@@ -339,25 +397,21 @@ def add_item(list_id: int):
     form = ShoppingListItemForm()
 
     if form.validate_on_submit():
-        # Get the highest order_index and add 1 (only from active items)
-        max_order = db.session.query(db.func.max(ShoppingListItem.order_index)).filter(
-            ShoppingListItem.shopping_list_id == list_id,
-            ShoppingListItem.deleted_at.is_(None)
-        ).scalar() or 0
-
         item = ShoppingListItem(
             shopping_list_id=list_id,
             name=form.name.data,
             quantity=form.quantity.data,
-            order_index=max_order + 1
+            # Highest active order_index + 1, computed within the INSERT
+            order_index=ShoppingListItem.next_order_index(list_id)
         )
         db.session.add(item)
         shopping_list.updated_at = datetime.now(timezone.utc)
         db.session.commit()
 
-        current_app.logger.info(
-            f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Artikel '
-            f'"{item.name}" (ID: {item.id}) zu Liste {list_id} hinzugefügt'
+        logger.info(
+            'Benutzer "%s" (ID: %s) hat Artikel '
+            '"%s" (ID: %s) zu Liste %s hinzugefügt',
+            current_user.username, current_user.id, item.name, item.id, list_id
         )
         flash(f'Artikel "{item.name}" hinzugefügt.', 'success')
 
@@ -369,7 +423,9 @@ def add_item(list_id: int):
 @limiter.limit("100 per minute")
 def toggle_item(item_id: int):
     """Toggle the checked status of an item."""
-    item = ShoppingListItem.active().filter_by(id=item_id).first_or_404()
+    item = ShoppingListItem.active().options(
+        joinedload(ShoppingListItem.shopping_list)
+    ).filter_by(id=item_id).first_or_404()
     shopping_list = item.shopping_list
 
     # Check access permissions
@@ -382,9 +438,10 @@ def toggle_item(item_id: int):
     db.session.commit()
 
     status_text = "abgehakt" if item.is_checked else "nicht abgehakt"
-    current_app.logger.info(
-        f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Artikel '
-        f'"{item.name}" (ID: {item.id}) als {status_text} markiert'
+    logger.info(
+        'Benutzer "%s" (ID: %s) hat Artikel '
+        '"%s" (ID: %s) als %s markiert',
+        current_user.username, current_user.id, item.name, item.id, status_text
     )
 
     return jsonify({
@@ -393,12 +450,55 @@ def toggle_item(item_id: int):
     })
 
 
+@main_bp.route('/lists/<int:list_id>/items/toggle', methods=['POST'])
+@login_required
+@limiter.limit("100 per minute")
+def toggle_items(list_id: int):
+    """
+    Set the checked status of several items of a list at once.
+
+    The list view collects checkbox clicks for a moment and sends them here,
+    so a burst of clicks while shopping costs one transaction.
+    """
+    shopping_list = ShoppingList.active().filter_by(id=list_id).first_or_404()
+
+    # Check access permissions
+    if not check_list_access(shopping_list, allow_shared=True):
+        abort(403)
+
+    try:
+        validated_data = _item_bulk_toggle_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as err:
+        return jsonify({'success': False, 'error': err.messages}), 400
+
+    checked_by_id = {entry['id']: entry['is_checked'] for entry in validated_data['items']}
+
+    if not ShoppingListItem.bulk_set(list_id, 'is_checked', checked_by_id):
+        return jsonify({'success': False, 'error': 'Artikel nicht gefunden'}), 404
+
+    shopping_list.updated_at = datetime.now(timezone.utc)
+    db.session.commit()
+
+    logger.info(
+        'Benutzer "%s" (ID: %s) hat %s Artikel in Liste %s '
+        '(ab-)gehakt',
+        current_user.username, current_user.id, len(checked_by_id), list_id
+    )
+
+    return jsonify({
+        'success': True,
+        'updated_count': len(checked_by_id)
+    })
+
+
 @main_bp.route('/items/<int:item_id>/delete', methods=['POST'])
 @login_required
 @limiter.limit("30 per minute")
 def delete_item(item_id: int):
     """Soft delete an item from a shopping list (move to trash)."""
-    item = ShoppingListItem.active().filter_by(id=item_id).first_or_404()
+    item = ShoppingListItem.active().options(
+        joinedload(ShoppingListItem.shopping_list)
+    ).filter_by(id=item_id).first_or_404()
     shopping_list = item.shopping_list
 
     # Check access permissions
@@ -411,9 +511,10 @@ def delete_item(item_id: int):
     shopping_list.updated_at = datetime.now(timezone.utc)
     db.session.commit()
 
-    current_app.logger.info(
-        f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Artikel '
-        f'"{name}" (ID: {item_id}) in den Papierkorb verschoben'
+    logger.info(
+        'Benutzer "%s" (ID: %s) hat Artikel '
+        '"%s" (ID: %s) in den Papierkorb verschoben',
+        current_user.username, current_user.id, name, item_id
     )
     flash(f'Artikel "{name}" wurde in den Papierkorb verschoben.', 'success')
     return redirect(url_for('main.view_list', list_id=list_id))
@@ -424,7 +525,9 @@ def delete_item(item_id: int):
 @limiter.limit("30 per minute")
 def edit_item(item_id: int):
     """Edit an item in a shopping list (AJAX endpoint)."""
-    item = ShoppingListItem.active().filter_by(id=item_id).first_or_404()
+    item = ShoppingListItem.active().options(
+        joinedload(ShoppingListItem.shopping_list)
+    ).filter_by(id=item_id).first_or_404()
     shopping_list = item.shopping_list
 
     # Check access permissions
@@ -437,41 +540,51 @@ def edit_item(item_id: int):
         # Track changes
         old_name = item.name
         old_quantity = item.quantity
+        new_name = form.name.data.strip()
+        new_quantity = form.quantity.data.strip()
+
+        changes = []
+        if old_name != new_name:
+            changes.append(f'Name: "{old_name}" → "{new_name}"')
+        if old_quantity != new_quantity:
+            changes.append(f'Menge: "{old_quantity}" → "{new_quantity}"')
+
+        # Built from local values, since commit() expires the loaded item
+        response = jsonify({
+            'success': True,
+            'item': {
+                'id': item_id,
+                'name': new_name,
+                'quantity': new_quantity,
+                'is_checked': item.is_checked
+            }
+        })
+
+        # Nothing to write, so skip the transaction entirely
+        if not changes:
+            return response
 
         # Update item
-        item.name = form.name.data.strip()
-        item.quantity = form.quantity.data.strip()
+        item.name = new_name
+        item.quantity = new_quantity
         shopping_list.updated_at = datetime.now(timezone.utc)
 
         try:
             db.session.commit()
 
-            changes = []
-            if old_name != item.name:
-                changes.append(f'Name: "{old_name}" → "{item.name}"')
-            if old_quantity != item.quantity:
-                changes.append(f'Menge: "{old_quantity}" → "{item.quantity}"')
-
-            if changes:
-                current_app.logger.info(
-                    f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Artikel '
-                    f'{item_id} bearbeitet: {", ".join(changes)}'
-                )
+            logger.info(
+                'Benutzer "%s" (ID: %s) hat Artikel '
+                '%s bearbeitet: %s',
+                current_user.username, current_user.id, item_id, ', '.join(changes)
+            )
 
-            return jsonify({
-                'success': True,
-                'item': {
-                    'id': item.id,
-                    'name': item.name,
-                    'quantity': item.quantity,
-                    'is_checked': item.is_checked
-                }
-            })
+            return response
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f'Fehler beim Bearbeiten von Artikel {item_id} durch Benutzer '
-                f'"{current_user.username}" (ID: {current_user.id}): {str(e)}'
+            logger.error(
+                'Fehler beim Bearbeiten von Artikel %s durch Benutzer '
+                '"%s" (ID: %s): %s',
+                item_id, current_user.username, current_user.id, e
             )
             return jsonify({
                 'success': False,
@@ -495,11 +608,23 @@ def edit_item(item_id: int):
 @limiter.limit("100 per hour")
 def admin_dashboard():
     """Admin dashboard."""
-    total_users = User.query.count()
-    total_lists = ShoppingList.active().count()
-    total_items = ShoppingListItem.active().count()
-
-    recent_lists = ShoppingList.active().order_by(desc(ShoppingList.created_at)).limit(10).all()
+    # All three totals in one round trip
+    total_users, total_lists, total_items = db.session.query(
+        User.query.with_entities(db.func.count(User.id)).scalar_subquery(),
+        ShoppingList.active().with_entities(db.func.count(ShoppingList.id)).scalar_subquery(),
+        ShoppingListItem.active().with_entities(db.func.count(ShoppingListItem.id)).scalar_subquery()
+    ).one()
+
+    # Item counts and owners for the table, instead of two lazy queries per row
+    counts = ShoppingListItem.count_by_list(include_deleted=True)
+    recent_lists = ShoppingList.active().with_entities(
+        ShoppingList,
+        db.func.coalesce(counts.c.item_count, 0)
+    ).outerjoin(
+        counts, counts.c.shopping_list_id == ShoppingList.id
+    ).options(
+        selectinload(ShoppingList.owner).load_only(User.username)
+    ).order_by(desc(ShoppingList.created_at)).limit(10).all()
 
     return render_template(
         'admin/dashboard.html',
@@ -537,9 +662,10 @@ def admin_create_user():
         db.session.add(user)
         db.session.commit()
 
-        current_app.logger.info(
-            f'Admin "{current_user.username}" (ID: {current_user.id}) hat Benutzer '
-            f'"{user.username}" (ID: {user.id}) erstellt (Admin: {user.is_admin})'
+        logger.info(
+            'Admin "%s" (ID: %s) hat Benutzer '
+            '"%s" (ID: %s) erstellt (Admin: %s)',
+            current_user.username, current_user.id, user.username, user.id, user.is_admin
         )
         flash(f'Benutzer "{user.username}" wurde erstellt.', 'success')
         return redirect(url_for('main.admin_users'))
@@ -585,9 +711,10 @@ def admin_edit_user(user_id: int):
         db.session.commit()
 
         if changes:
-            current_app.logger.info(
-                f'Admin "{current_user.username}" (ID: {current_user.id}) hat Benutzer '
-                f'"{user.username}" (ID: {user_id}) bearbeitet: {", ".join(changes)}'
+            logger.info(
+                'Admin "%s" (ID: %s) hat Benutzer '
+                '"%s" (ID: %s) bearbeitet: %s',
+                current_user.username, current_user.id, user.username, user_id, ', '.join(changes)
             )
 
         flash(f'Benutzer "{user.username}" wurde aktualisiert.', 'success')
@@ -602,25 +729,26 @@ def admin_edit_user(user_id: int):
 @limiter.limit("20 per hour")
 def admin_delete_user(user_id: int):
     """Delete a user and all their lists."""
-    user = User.query.get_or_404(user_id)
+    user, list_count = User.with_list_count().filter(User.id == user_id).first_or_404()
 
     # Prevent deleting yourself
     if user.id == current_user.id:
-        current_app.logger.warning(
-            f'Admin "{current_user.username}" (ID: {current_user.id}) hat versucht, '
-            f'sich selbst zu löschen'
+        logger.warning(
+            'Admin "%s" (ID: %s) hat versucht, '
+            'sich selbst zu löschen',
+            current_user.username, current_user.id
         )
         flash('Sie können sich nicht selbst löschen.', 'danger')
         return redirect(url_for('main.admin_users'))
 
     username = user.username
-    list_count = user.shopping_lists.count()
     db.session.delete(user)
     db.session.commit()
 
-    current_app.logger.info(
-        f'Admin "{current_user.username}" (ID: {current_user.id}) hat Benutzer '
-        f'"{username}" (ID: {user_id}) und {list_count} zugehörige Listen gelöscht'
+    logger.info(
+        'Admin "%s" (ID: %s) hat Benutzer '
+        '"%s" (ID: %s) und %s zugehörige Listen gelöscht',
+        current_user.username, current_user.id, username, user_id, list_count
     )
     flash(f'Benutzer "{username}" und alle zugehörigen Listen wurden gelöscht.', 'success')
     return redirect(url_for('main.admin_users'))
@@ -631,7 +759,22 @@ def admin_delete_user(user_id: int):
 @admin_required
 def admin_lists():
     """View all active shopping lists."""
-    lists = ShoppingList.active().order_by(desc(ShoppingList.updated_at)).all()
+    # The table is read-only, so plain rows with the owner name and item
+    # count are selected in one statement instead of building ORM objects
+    counts = ShoppingListItem.count_by_list(include_deleted=True)
+    lists = ShoppingList.active().with_entities(
+        ShoppingList.id,
+        ShoppingList.title,
+        ShoppingList.is_shared,
+        ShoppingList.created_at,
+        ShoppingList.updated_at,
+        User.username.label('owner_username'),
+        db.func.coalesce(counts.c.item_count, 0).label('item_count')
+    ).join(
+        User, ShoppingList.user_id == User.id
+    ).outerjoin(
+        counts, counts.c.shopping_list_id == ShoppingList.id
+    ).order_by(desc(ShoppingList.updated_at)).all()
     return render_template('admin/lists.html', lists=lists)
 
 
@@ -641,20 +784,23 @@ def admin_lists():
 @limiter.limit("20 per hour")
 def admin_delete_list(list_id: int):
     """Soft delete a shopping list (admin)."""
-    shopping_list = ShoppingList.active().filter_by(id=list_id).first_or_404()
+    shopping_list = ShoppingList.active().options(
+        joinedload(ShoppingList.owner).load_only(User.username)
+    ).filter_by(id=list_id).first_or_404()
 
     title = shopping_list.title
     owner = shopping_list.owner.username
     owner_id = shopping_list.user_id
-    item_count = ShoppingListItem.active().filter_by(shopping_list_id=list_id).count()
 
-    shopping_list.soft_delete()
+    # The cascading UPDATE reports how many items went to the trash
+    item_count = shopping_list.soft_delete()
     db.session.commit()
 
-    current_app.logger.info(
-        f'Admin "{current_user.username}" (ID: {current_user.id}) hat Liste '
-        f'"{title}" (ID: {list_id}) von Benutzer "{owner}" (ID: {owner_id}) '
-        f'mit {item_count} Artikeln in den Papierkorb verschoben'
+    logger.info(
+        'Admin "%s" (ID: %s) hat Liste '
+        '"%s" (ID: %s) von Benutzer "%s" (ID: %s) '
+        'mit %s Artikeln in den Papierkorb verschoben',
+        current_user.username, current_user.id, title, list_id, owner, owner_id, item_count
     )
     flash(f'Liste "{title}" von Benutzer "{owner}" wurde in den Papierkorb verschoben.', 'success')
     return redirect(url_for('main.admin_lists'))
@@ -681,9 +827,10 @@ def restore_list(list_id: int):
 
     # Only owner or admin can restore
     if shopping_list.user_id != current_user.id and not current_user.is_admin:
-        current_app.logger.warning(
-            f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat versucht, '
-            f'Liste {list_id} wiederherzustellen (Zugriff verweigert)'
+        logger.warning(
+            'Benutzer "%s" (ID: %s) hat versucht, '
+            'Liste %s wiederherzustellen (Zugriff verweigert)',
+            current_user.username, current_user.id, list_id
         )
         flash('Sie haben keine Berechtigung, diese Liste wiederherzustellen.', 'danger')
         abort(403)
@@ -692,9 +839,10 @@ def restore_list(list_id: int):
     shopping_list.restore()
     db.session.commit()
 
-    current_app.logger.info(
-        f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Liste '
-        f'"{title}" (ID: {list_id}) aus dem Papierkorb wiederhergestellt'
+    logger.info(
+        'Benutzer "%s" (ID: %s) hat Liste '
+        '"%s" (ID: %s) aus dem Papierkorb wiederhergestellt',
+        current_user.username, current_user.id, title, list_id
     )
     flash(f'Liste "{title}" wurde wiederhergestellt.', 'success')
     return redirect(url_for('main.dashboard'))
@@ -706,20 +854,25 @@ def restore_list(list_id: int):
 @limiter.limit("20 per hour")
 def permanent_delete_list(list_id: int):
     """Permanently delete a shopping list (admin only)."""
-    shopping_list = ShoppingList.deleted().filter_by(id=list_id).first_or_404()
+    shopping_list, item_count = ShoppingList.with_item_count().options(
+        joinedload(ShoppingList.owner).load_only(User.username)
+    ).filter(
+        ShoppingList.id == list_id,
+        ShoppingList.deleted_at.isnot(None)
+    ).first_or_404()
 
     title = shopping_list.title
     owner = shopping_list.owner.username
     owner_id = shopping_list.user_id
-    item_count = shopping_list.items.count()
 
     db.session.delete(shopping_list)
     db.session.commit()
 
-    current_app.logger.warning(
-        f'Admin "{current_user.username}" (ID: {current_user.id}) hat Liste '
-        f'"{title}" (ID: {list_id}) von Benutzer "{owner}" (ID: {owner_id}) '
-        f'mit {item_count} Artikeln endgültig gelöscht'
+    logger.warning(
+        'Admin "%s" (ID: %s) hat Liste '
+        '"%s" (ID: %s) von Benutzer "%s" (ID: %s) '
+        'mit %s Artikeln endgültig gelöscht',
+        current_user.username, current_user.id, title, list_id, owner, owner_id, item_count
     )
     flash(f'Liste "{title}" wurde endgültig gelöscht.', 'warning')
     return redirect(url_for('main.trash'))
@@ -730,14 +883,17 @@ def permanent_delete_list(list_id: int):
 @limiter.limit("30 per minute")
 def restore_item(item_id: int):
     """Restore an item from trash."""
-    item = ShoppingListItem.deleted().filter_by(id=item_id).first_or_404()
+    item = ShoppingListItem.deleted().options(
+        joinedload(ShoppingListItem.shopping_list)
+    ).filter_by(id=item_id).first_or_404()
     shopping_list = item.shopping_list
 
     # Check access permissions
     if shopping_list.user_id != current_user.id and not current_user.is_admin:
-        current_app.logger.warning(
-            f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat versucht, '
-            f'Artikel {item_id} wiederherzustellen (Zugriff verweigert)'
+        logger.warning(
+            'Benutzer "%s" (ID: %s) hat versucht, '
+            'Artikel %s wiederherzustellen (Zugriff verweigert)',
+            current_user.username, current_user.id, item_id
         )
         flash('Sie haben keine Berechtigung, diesen Artikel wiederherzustellen.', 'danger')
         abort(403)
@@ -748,9 +904,10 @@ def restore_item(item_id: int):
     shopping_list.updated_at = datetime.now(timezone.utc)
     db.session.commit()
 
-    current_app.logger.info(
-        f'Benutzer "{current_user.username}" (ID: {current_user.id}) hat Artikel '
-        f'"{name}" (ID: {item_id}) aus dem Papierkorb wiederhergestellt'
+    logger.info(
+        'Benutzer "%s" (ID: %s) hat Artikel '
+        '"%s" (ID: %s) aus dem Papierkorb wiederhergestellt',
+        current_user.username, current_user.id, name, item_id
     )
     flash(f'Artikel "{name}" wurde wiederhergestellt.', 'success')
     return redirect(url_for('main.view_list', list_id=list_id))
@@ -765,7 +922,9 @@ def restore_item(item_id: int):
 @admin_required
 def admin_trash():
     """View all deleted shopping lists (admin)."""
-    deleted_lists = ShoppingList.deleted().order_by(desc(ShoppingList.deleted_at)).all()
+    deleted_lists = ShoppingList.deleted().options(
+        selectinload(ShoppingList.owner).load_only(User.username)
+    ).order_by(desc(ShoppingList.deleted_at)).all()
     return render_template('admin/trash.html', deleted_lists=deleted_lists)
 
 
@@ -812,15 +971,17 @@ def printer_test():
             success, message = printer_service.print_test_page()
             if success:
                 flash(message, 'success')
-                current_app.logger.info(
-                    f'Benutzer "{current_user.username}" (ID: {current_user.id}) '
-                    f'hat eine Drucker-Testseite gedruckt'
+                logger.info(
+                    'Benutzer "%s" (ID: %s) '
+                    'hat eine Drucker-Testseite gedruckt',
+                    current_user.username, current_user.id
                 )
             else:
                 flash(message, 'danger')
-                current_app.logger.error(
-                    f'Fehler beim Drucken der Testseite durch Benutzer '
-                    f'"{current_user.username}" (ID: {current_user.id}): {message}'
+                logger.error(
+                    'Fehler beim Drucken der Testseite durch Benutzer '
+                    '"%s" (ID: %s): %s',
+                    current_user.username, current_user.id, message
                 )
 
         return redirect(url_for('main.printer_test'))
@@ -2,12 +2,31 @@ import uuid
 from datetime import datetime, timezone
 from typing import List as TypeList
 
+from flask import current_app
 from flask_login import UserMixin
+from sqlalchemy import case, or_, update
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from .extensions import db, login_manager
 
 
+# Hashes compared against when a login names an unknown user, per hash method
+_dummy_hashes = {}
+
+
+def _dummy_password_hash() -> str:
+    """Return a throwaway hash made with the configured PASSWORD_HASH_METHOD."""
+    method = current_app.config['PASSWORD_HASH_METHOD']
+    if method not in _dummy_hashes:
+        _dummy_hashes[method] = generate_password_hash('', method=method)
+    return _dummy_hashes[method]
+
+
+def count_if(condition):
+    """Aggregate counting the rows that match ``condition`` (0 for empty tables)."""
+    return db.func.coalesce(db.func.sum(case((condition, 1), else_=0)), 0)
+
+
 class User(UserMixin, db.Model):
     """User model for authentication and authorization."""
 
@@ -21,16 +40,99 @@ class User(UserMixin, db.Model):
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
     # Relationships
-    shopping_lists = db.relationship('ShoppingList', backref='owner', lazy='dynamic', cascade='all, delete-orphan')
+    shopping_lists = db.relationship('ShoppingList', back_populates='owner', lazy='dynamic', cascade='all, delete-orphan')
 
     def set_password(self, password: str) -> None:
-        """Hash and set the user's password."""
-        self.password_hash = generate_password_hash(password)
+        """Hash and set the user's password with the configured PASSWORD_HASH_METHOD."""
+        self.password_hash = generate_password_hash(
+            password, method=current_app.config['PASSWORD_HASH_METHOD']
+        )
 
     def check_password(self, password: str) -> bool:
         """Verify the user's password."""
         return check_password_hash(self.password_hash, password)
 
+    def password_needs_rehash(self) -> bool:
+        """Check whether the stored hash uses another method or cost than configured."""
+        # Compare with the prefix Werkzeug actually writes: a short method like
+        # "scrypt" is stored with its full parameters ("scrypt:32768:8:1")
+        current_method = _dummy_password_hash().split('$', 1)[0]
+        return self.password_hash.split('$', 1)[0] != current_method
+
+    @classmethod
+    def authenticate(cls, username: str, password: str) -> 'User | None':
+        """
+        Look up a user by username and verify the password.
+
+        Unknown usernames are checked against a dummy hash of the configured
+        method, so a failed login takes as long whether or not the user exists.
+
+        Args:
+            username: Username from the login form
+            password: Password from the login form
+
+        Returns:
+            User if the credentials are valid, None otherwise
+        """
+        user = cls.query.filter_by(username=username).first()
+
+        if user is None:
+            check_password_hash(_dummy_password_hash(), password)
+            return None
+
+        return user if user.check_password(password) else None
+
+    @classmethod
+    def find_conflict(cls, username: str | None = None, email: str | None = None,
+                      exclude_id: int | None = None) -> str | None:
+        """
+        Check username and email uniqueness with a single query.
+
+        Args:
+            username: Username to check (skipped if None)
+            email: Email to check (skipped if None)
+            exclude_id: ID of a user to ignore (e.g. the user being updated)
+
+        Returns:
+            'username' or 'email' for the conflicting field (username wins), None if both are free
+        """
+        conditions = []
+        if username is not None:
+            conditions.append(cls.username == username)
+        if email is not None:
+            conditions.append(cls.email == email)
+        if not conditions:
+            return None
+
+        query = db.session.query(cls.username, cls.email).filter(or_(*conditions))
+        if exclude_id is not None:
+            query = query.filter(cls.id != exclude_id)
+
+        # Unique constraints allow at most one match per field
+        matches = query.limit(2).all()
+        if username is not None and any(row.username == username for row in matches):
+            return 'username'
+        if email is not None and any(row.email == email for row in matches):
+            return 'email'
+        return None
+
+    @classmethod
+    def with_list_count(cls):
+        """
+        Query users together with their number of lists, trashed ones included.
+
+        Used to load a user for the audit log before deleting it, so the
+        count comes with the row instead of as a separate query.
+
+        Returns:
+            Query yielding ``(User, list_count)`` rows
+        """
+        counts = ShoppingList.count_by_user(include_deleted=True)
+        return db.session.query(
+            cls,
+            db.func.coalesce(counts.c.list_count, 0)
+        ).outerjoin(counts, counts.c.user_id == cls.id)
+
     def __repr__(self) -> str:
         return f'<User {self.username}>'
 
@@ -50,8 +152,19 @@ class ShoppingList(db.Model):
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
     deleted_at = db.Column(db.DateTime, nullable=True, default=None, index=True)
 
-    # Relationships
-    items = db.relationship('ShoppingListItem', backref='shopping_list', lazy='dynamic', cascade='all, delete-orphan', order_by='ShoppingListItem.order_index')
+    __table_args__ = (
+        # Partial index for the overview of active lists (get_lists); id
+        # breaks ties for keyset pagination
+        db.Index(
+            'idx_lists_active_user', user_id, updated_at.desc(), id.desc(),
+            postgresql_where=deleted_at.is_(None), sqlite_where=deleted_at.is_(None)
+        ),
+    )
+
+    # Relationships; many-to-one sides load lazily, which is free when the
+    # related object is already in the session (e.g. the current user)
+    owner = db.relationship('User', back_populates='shopping_lists', lazy='select')
+    items = db.relationship('ShoppingListItem', back_populates='shopping_list', lazy='dynamic', cascade='all, delete-orphan', order_by='ShoppingListItem.order_index')
 
     def __repr__(self) -> str:
         return f'<ShoppingList {self.title}>'
@@ -61,23 +174,44 @@ class ShoppingList(db.Model):
         from flask import url_for
         return url_for('main.view_shared_list', guid=self.guid, _external=True)
 
-    def soft_delete(self) -> None:
-        """Mark this list as deleted and cascade to all items."""
-        self.deleted_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+    def regenerate_guid(self) -> None:
+        """Assign a new GUID, which invalidates the old sharing URL."""
+        self.guid = str(uuid.uuid4())
+
+    def soft_delete(self) -> int:
+        """
+        Mark this list as deleted and cascade to all items.
 
-        # Cascade soft delete to all items
-        for item in self.items:
-            item.soft_delete()
+        Returns:
+            int: Number of active items moved to the trash with the list
+        """
+        now = datetime.now(timezone.utc)
+        self.deleted_at = now
+        self.updated_at = now
+
+        # Cascade soft delete to all items with one UPDATE, sharing the list's
+        # timestamp; items already in the trash keep their own
+        result = db.session.execute(
+            update(ShoppingListItem)
+            .where(
+                ShoppingListItem.shopping_list_id == self.id,
+                ShoppingListItem.deleted_at.is_(None)
+            )
+            .values(deleted_at=now)
+        )
+        return result.rowcount
 
     def restore(self) -> None:
         """Restore this list from trash and cascade to all items."""
         self.deleted_at = None
         self.updated_at = datetime.now(timezone.utc)
 
-        # Cascade restore to all items
-        for item in self.items:
-            item.restore()
+        # Cascade restore to all items with one UPDATE
+        db.session.execute(
+            update(ShoppingListItem)
+            .where(ShoppingListItem.shopping_list_id == self.id)
+            .values(deleted_at=None)
+        )
 
     @property
     def is_deleted(self) -> bool:
@@ -94,6 +228,46 @@ class ShoppingList(db.Model):
         """Query for deleted lists (trash)."""
         return cls.query.filter(cls.deleted_at.isnot(None))
 
+    @classmethod
+    def count_by_user(cls, include_deleted: bool = False):
+        """
+        Build a subquery with the number of shopping lists per user.
+
+        Outer-join it on ``user_id`` to get list counts in the same statement.
+
+        Args:
+            include_deleted: Also count soft-deleted lists
+
+        Returns:
+            Subquery with the columns ``user_id`` and ``list_count``
+        """
+        query = db.session.query(
+            cls.user_id,
+            db.func.count(cls.id).label('list_count')
+        )
+
+        if not include_deleted:
+            query = query.filter(cls.deleted_at.is_(None))
+
+        return query.group_by(cls.user_id).subquery()
+
+    @classmethod
+    def with_item_count(cls):
+        """
+        Query lists together with their number of items, trashed ones included.
+
+        Used to load a list for the audit log before deleting it for good, so
+        the count comes with the row instead of as a separate query.
+
+        Returns:
+            Query yielding ``(ShoppingList, item_count)`` rows
+        """
+        counts = ShoppingListItem.count_by_list(include_deleted=True)
+        return db.session.query(
+            cls,
+            db.func.coalesce(counts.c.item_count, 0)
+        ).outerjoin(counts, counts.c.shopping_list_id == cls.id)
+
     def check_version(self, expected_version: int) -> None:
         """
         Check if the expected version matches the current version.
@@ -135,12 +309,35 @@ class ShoppingListItem(db.Model):
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     deleted_at = db.Column(db.DateTime, nullable=True, default=None, index=True)
 
+    __table_args__ = (
+        # Partial indexes: active items in display order, and the trash
+        db.Index(
+            'idx_items_active_list', shopping_list_id, order_index.desc(), id.desc(),
+            postgresql_where=deleted_at.is_(None), sqlite_where=deleted_at.is_(None)
+        ),
+        db.Index(
+            'idx_items_deleted', shopping_list_id, deleted_at.desc(),
+            postgresql_where=deleted_at.isnot(None), sqlite_where=deleted_at.isnot(None)
+        ),
+    )
+
+    # Relationships
+    shopping_list = db.relationship('ShoppingList', back_populates='items', lazy='select')
+
+    # Spacing used when renumbering, leaves room to move items between neighbours
+    ORDER_GAP = 1024
+
     def __repr__(self) -> str:
         return f'<ShoppingListItem {self.name}>'
 
-    def soft_delete(self) -> None:
-        """Mark this item as deleted."""
-        self.deleted_at = datetime.now(timezone.utc)
+    def soft_delete(self, deleted_at: datetime | None = None) -> None:
+        """
+        Mark this item as deleted.
+
+        Args:
+            deleted_at: Timestamp to record (default: now)
+        """
+        self.deleted_at = deleted_at or datetime.now(timezone.utc)
 
     def restore(self) -> None:
         """Restore this item from trash."""
@@ -151,6 +348,120 @@ class ShoppingListItem(db.Model):
         """Check if this item is soft deleted."""
         return self.deleted_at is not None
 
+    def move_between(self, before: 'ShoppingListItem | None', after: 'ShoppingListItem | None') -> None:
+        """
+        Move this item between two neighbours of the same list.
+
+        Items are shown by descending order_index, so ``before`` (shown above)
+        has the higher index. Usually only this item's index changes; if the
+        neighbours have no free index left between them, the list is
+        renumbered once with ORDER_GAP spacing.
+
+        Args:
+            before: Item that should be shown directly above, or None for the top
+            after: Item that should be shown directly below, or None for the bottom
+
+        Raises:
+            ValueError: If ``before`` is not shown above ``after``
+        """
+        new_index = self._index_between(before, after)
+
+        if new_index is None:
+            self.rebalance_order(self.shopping_list_id)
+            new_index = self._index_between(before, after)
+
+            if new_index is None:
+                raise ValueError('before must be shown above after')
+
+        self.order_index = new_index
+
+    @staticmethod
+    def _index_between(before: 'ShoppingListItem | None', after: 'ShoppingListItem | None') -> int | None:
+        """Return a free index between two neighbours, or None if there is none."""
+        # Keep indexes non-negative: the bottom of the list is bounded by -1
+        lower = after.order_index if after else -1
+        upper = before.order_index if before else lower + 2 * ShoppingListItem.ORDER_GAP
+
+        if upper - lower < 2:
+            return None
+
+        return (upper + lower) // 2
+
+    @classmethod
+    def count_by_list(cls, include_deleted: bool = False):
+        """
+        Build a subquery with the number of items per shopping list.
+
+        Outer-join it on ``shopping_list_id`` to get item counts for a whole
+        page of lists in the same statement.
+
+        Args:
+            include_deleted: Also count soft-deleted items
+
+        Returns:
+            Subquery with the columns ``shopping_list_id`` and ``item_count``
+        """
+        query = db.session.query(
+            cls.shopping_list_id,
+            db.func.count(cls.id).label('item_count')
+        )
+
+        if not include_deleted:
+            query = query.filter(cls.deleted_at.is_(None))
+
+        return query.group_by(cls.shopping_list_id).subquery()
+
+    @classmethod
+    def rebalance_order(cls, list_id: int) -> None:
+        """
+        Renumber the active items of a list with ORDER_GAP spacing.
+
+        Keeps the current display order (ties are broken by ID).
+
+        Args:
+            list_id: ID of the shopping list
+        """
+        items = cls.active().filter_by(shopping_list_id=list_id).order_by(
+            cls.order_index.asc(), cls.id.asc()
+        ).all()
+
+        for position, item in enumerate(items, start=1):
+            item.order_index = position * cls.ORDER_GAP
+
+    @classmethod
+    def bulk_set(cls, list_id: int, column: str, values_by_id: dict) -> bool:
+        """
+        Set one column of several active items of a list in a single UPDATE.
+
+        A CASE maps each ID to its new value. The list filter keeps foreign
+        items out, so fewer updated rows than IDs means an unknown or foreign
+        ID; the update is rolled back in that case.
+
+        Args:
+            list_id: ID of the shopping list
+            column: Name of the column to set
+            values_by_id: New value per item ID
+
+        Returns:
+            bool: True if every item was updated, False after a rollback
+        """
+        result = db.session.execute(
+            update(cls)
+            .where(
+                cls.id.in_(values_by_id),
+                cls.shopping_list_id == list_id,
+                cls.deleted_at.is_(None)
+            )
+            .values({column: case(values_by_id, value=cls.id)})
+            .execution_options(synchronize_session=False)
+        )
+
+        if result.rowcount != len(values_by_id):
+            db.session.rollback()
+            return False
+
+        return True
+
     @classmethod
     def active(cls):
         """Query for active (non-deleted) items."""
@@ -161,6 +472,50 @@ class ShoppingListItem(db.Model):
         """Query for deleted items (trash)."""
         return cls.query.filter(cls.deleted_at.isnot(None))
 
+    @classmethod
+    def active_rows(cls, list_id: int) -> list:
+        """
+        Load the active items of a list in display order as plain rows.
+
+        Read-only endpoints only serialize the items, so skipping ORM objects
+        and the identity map makes large lists noticeably cheaper to load.
+
+        Args:
+            list_id: Shopping list ID
+
+        Returns:
+            list: Rows with id, name, quantity, is_checked, order_index,
+                version and created_at
+        """
+        return db.session.query(
+            cls.id, cls.name, cls.quantity, cls.is_checked,
+            cls.order_index, cls.version, cls.created_at
+        ).filter(
+            cls.shopping_list_id == list_id,
+            cls.deleted_at.is_(None)
+        ).order_by(cls.order_index.desc(), cls.id.desc()).all()
+
+    @classmethod
+    def next_order_index(cls, list_id: int):
+        """
+        Build the order_index for a new item at the top of a list.
+
+        Assign the result to ``order_index`` and the maximum is computed
+        inside the INSERT itself, instead of a separate SELECT beforehand.
+
+        Args:
+            list_id: Shopping list ID
+
+        Returns:
+            Scalar subquery yielding the highest active order_index plus one
+        """
+        return db.session.query(
+            db.func.coalesce(db.func.max(cls.order_index), 0) + 1
+        ).filter(
+            cls.shopping_list_id == list_id,
+            cls.deleted_at.is_(None)
+        ).scalar_subquery()
+
     def check_version(self, expected_version: int) -> None:
         """
         Check if the expected version matches the current version.
@@ -230,5 +585,5 @@ class RevokedToken(db.Model):
 @login_manager.user_loader
 def load_user(user_id: str) -> User | None:
     # Flask-Login erwartet hier die Rückgabe eines User-Objekts oder None
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
 
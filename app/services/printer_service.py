@@ -83,7 +83,9 @@ class PrinterService:
             status['details'].append(f"✓ Netzwerk erreichbar unter {self.host}:{self.port}")
             status['details'].append(f"✓ Antwortzeit: {status['response_time_ms']} ms")
 
-            current_app.logger.info(f"Network test successful: {self.host}:{self.port} ({response_time:.2f}ms)")
+            current_app.logger.info(
+                "Network test successful: %s:%s (%.2fms)", self.host, self.port, response_time
+            )
 
         except socket.timeout:
             status['error_message'] = f"Zeitüberschreitung bei Verbindung zu {self.host}:{self.port}"
@@ -96,13 +98,13 @@ class PrinterService:
             status['error_message'] = f"Verbindungsfehler zu {self.host}:{self.port}"
             status['details'].append(f"✗ Socket-Fehler: {str(e)}")
             status['details'].append("Mögliche Ursachen: Port blockiert, Firewall, falscher Port")
-            current_app.logger.error(f"{status['error_message']}: {e}")
+            current_app.logger.error("%s: %s", status['error_message'], e)
             return status
 
         except Exception as e:
             status['error_message'] = f"Unerwarteter Fehler beim Netzwerk-Test"
             status['details'].append(f"✗ Fehler: {str(e)}")
-            current_app.logger.error(f"{status['error_message']}: {e}")
+            current_app.logger.error("%s: %s", status['error_message'], e)
             return status
 
         # Test 2: ESC/POS Connection Test (only if network is reachable)
@@ -119,7 +121,7 @@ class PrinterService:
             except Exception as e:
                 status['details'].append(f"⚠ ESC/POS Verbindung fehlgeschlagen: {str(e)}")
                 status['details'].append("Hinweis: Netzwerk ist erreichbar, aber ESC/POS Protokoll antwortet nicht korrekt")
-                current_app.logger.warning(f"ESC/POS connection failed: {e}")
+                current_app.logger.warning("ESC/POS connection failed: %s", e)
 
         return status
 
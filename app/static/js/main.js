@@ -185,6 +185,8 @@ class ShoppingListManager {
   constructor() {
     this.itemsList = document.getElementById('shopping-items');
     this.addItemForm = document.getElementById('add-item-form');
+    this.pendingToggles = new Map();
+    this.toggleTimer = null;
 
     this.init();
   }
@@ -195,6 +197,9 @@ class ShoppingListManager {
     // Attach event listeners to checkboxes
     this.attachCheckboxListeners();
 
+    // Send clicks still waiting for the debounce before the page is left
+    window.addEventListener('pagehide', () => this.flushToggles());
+
     // Attach event listeners for inline editing
     this.attachEditListeners();
 
@@ -214,47 +219,61 @@ class ShoppingListManager {
     });
   }
 
-  async toggleItem(checkbox) {
+  toggleItem(checkbox) {
     const itemId = checkbox.dataset.itemId;
     const listItem = checkbox.closest('.shopping-item');
 
     // Optimistic update
-    if (checkbox.checked) {
-      listItem.classList.add('checked');
-    } else {
-      listItem.classList.remove('checked');
+    listItem.classList.toggle('checked', checkbox.checked);
+
+    // Clicks in quick succession are sent together in one request; keep the
+    // state from before the first click for a rollback
+    if (!this.pendingToggles.has(itemId)) {
+      this.pendingToggles.set(itemId, { checkbox, previous: !checkbox.checked });
     }
+    clearTimeout(this.toggleTimer);
+    this.toggleTimer = setTimeout(() => this.flushToggles(), 200);
+  }
+
+  async flushToggles() {
+    const toggles = Array.from(this.pendingToggles.values());
+    this.pendingToggles.clear();
+    if (toggles.length === 0) return;
+
+    const rollback = () => {
+      toggles.forEach(({ checkbox, previous }) => {
+        checkbox.checked = previous;
+        checkbox.closest('.shopping-item').classList.toggle('checked', previous);
+      });
+    };
 
     try {
-      const response = await fetch(`/items/${itemId}/toggle`, {
+      const response = await fetch(`/lists/${this.itemsList.dataset.listId}/items/toggle`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
-        credentials: 'same-origin'
+        credentials: 'same-origin',
+        keepalive: true,
+        body: JSON.stringify({
+          items: toggles.map(({ checkbox }) => ({
+            id: Number(checkbox.dataset.itemId),
+            is_checked: checkbox.checked
+          }))
+        })
       });
 
       const data = await response.json();
 
       if (!data.success) {
         // Rollback on error
-        checkbox.checked = !checkbox.checked;
-        if (checkbox.checked) {
-          listItem.classList.add('checked');
-        } else {
-          listItem.classList.remove('checked');
-        }
+        rollback();
         this.showToast('Fehler beim Aktualisieren des Artikels', 'danger');
       }
     } catch (error) {
-      console.error('Error toggling item:', error);
+      console.error('Error toggling items:', error);
       // Rollback on error
-      checkbox.checked = !checkbox.checked;
-      if (checkbox.checked) {
-        listItem.classList.add('checked');
-      } else {
-        listItem.classList.remove('checked');
-      }
+      rollback();
       this.showToast('Netzwerkfehler beim Aktualisieren', 'danger');
     }
   }
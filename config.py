@@ -1,9 +1,36 @@
 import os
 from datetime import timedelta
 
+from sqlalchemy.pool import NullPool
+
+
+def _engine_options(database_uri: str) -> dict:
+    """Connection pool settings for server databases; SQLite keeps SQLAlchemy's defaults."""
+    if database_uri.startswith('sqlite'):
+        return {}
+
+    # PgBouncer already pools connections; a second pool in each worker only
+    # holds server slots idle
+    if os.environ.get('DB_USE_PGBOUNCER', 'false').lower() == 'true':
+        return {'poolclass': NullPool, 'pool_pre_ping': True}
+
+    # Sized per Gunicorn worker from its thread count, so every thread gets a
+    # connection without waiting on the pool
+    threads = int(os.environ.get('GUNICORN_THREADS') or 2)
+
+    return {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE') or 2 * threads),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW') or 4 * threads),
+        # Drop connections closed by a database restart before they are used
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+    }
+
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret')
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
     # JWT Configuration
@@ -29,10 +56,20 @@ class Config:
     API_MAX_PER_PAGE = 100
 
     # Rate Limiting Configuration
-    RATELIMIT_STORAGE_URL = os.environ.get('RATELIMIT_STORAGE_URL', 'memory://')
+    # Shared Redis storage keeps limits consistent across Gunicorn workers;
+    # the Redis client keeps a connection pool and checks run as a single script call
+    RATELIMIT_STORAGE_URI = os.environ.get('RATELIMIT_STORAGE_URL', 'memory://')
+    RATELIMIT_STORAGE_OPTIONS = {'socket_timeout': 1, 'socket_connect_timeout': 1}
+    # Keep limiting per worker in memory while Redis is unreachable instead
+    # of failing every rate-limited request (login included) with a 500
+    RATELIMIT_IN_MEMORY_FALLBACK_ENABLED = True
     RATELIMIT_STRATEGY = 'fixed-window'
     RATELIMIT_HEADERS_ENABLED = True
 
+    # Werkzeug hash method including its cost parameters; stored hashes with a
+    # different prefix are re-hashed on the next successful login
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+
     # Logging Configuration
     LOG_TO_FILE = True
     LOG_FILE_PATH = 'logs/app.log'
@@ -68,13 +105,21 @@ class ProductionConfig(Config):
     CORS_ORIGINS = [origin.strip() for origin in os.environ.get('CORS_ORIGINS', '').split(',') if origin.strip()]
 
     # Performance Optimizations
-    COMPRESS_ALGORITHM = 'gzip'
+    # Brotli for clients that accept it (all current browsers), gzip otherwise;
+    # quality 5 compresses dynamic HTML/JSON better than gzip at similar CPU cost
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_BR_LEVEL = 5
     COMPRESS_LEVEL = 6
     COMPRESS_MIN_SIZE = 500  # Komprimiere nur Responses > 500 bytes
 
     # Asset Caching
     SEND_FILE_MAX_AGE_DEFAULT = 31536000  # 1 Jahr für statische Files
 
+    # Templates nicht bei jedem Rendern auf Änderungen prüfen; kompilierte
+    # Templates im Bytecode-Cache (Temp-Verzeichnis) ablegen
+    TEMPLATES_AUTO_RELOAD = False
+    TEMPLATE_BYTECODE_CACHE = True
+
     # Logging - Nur Warnings und Errors in Production
     LOG_LEVEL = 'WARNING'
 
@@ -96,5 +141,9 @@ class ProductionConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    RATELIMIT_STORAGE_URI = 'memory://'
+    # Cheap hashes keep fixtures and login tests fast
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=5)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=1)
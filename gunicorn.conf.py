@@ -0,0 +1,23 @@
+"""
+Gunicorn server hooks.
+
+Gunicorn loads this file automatically from the working directory. Worker
+count, threads and worker class are passed on the command line (see
+Dockerfile and start-production.sh).
+"""
+
+
+def post_fork(server, worker):
+    """Make psycopg2 cooperative when running gevent workers."""
+    if server.cfg.worker_class_str != 'gevent':
+        return
+
+    try:
+        from psycogreen.gevent import patch_psycopg
+    except ImportError:
+        server.log.warning(
+            'gevent-Worker ohne psycogreen: Datenbankabfragen blockieren den Worker'
+        )
+        return
+
+    patch_psycopg()
@@ -0,0 +1,47 @@
+"""add partial indexes for active and deleted rows
+
+Revision ID: 7f7a5390e7be
+Revises: aace83301714
+Create Date: 2026-10-16 13:40:12.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7f7a5390e7be'
+down_revision = 'aace83301714'
+branch_labels = None
+depends_on = None
+
+
+ACTIVE = sa.text('deleted_at IS NULL')
+DELETED = sa.text('deleted_at IS NOT NULL')
+
+
+def upgrade():
+    with op.batch_alter_table('shopping_list_items', schema=None) as batch_op:
+        batch_op.create_index(
+            'idx_items_active_list', ['shopping_list_id', sa.text('order_index DESC'), sa.text('id DESC')],
+            unique=False, postgresql_where=ACTIVE, sqlite_where=ACTIVE
+        )
+        batch_op.create_index(
+            'idx_items_deleted', ['shopping_list_id', sa.text('deleted_at DESC')],
+            unique=False, postgresql_where=DELETED, sqlite_where=DELETED
+        )
+
+    with op.batch_alter_table('shopping_lists', schema=None) as batch_op:
+        batch_op.create_index(
+            'idx_lists_active_user', ['user_id', sa.text('updated_at DESC'), sa.text('id DESC')],
+            unique=False, postgresql_where=ACTIVE, sqlite_where=ACTIVE
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('shopping_lists', schema=None) as batch_op:
+        batch_op.drop_index('idx_lists_active_user')
+
+    with op.batch_alter_table('shopping_list_items', schema=None) as batch_op:
+        batch_op.drop_index('idx_items_deleted')
+        batch_op.drop_index('idx_items_active_list')
@@ -150,6 +150,8 @@ echo ""
 WORKERS=${GUNICORN_WORKERS:-4}
 THREADS=${GUNICORN_THREADS:-2}
 TIMEOUT=${GUNICORN_TIMEOUT:-60}
+WORKER_CLASS=${GUNICORN_WORKER_CLASS:-gthread}
+WORKER_CONNECTIONS=${GUNICORN_WORKER_CONNECTIONS:-1000}
 PORT=${FLASK_RUN_PORT:-8000}
 
 echo "=========================================="
@@ -160,6 +162,7 @@ echo "  Host:       ${FLASK_RUN_HOST:-0.0.0.0}"
 echo "  Port:       ${PORT}"
 echo "  Workers:    ${WORKERS}"
 echo "  Threads:    ${THREADS}"
+echo "  Class:      ${WORKER_CLASS}"
 echo "  Timeout:    ${TIMEOUT}s"
 echo "=========================================="
 echo ""
@@ -169,6 +172,8 @@ gunicorn \
     --bind ${FLASK_RUN_HOST:-0.0.0.0}:${PORT} \
     --workers ${WORKERS} \
     --threads ${THREADS} \
+    --worker-class ${WORKER_CLASS} \
+    --worker-connections ${WORKER_CONNECTIONS} \
     --timeout ${TIMEOUT} \
     --access-logfile logs/access.log \
     --error-logfile logs/error.log \
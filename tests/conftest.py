@@ -8,6 +8,7 @@ database state, authentication, and test data.
 import pytest
 from datetime import datetime, timezone, timedelta
 from flask_jwt_extended import create_access_token, create_refresh_token
+from sqlalchemy import event
 
 from app import create_app
 from app.extensions import db
@@ -65,6 +66,92 @@ def runner(app):
     return app.test_cli_runner()
 
 
+@pytest.fixture(scope='function')
+def query_counter(app):
+    """
+    Record the SQL statements executed while a test runs.
+
+    Used to guard endpoints against N+1 queries: the number of statements
+    for a request must not grow with the number of rows it returns.
+
+    Args:
+        app: Flask application fixture
+
+    Returns:
+        list: Executed SQL statements (cleared by the test as needed)
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', record)
+
+
+@pytest.fixture(scope='function')
+def assert_query_count_constant(query_counter):
+    """
+    Check that a GET endpoint issues the same number of queries for more rows.
+
+    The returned helper calls ``add_rows(2)``, requests ``url`` twice (the
+    first request warms up one-time per-app checks), then calls
+    ``add_rows(5)`` and requests ``url`` again. Both counted requests must
+    execute the same number of SQL statements.
+
+    Args:
+        query_counter: Query counter fixture
+
+    Returns:
+        callable: ``check(client, url, headers, add_rows)``
+    """
+    def count_queries(client, url, headers):
+        db.session.expire_all()
+        query_counter.clear()
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        return len(query_counter)
+
+    def check(client, url, headers, add_rows):
+        add_rows(2)
+        count_queries(client, url, headers)
+        queries_for_two = count_queries(client, url, headers)
+
+        add_rows(5)
+        assert count_queries(client, url, headers) == queries_for_two
+
+    return check
+
+
+@pytest.fixture(scope='function')
+def add_lists(app, regular_user):
+    """
+    Return a factory adding lists with one item each for the regular user.
+
+    Meant as ``add_rows`` for ``assert_query_count_constant``.
+
+    Args:
+        app: Flask application fixture
+        regular_user: Regular user fixture
+
+    Returns:
+        callable: ``add_lists(count, trash_items=False)``
+    """
+    def add(count, trash_items=False):
+        for index in range(count):
+            shopping_list = ShoppingList(title=f'Liste {index}', user_id=regular_user.id)
+            db.session.add(shopping_list)
+            db.session.flush()
+            item = ShoppingListItem(shopping_list_id=shopping_list.id, name='Milch')
+            if trash_items:
+                item.soft_delete()
+            db.session.add(item)
+        db.session.commit()
+
+    return add
+
+
 # ============================================================================
 # User Fixtures
 # ============================================================================
@@ -241,6 +328,24 @@ def another_user_headers(app, another_user):
     }
 
 
+@pytest.fixture(scope='function')
+def user_client(client, regular_user):
+    """
+    Get a test client logged in to the web interface as the regular user.
+
+    Args:
+        client: Test client fixture
+        regular_user: Regular user fixture
+
+    Returns:
+        FlaskClient: Test client with a Flask-Login session
+    """
+    with client.session_transaction() as session:
+        session['_user_id'] = str(regular_user.id)
+        session['_fresh'] = True
+    return client
+
+
 # ============================================================================
 # Shopping List Fixtures
 # ============================================================================
@@ -69,6 +69,28 @@ class TestAdminUsers:
 
         assert data['data']['is_admin'] is True
 
+    def test_admin_create_user_with_existing_email_returns_409(self, client, app, admin_headers, regular_user):
+        """Test that creating a user with a taken email is rejected."""
+        response = client.post('/api/v1/users', headers=admin_headers, json={
+            'username': 'newuser',
+            'email': 'user@test.com',
+            'password': 'SecurePass123'
+        })
+
+        assert response.status_code == 409
+        assert response.get_json()['error']['message'] == 'E-Mail-Adresse bereits registriert'
+
+    def test_admin_update_user_with_existing_username_returns_409(self, client, app, admin_headers, regular_user, another_user):
+        """Test that renaming a user to a taken username is rejected."""
+        user_id = another_user.id
+
+        response = client.put(f'/api/v1/users/{user_id}', headers=admin_headers, json={
+            'username': 'regular_test'
+        })
+
+        assert response.status_code == 409
+        assert response.get_json()['error']['message'] == 'Benutzername bereits vergeben'
+
     def test_regular_user_cannot_create_users(self, client, app, user_headers):
         """Test that regular users cannot create users."""
         response = client.post('/api/v1/users', headers=user_headers, json={
@@ -93,6 +115,12 @@ class TestAdminUsers:
         # Verify deletion
         assert User.query.get(user_id) is None
 
+    def test_admin_delete_nonexistent_user_returns_404(self, client, app, admin_headers):
+        """Test that deleting an unknown user returns 404."""
+        response = client.delete('/api/v1/users/99999', headers=admin_headers)
+
+        assert response.status_code == 404
+
     def test_admin_cannot_delete_self(self, client, app, admin_headers, admin_user):
         """Test that admin cannot delete their own account."""
         response = client.delete(f'/api/v1/users/{admin_user.id}', headers=admin_headers)
@@ -240,6 +268,18 @@ class TestAdminLists:
         for list_data in data['data']:
             assert list_data['is_shared'] is True
 
+    def test_admin_get_all_lists_includes_item_count(self, client, app, admin_headers, sample_list, sample_item, checked_item):
+        """Test that each list carries the number of its items."""
+        response = client.get('/api/v1/admin/lists', headers=admin_headers)
+
+        assert response.status_code == 200
+        list_data = next(item for item in response.get_json()['data'] if item['id'] == sample_list.id)
+        assert list_data['item_count'] == 2
+
+    def test_admin_get_all_lists_query_count_does_not_grow_with_lists(self, client, app, admin_headers, add_lists, assert_query_count_constant):
+        """Test that listing does not issue one COUNT per list (N+1)."""
+        assert_query_count_constant(client, '/api/v1/admin/lists', admin_headers, add_lists)
+
     def test_admin_delete_any_list_returns_200(self, client, app, admin_headers, sample_list):
         """Test that admin can delete any user's list."""
         list_id = sample_list.id
@@ -457,6 +497,14 @@ class TestUserResourceAccess:
 
         assert len(data['data']) >= 1
 
+    def test_user_get_own_lists_includes_item_count(self, client, app, user_headers, regular_user, sample_list, sample_item):
+        """Test that the user's lists carry their item counts."""
+        response = client.get(f'/api/v1/users/{regular_user.id}/lists', headers=user_headers)
+
+        assert response.status_code == 200
+        list_data = next(item for item in response.get_json()['data'] if item['id'] == sample_list.id)
+        assert list_data['item_count'] == 1
+
     def test_user_cannot_get_other_user_lists(self, client, app, user_headers, admin_user):
         """Test that users cannot get other users' lists."""
         response = client.get(f'/api/v1/users/{admin_user.id}/lists', headers=user_headers)
@@ -6,10 +6,13 @@ Tests user registration, login, token refresh, logout, and password management.
 
 import pytest
 import json
-from flask_jwt_extended import decode_token
+from flask_jwt_extended import create_access_token, create_refresh_token, decode_token
+from werkzeug.security import generate_password_hash
 
+from app import create_app
 from app.models import User, RevokedToken
 from app.extensions import db
+from config import TestingConfig
 
 
 # ============================================================================
@@ -155,6 +158,49 @@ class TestLogin:
         assert 'access_token' in data['data']['tokens']
         assert 'refresh_token' in data['data']['tokens']
 
+    def test_login_upgrades_outdated_password_hash(self, client, app, regular_user):
+        """Test that a hash with another method is replaced on successful login."""
+        regular_user.password_hash = generate_password_hash('UserPass123', method='pbkdf2:sha256:500')
+        db.session.commit()
+
+        response = client.post('/api/v1/auth/login', json={
+            'username': 'regular_test',
+            'password': 'UserPass123'
+        })
+
+        assert response.status_code == 200
+
+        user = User.query.filter_by(username='regular_test').first()
+        assert user.password_hash.startswith(app.config['PASSWORD_HASH_METHOD'] + '$')
+        assert user.check_password('UserPass123') is True
+
+    def test_login_works_while_rate_limit_storage_is_unreachable(self):
+        """Test that login falls back to in-memory rate limiting when Redis is down."""
+        pytest.importorskip('redis')
+
+        class UnreachableStorageConfig(TestingConfig):
+            RATELIMIT_STORAGE_URI = 'redis://127.0.0.1:1/0'
+
+        app = create_app(UnreachableStorageConfig)
+        with app.app_context():
+            db.create_all()
+            try:
+                user = User(username='regular_test', email='user@test.com')
+                user.set_password('UserPass123')
+                db.session.add(user)
+                db.session.commit()
+
+                response = app.test_client().post('/api/v1/auth/login', json={
+                    'username': 'regular_test',
+                    'password': 'UserPass123'
+                })
+
+                assert response.status_code == 200
+                assert 'access_token' in response.get_json()['data']['tokens']
+            finally:
+                db.session.remove()
+                db.drop_all()
+
     def test_login_with_invalid_username_returns_401(self, client, app):
         """Test that login with non-existent username returns 401."""
         response = client.post('/api/v1/auth/login', json={
@@ -205,6 +251,18 @@ class TestLogin:
 
         assert data['data']['user']['is_admin'] is True
 
+    def test_login_tokens_carry_username_claim(self, client, app, regular_user):
+        """Test that issued tokens contain the username as additional claim."""
+        response = client.post('/api/v1/auth/login', json={
+            'username': 'regular_test',
+            'password': 'UserPass123'
+        })
+
+        tokens = response.get_json()['data']['tokens']
+
+        assert decode_token(tokens['access_token'])['username'] == 'regular_test'
+        assert decode_token(tokens['refresh_token'])['username'] == 'regular_test'
+
 
 # ============================================================================
 # Token Refresh Tests
@@ -226,6 +284,22 @@ class TestTokenRefresh:
         assert data['success'] is True
         assert 'access_token' in data['data']
 
+    def test_refresh_takes_username_claim_from_current_user(self, client, app, regular_user):
+        """Test that a renamed user gets the new name in refreshed access tokens."""
+        refresh_token = create_refresh_token(
+            identity=str(regular_user.id), additional_claims={'username': 'regular_test'}
+        )
+        regular_user.username = 'renamed_user'
+        db.session.commit()
+
+        response = client.post('/api/v1/auth/refresh', headers={
+            'Authorization': f'Bearer {refresh_token}'
+        })
+
+        assert response.status_code == 200
+        access_token = response.get_json()['data']['access_token']
+        assert decode_token(access_token)['username'] == 'renamed_user'
+
     def test_refresh_with_access_token_returns_422(self, client, app, user_headers):
         """Test that using access token for refresh returns 422."""
         response = client.post('/api/v1/auth/refresh', headers=user_headers)
@@ -274,6 +348,23 @@ class TestLogout:
         decoded = decode_token(token)
         assert RevokedToken.is_jti_blacklisted(decoded['jti']) is True
 
+    def test_logout_logs_current_username(self, client, app, regular_user, caplog):
+        """Test that logout logs the current name, not a stale token claim."""
+        access_token = create_access_token(
+            identity=str(regular_user.id), additional_claims={'username': 'regular_test'}
+        )
+        regular_user.username = 'renamed_user'
+        db.session.commit()
+
+        with caplog.at_level('INFO'):
+            response = client.post('/api/v1/auth/logout', headers={
+                'Authorization': f'Bearer {access_token}'
+            })
+
+        assert response.status_code == 200
+        assert 'Benutzer "renamed_user"' in caplog.text
+        assert 'regular_test' not in caplog.text
+
     def test_logout_without_token_returns_401(self, client, app):
         """Test that logout without token returns 401."""
         response = client.post('/api/v1/auth/logout', headers={
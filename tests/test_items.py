@@ -6,6 +6,7 @@ Tests CRUD operations, toggling, reordering, and bulk operations for items.
 
 import pytest
 import json
+from datetime import datetime
 
 from app.models import ShoppingList, ShoppingListItem
 from app.extensions import db
@@ -40,6 +41,21 @@ class TestGetItems:
         assert sample_item.id in item_ids
         assert deleted_item.id not in item_ids
 
+    def test_get_items_with_equal_order_index_lists_newest_first(self, client, app, user_headers, sample_list):
+        """Test that items sharing an order_index are ordered by descending id."""
+        items = [
+            ShoppingListItem(shopping_list_id=sample_list.id, name=f'Item {i}', order_index=5)
+            for i in range(3)
+        ]
+        db.session.add_all(items)
+        db.session.commit()
+
+        response = client.get(f'/api/v1/lists/{sample_list.id}/items', headers=user_headers)
+
+        assert response.status_code == 200
+        item_ids = [item['id'] for item in response.get_json()['data']]
+        assert item_ids == sorted((item.id for item in items), reverse=True)
+
     def test_get_items_for_shared_list_returns_200(self, client, app, another_user_headers, shared_list):
         """Test that getting items from shared list works."""
         # Add item to shared list
@@ -67,6 +83,59 @@ class TestGetItems:
 
         assert response.status_code == 404
 
+    def test_get_items_with_matching_etag_returns_304(self, client, app, user_headers, sample_list, sample_item):
+        """Test that an unchanged list is answered with 304 Not Modified."""
+        response = client.get(f'/api/v1/lists/{sample_list.id}/items', headers=user_headers)
+        etag = response.headers.get('ETag')
+
+        assert etag is not None
+
+        response = client.get(
+            f'/api/v1/lists/{sample_list.id}/items',
+            headers={**user_headers, 'If-None-Match': etag}
+        )
+
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_get_items_etag_survives_compression(self, client, app, user_headers, sample_list, query_counter):
+        """Test that the ETag of a gzip-compressed response still skips the items query."""
+        db.session.add_all([
+            ShoppingListItem(shopping_list_id=sample_list.id, name=f'Artikel {index}', order_index=index)
+            for index in range(30)
+        ])
+        db.session.commit()
+
+        headers = {**user_headers, 'Accept-Encoding': 'gzip'}
+        response = client.get(f'/api/v1/lists/{sample_list.id}/items', headers=headers)
+        etag = response.headers.get('ETag')
+
+        assert response.headers.get('Content-Encoding') == 'gzip'
+
+        query_counter.clear()
+        response = client.get(
+            f'/api/v1/lists/{sample_list.id}/items',
+            headers={**headers, 'If-None-Match': etag}
+        )
+
+        assert response.status_code == 304
+        assert not any('FROM shopping_list_items' in statement for statement in query_counter)
+
+    def test_get_items_etag_changes_after_item_update(self, client, app, user_headers, sample_list, sample_item):
+        """Test that modifying an item invalidates the previous ETag."""
+        response = client.get(f'/api/v1/lists/{sample_list.id}/items', headers=user_headers)
+        etag = response.headers.get('ETag')
+
+        client.post(f'/api/v1/items/{sample_item.id}/toggle', headers=user_headers)
+
+        response = client.get(
+            f'/api/v1/lists/{sample_list.id}/items',
+            headers={**user_headers, 'If-None-Match': etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers.get('ETag') != etag
+
 
 # ============================================================================
 # Create Item Tests
@@ -386,6 +455,16 @@ class TestDeleteItem:
 
         assert response.status_code == 404
 
+    def test_nonexistent_item_requests_are_rate_limited(self, client, app, user_headers):
+        """Test that 404 responses still count against the rate limit."""
+        for _ in range(30):
+            response = client.delete('/api/v1/items/99999', headers=user_headers)
+            assert response.status_code == 404
+
+        response = client.delete('/api/v1/items/99999', headers=user_headers)
+
+        assert response.status_code == 429
+
 
 # ============================================================================
 # Toggle Item Tests
@@ -510,6 +589,218 @@ class TestReorderItem:
 
         assert response.status_code == 200
 
+    def test_reorder_item_between_neighbours_only_moves_item(self, client, app, user_headers, sample_list):
+        """Test that moving between neighbours with free indexes leaves them untouched."""
+        top, middle, bottom = [
+            ShoppingListItem(shopping_list_id=sample_list.id, name=name, order_index=index)
+            for name, index in (('Top', 3000), ('Middle', 2000), ('Bottom', 1000))
+        ]
+        db.session.add_all([top, middle, bottom])
+        db.session.commit()
+
+        response = client.put(f'/api/v1/items/{bottom.id}/reorder', headers=user_headers, json={
+            'before_id': top.id,
+            'after_id': middle.id
+        })
+
+        assert response.status_code == 200
+        assert response.get_json()['data']['order_index'] == 2500
+
+        db.session.refresh(top)
+        db.session.refresh(middle)
+        assert top.order_index == 3000
+        assert middle.order_index == 2000
+
+    def test_reorder_item_between_adjacent_indexes_rebalances(self, client, app, user_headers, sample_list):
+        """Test that the list is renumbered when neighbours have no free index between them."""
+        top, middle, bottom = [
+            ShoppingListItem(shopping_list_id=sample_list.id, name=name, order_index=index)
+            for name, index in (('Top', 3), ('Middle', 2), ('Bottom', 1))
+        ]
+        db.session.add_all([top, middle, bottom])
+        db.session.commit()
+
+        response = client.put(f'/api/v1/items/{bottom.id}/reorder', headers=user_headers, json={
+            'before_id': top.id,
+            'after_id': middle.id
+        })
+
+        assert response.status_code == 200
+
+        response = client.get(f'/api/v1/lists/{sample_list.id}/items', headers=user_headers)
+        names = [item['name'] for item in response.get_json()['data']]
+        assert names == ['Top', 'Bottom', 'Middle']
+
+    def test_reorder_item_without_target_returns_400(self, client, app, user_headers, sample_item):
+        """Test that reordering requires an index or a neighbour."""
+        response = client.put(f'/api/v1/items/{sample_item.id}/reorder', headers=user_headers, json={})
+
+        assert response.status_code == 400
+
+
+# ============================================================================
+# Bulk Reorder Tests
+# ============================================================================
+
+class TestBulkReorderItems:
+    """Test POST /api/v1/lists/<id>/items/reorder-bulk endpoint."""
+
+    def test_bulk_reorder_updates_all_items(self, client, app, user_headers, sample_list, multiple_items):
+        """Test that all given indexes are applied in one request."""
+        reversed_order = [
+            {'id': item.id, 'order_index': 10 - item.order_index}
+            for item in multiple_items
+        ]
+
+        response = client.post(f'/api/v1/lists/{sample_list.id}/items/reorder-bulk', headers=user_headers, json={
+            'items': reversed_order
+        })
+
+        assert response.status_code == 200
+        assert response.get_json()['data']['updated_count'] == len(multiple_items)
+
+        response = client.get(f'/api/v1/lists/{sample_list.id}/items', headers=user_headers)
+        names = [item['name'] for item in response.get_json()['data']]
+        assert names == ['Äpfel', 'Bananen', 'Tomaten', 'Käse', 'Nudeln']
+
+    def test_bulk_reorder_with_foreign_item_returns_404_and_changes_nothing(self, client, app, user_headers, sample_list, sample_item, admin_list):
+        """Test that items of other lists are rejected without partial updates."""
+        foreign_item = ShoppingListItem(shopping_list_id=admin_list.id, name='Fremd', order_index=7)
+        db.session.add(foreign_item)
+        db.session.commit()
+        original_index = sample_item.order_index
+
+        response = client.post(f'/api/v1/lists/{sample_list.id}/items/reorder-bulk', headers=user_headers, json={
+            'items': [
+                {'id': sample_item.id, 'order_index': 99},
+                {'id': foreign_item.id, 'order_index': 100}
+            ]
+        })
+
+        assert response.status_code == 404
+
+        db.session.refresh(sample_item)
+        db.session.refresh(foreign_item)
+        assert sample_item.order_index == original_index
+        assert foreign_item.order_index == 7
+
+    def test_bulk_reorder_with_duplicate_ids_returns_400(self, client, app, user_headers, sample_list, sample_item):
+        """Test that an item may only appear once."""
+        response = client.post(f'/api/v1/lists/{sample_list.id}/items/reorder-bulk', headers=user_headers, json={
+            'items': [
+                {'id': sample_item.id, 'order_index': 1},
+                {'id': sample_item.id, 'order_index': 2}
+            ]
+        })
+
+        assert response.status_code == 400
+
+    def test_bulk_reorder_in_shared_list_by_non_owner_returns_403(self, client, app, another_user_headers, shared_list):
+        """Test that only the owner can reorder items."""
+        item = ShoppingListItem(shopping_list_id=shared_list.id, name='Milch')
+        db.session.add(item)
+        db.session.commit()
+
+        response = client.post(f'/api/v1/lists/{shared_list.id}/items/reorder-bulk', headers=another_user_headers, json={
+            'items': [{'id': item.id, 'order_index': 5}]
+        })
+
+        assert response.status_code == 403
+
+
+# ============================================================================
+# Web Batch Toggle Tests
+# ============================================================================
+
+class TestToggleItemsBatch:
+    """Test POST /lists/<id>/items/toggle web endpoint."""
+
+    def test_toggle_batch_applies_statuses_and_touches_list(self, user_client, app, sample_list, sample_item, checked_item):
+        """Test that all statuses are written and the list's updated_at advances."""
+        sample_list.updated_at = datetime(2020, 1, 1)
+        db.session.commit()
+
+        response = user_client.post(f'/lists/{sample_list.id}/items/toggle', json={
+            'items': [
+                {'id': sample_item.id, 'is_checked': True},
+                {'id': checked_item.id, 'is_checked': False}
+            ]
+        })
+
+        assert response.status_code == 200
+        assert response.get_json() == {'success': True, 'updated_count': 2}
+
+        db.session.refresh(sample_item)
+        db.session.refresh(checked_item)
+        db.session.refresh(sample_list)
+        assert sample_item.is_checked is True
+        assert checked_item.is_checked is False
+        assert sample_list.updated_at > datetime(2020, 1, 1)
+
+    def test_toggle_batch_with_foreign_item_returns_404_and_changes_nothing(self, user_client, app, sample_list, sample_item, admin_list):
+        """Test that items of other lists are rejected without partial updates."""
+        foreign_item = ShoppingListItem(shopping_list_id=admin_list.id, name='Fremd')
+        db.session.add(foreign_item)
+        db.session.commit()
+
+        response = user_client.post(f'/lists/{sample_list.id}/items/toggle', json={
+            'items': [
+                {'id': sample_item.id, 'is_checked': True},
+                {'id': foreign_item.id, 'is_checked': True}
+            ]
+        })
+
+        assert response.status_code == 404
+        assert response.get_json()['success'] is False
+
+        db.session.refresh(sample_item)
+        db.session.refresh(foreign_item)
+        assert sample_item.is_checked is False
+        assert foreign_item.is_checked is False
+
+    def test_toggle_batch_with_deleted_item_returns_404_and_changes_nothing(self, user_client, app, sample_list, sample_item, deleted_item):
+        """Test that items in the trash cannot be toggled."""
+        response = user_client.post(f'/lists/{sample_list.id}/items/toggle', json={
+            'items': [
+                {'id': sample_item.id, 'is_checked': True},
+                {'id': deleted_item.id, 'is_checked': True}
+            ]
+        })
+
+        assert response.status_code == 404
+
+        db.session.refresh(sample_item)
+        db.session.refresh(deleted_item)
+        assert sample_item.is_checked is False
+        assert deleted_item.is_checked is False
+
+    def test_toggle_batch_in_other_users_list_returns_403(self, user_client, app, admin_list):
+        """Test that a private list of another user cannot be changed."""
+        item = ShoppingListItem(shopping_list_id=admin_list.id, name='Milch')
+        db.session.add(item)
+        db.session.commit()
+
+        response = user_client.post(f'/lists/{admin_list.id}/items/toggle', json={
+            'items': [{'id': item.id, 'is_checked': True}]
+        })
+
+        assert response.status_code == 403
+
+        db.session.refresh(item)
+        assert item.is_checked is False
+
+    @pytest.mark.parametrize('entries', [
+        [],
+        [{'id': index, 'is_checked': True} for index in range(1, 502)],
+        [{'id': 1, 'is_checked': True}, {'id': 1, 'is_checked': False}],
+    ], ids=['empty', 'too_many', 'duplicate_ids'])
+    def test_toggle_batch_with_invalid_items_returns_400(self, user_client, app, sample_list, entries):
+        """Test that the schema rejects empty, oversized and duplicate batches."""
+        response = user_client.post(f'/lists/{sample_list.id}/items/toggle', json={'items': entries})
+
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
+
 
 # ============================================================================
 # Clear Checked Items Tests
@@ -578,6 +869,22 @@ class TestTrashItems:
         assert deleted_item.id in item_ids
         assert sample_item.id not in item_ids
 
+    def test_get_trash_items_is_paginated(self, client, app, user_headers, multiple_items):
+        """Test that the trash returns at most per_page items plus pagination info."""
+        for item in multiple_items:
+            item.soft_delete()
+        db.session.commit()
+
+        response = client.get('/api/v1/trash/items?page=2&per_page=2', headers=user_headers)
+
+        assert response.status_code == 200
+        data = response.get_json()
+
+        assert len(data['data']) == 2
+        assert data['pagination']['total'] == len(multiple_items)
+        assert data['pagination']['page'] == 2
+        assert data['pagination']['has_next'] is True
+
 
 class TestRestoreItem:
     """Test POST /api/v1/items/<id>/restore endpoint."""
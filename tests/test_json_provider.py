@@ -0,0 +1,109 @@
+"""
+Tests for the orjson-based JSON provider.
+
+The provider must produce the same values as Flask's default provider, so
+switching it in does not change any API response.
+"""
+
+import pytest
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from flask import jsonify
+from flask.json.provider import DefaultJSONProvider
+
+pytest.importorskip('orjson')
+
+from app.json_provider import OrjsonProvider
+
+
+@pytest.fixture(scope='function')
+def providers(app):
+    """Return the orjson provider and Flask's default provider for the app."""
+    return OrjsonProvider(app), DefaultJSONProvider(app)
+
+
+class TestOrjsonProvider:
+    """Test OrjsonProvider against Flask's DefaultJSONProvider."""
+
+    def test_app_uses_orjson_provider(self, app):
+        """Test that the app installs the orjson provider."""
+        assert isinstance(app.json, OrjsonProvider)
+
+    @pytest.mark.parametrize('value', [
+        datetime(2026, 10, 16, 14, 30, 5),
+        datetime(2026, 10, 16, 14, 30, 5, tzinfo=timezone.utc),
+        date(2026, 10, 16),
+        Decimal('12.50'),
+        uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    ], ids=['naive_datetime', 'aware_datetime', 'date', 'decimal', 'uuid'])
+    def test_serializes_like_default_provider(self, providers, value):
+        """Test that values are encoded as Flask's default provider encodes them."""
+        orjson_provider, default_provider = providers
+        data = {'value': value, 'nested': [value]}
+
+        assert json.loads(orjson_provider.dumps(data)) == json.loads(default_provider.dumps(data))
+
+    def test_dumps_sorts_keys(self, providers):
+        """Test that keys are sorted while sort_keys is enabled."""
+        orjson_provider, _ = providers
+
+        assert orjson_provider.dumps({'b': 1, 'a': {'d': 2, 'c': 3}}) == '{"a":{"c":3,"d":2},"b":1}'
+
+    def test_dumps_keeps_insertion_order_without_sort_keys(self, providers):
+        """Test that disabling sort_keys keeps the insertion order."""
+        orjson_provider, _ = providers
+        orjson_provider.sort_keys = False
+
+        assert orjson_provider.dumps({'b': 1, 'a': 2}) == '{"b":1,"a":2}'
+
+    def test_dumps_allows_non_string_keys(self, providers):
+        """Test that integer keys are encoded as strings."""
+        orjson_provider, _ = providers
+
+        assert orjson_provider.dumps({1: 'a'}) == '{"1":"a"}'
+
+    def test_loads_accepts_str_and_bytes(self, providers):
+        """Test that JSON is decoded from both str and bytes."""
+        orjson_provider, _ = providers
+
+        assert orjson_provider.loads('{"a":1}') == {'a': 1}
+        assert orjson_provider.loads(b'{"a":1}') == {'a': 1}
+
+    def test_jsonify_returns_compact_sorted_body(self, app):
+        """Test that jsonify() writes compact JSON with sorted keys."""
+        with app.test_request_context():
+            response = jsonify({'b': 1, 'a': [1, 2]})
+
+        assert response.mimetype == 'application/json'
+        assert response.get_data() == b'{"a":[1,2],"b":1}'
+
+    def test_jsonify_indents_in_debug_mode(self, app, providers):
+        """Test that jsonify() indents in debug mode like the default provider."""
+        app.debug = True
+        _, default_provider = providers
+
+        with app.test_request_context():
+            response = jsonify({'b': 1, 'a': [1, 2]})
+            expected = default_provider.response({'b': 1, 'a': [1, 2]})
+
+        assert response.get_data() == b'{\n  "a": [\n    1,\n    2\n  ],\n  "b": 1\n}'
+        assert json.loads(response.get_data()) == json.loads(expected.get_data())
+
+    def test_jsonify_stays_compact_in_debug_mode_with_compact_set(self, app):
+        """Test that compact=True keeps debug responses on one line."""
+        app.debug = True
+        app.json.compact = True
+
+        with app.test_request_context():
+            response = jsonify({'b': 1, 'a': [1, 2]})
+
+        assert response.get_data() == b'{"a":[1,2],"b":1}'
+
+    def test_jsonify_non_serializable_object_raises_type_error(self, app):
+        """Test that unknown types raise TypeError like the default provider."""
+        with app.test_request_context():
+            with pytest.raises(TypeError):
+                jsonify({'value': object()})
@@ -6,6 +6,7 @@ Tests CRUD operations, sharing, pagination, and trash management for shopping li
 
 import pytest
 import json
+from datetime import datetime, timedelta
 
 from app.models import ShoppingList, ShoppingListItem
 from app.extensions import db
@@ -70,6 +71,46 @@ class TestGetLists:
 
         assert data['data'][0]['item_count'] == 1
 
+    def test_get_lists_item_count_ignores_deleted_items(self, client, app, user_headers, regular_user, sample_list, sample_item, deleted_item):
+        """Test that item counts skip deleted items and default to 0 for empty lists."""
+        empty_list = ShoppingList(title='Leere Liste', user_id=regular_user.id)
+        db.session.add(empty_list)
+        db.session.commit()
+
+        response = client.get('/api/v1/lists', headers=user_headers)
+
+        assert response.status_code == 200
+        counts = {entry['id']: entry['item_count'] for entry in response.get_json()['data']}
+        assert counts[sample_list.id] == 1
+        assert counts[empty_list.id] == 0
+
+    def test_get_lists_query_count_does_not_grow_with_lists(self, client, app, user_headers, add_lists, assert_query_count_constant):
+        """Test that listing does not issue one query per list (N+1)."""
+        assert_query_count_constant(client, '/api/v1/lists', user_headers, add_lists)
+
+    def test_get_lists_with_matching_etag_returns_304(self, client, app, user_headers, sample_list):
+        """Test that an unchanged overview is answered with 304 Not Modified."""
+        response = client.get('/api/v1/lists', headers=user_headers)
+        etag = response.headers.get('ETag')
+
+        assert etag is not None
+
+        response = client.get('/api/v1/lists', headers={**user_headers, 'If-None-Match': etag})
+
+        assert response.status_code == 304
+
+    def test_get_lists_etag_changes_after_item_added(self, client, app, user_headers, sample_list):
+        """Test that adding an item invalidates the overview ETag (item counts change)."""
+        response = client.get('/api/v1/lists', headers=user_headers)
+        etag = response.headers.get('ETag')
+
+        client.post(f'/api/v1/lists/{sample_list.id}/items', headers=user_headers, json={'name': 'Brot'})
+
+        response = client.get('/api/v1/lists', headers={**user_headers, 'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.get_json()['data'][0]['item_count'] == 1
+
     def test_get_lists_pagination(self, client, app, user_headers, regular_user):
         """Test that pagination works correctly."""
         # Create multiple lists
@@ -90,6 +131,46 @@ class TestGetLists:
         assert data['pagination']['total'] == 5
         assert data['pagination']['has_next'] is True
 
+    def test_get_lists_cursor_pagination_walks_all_lists(self, client, app, user_headers, regular_user):
+        """Test that following next_cursor returns every list exactly once, newest first."""
+        same_time = datetime(2026, 1, 1, 12, 0, 0)
+        for i in range(5):
+            # Equal timestamps for some lists: the ID must break the tie
+            db.session.add(ShoppingList(
+                title=f'Liste {i}', user_id=regular_user.id,
+                updated_at=same_time if i < 3 else same_time + timedelta(hours=i)
+            ))
+        db.session.commit()
+
+        titles = []
+        cursor = ''
+        while cursor is not None:
+            response = client.get(f'/api/v1/lists?per_page=2&cursor={cursor}', headers=user_headers)
+            assert response.status_code == 200
+            data = response.get_json()
+
+            assert 'total' not in data['pagination']
+            titles.extend(entry['title'] for entry in data['data'])
+            cursor = data['pagination']['next_cursor']
+            assert data['pagination']['has_next'] is (cursor is not None)
+
+        assert titles == ['Liste 4', 'Liste 3', 'Liste 2', 'Liste 1', 'Liste 0']
+
+    def test_get_lists_counts_lists_only_once(self, client, app, user_headers, sample_list, query_counter):
+        """Test that the page reuses the list count of the ETag query."""
+        response = client.get('/api/v1/lists?per_page=1', headers=user_headers)
+
+        assert response.status_code == 200
+        assert response.get_json()['pagination']['total'] == 1
+        assert response.get_json()['pagination']['pages'] == 1
+        assert not any('count(*)' in stmt for stmt in query_counter)
+
+    def test_get_lists_with_invalid_cursor_returns_400(self, client, app, user_headers):
+        """Test that a malformed cursor is rejected."""
+        response = client.get('/api/v1/lists?cursor=kaputt', headers=user_headers)
+
+        assert response.status_code == 400
+
 
 # ============================================================================
 # Get Single List Tests
@@ -182,6 +263,19 @@ class TestCreateList:
         assert list_obj is not None
         assert list_obj.title == 'Neue Einkaufsliste'
 
+    def test_create_list_does_not_reload_owner_after_commit(self, client, app, user_headers, regular_user, query_counter):
+        """Test that the 201 body is built without selecting the owner again."""
+        username = regular_user.username
+        client.get('/api/v1/lists', headers=user_headers)  # warm up one-time per-app checks
+        query_counter.clear()
+
+        response = client.post('/api/v1/lists', headers=user_headers, json={'title': 'Neue Liste'})
+
+        assert response.status_code == 201
+        assert response.get_json()['data']['owner_username'] == username
+        insert_at = next(i for i, stmt in enumerate(query_counter) if stmt.startswith('INSERT'))
+        assert not any('FROM users' in stmt for stmt in query_counter[insert_at:])
+
     def test_create_list_without_is_shared_defaults_to_false(self, client, app, user_headers):
         """Test that is_shared defaults to False if not provided."""
         response = client.post('/api/v1/lists', headers=user_headers, json={
@@ -273,6 +367,29 @@ class TestUpdateList:
 
         assert data['data']['version'] == original_version + 1
 
+    def test_update_list_advances_updated_at(self, client, app, user_headers, sample_list):
+        """Test that a changed list gets a fresh updated_at from the column's onupdate."""
+        sample_list.updated_at = datetime(2020, 1, 1)
+        db.session.commit()
+
+        response = client.put(f'/api/v1/lists/{sample_list.id}', headers=user_headers, json={
+            'title': 'Updated Title'
+        })
+
+        assert response.status_code == 200
+        db.session.refresh(sample_list)
+        assert sample_list.updated_at > datetime(2020, 1, 1)
+
+    def test_update_list_with_unchanged_values_keeps_version(self, client, app, user_headers, sample_list):
+        """Test that an update without actual changes does not bump the version."""
+        response = client.put(f'/api/v1/lists/{sample_list.id}', headers=user_headers, json={
+            'title': sample_list.title,
+            'is_shared': sample_list.is_shared
+        })
+
+        assert response.status_code == 200
+        assert response.get_json()['data']['version'] == 1
+
     def test_update_list_is_shared_to_true(self, client, app, user_headers, sample_list):
         """Test that updating is_shared to True works."""
         response = client.put(f'/api/v1/lists/{sample_list.id}', headers=user_headers, json={
@@ -302,6 +419,20 @@ class TestUpdateList:
         assert data['data']['is_shared'] is False
         assert data['data']['guid'] != original_guid
 
+    def test_update_list_reloads_with_single_query(self, client, app, user_headers, sample_list, sample_item, deleted_item, query_counter):
+        """Test that the response needs one SELECT after the UPDATE and counts only active items."""
+        client.get('/api/v1/lists', headers=user_headers)  # warm up one-time per-app checks
+        query_counter.clear()
+
+        response = client.put(f'/api/v1/lists/{sample_list.id}', headers=user_headers, json={
+            'title': 'Neuer Titel'
+        })
+
+        assert response.status_code == 200
+        assert response.get_json()['data']['item_count'] == 1
+        update_at = next(i for i, stmt in enumerate(query_counter) if stmt.startswith('UPDATE'))
+        assert [stmt.startswith('SELECT') for stmt in query_counter[update_at + 1:]].count(True) == 1
+
     def test_update_other_user_list_returns_403(self, client, app, user_headers, admin_list):
         """Test that updating another user's list returns 403."""
         response = client.put(f'/api/v1/lists/{admin_list.id}', headers=user_headers, json={
@@ -336,6 +467,7 @@ class TestUpdateList:
         data = response.get_json()
 
         assert data['data']['title'] == 'Admin Updated'
+        assert data['data']['owner_username'] == sample_list.owner.username
 
 
 # ============================================================================
@@ -419,6 +551,22 @@ class TestToggleShare:
         assert data['success'] is True
         assert data['data']['is_shared'] is False
 
+    def test_toggle_share_to_current_value_keeps_list_unchanged(self, client, app, user_headers, shared_list):
+        """Test that repeating the current status neither writes nor regenerates the GUID."""
+        original_guid = shared_list.guid
+        original_updated_at = shared_list.updated_at
+
+        response = client.post(f'/api/v1/lists/{shared_list.id}/share', headers=user_headers, json={
+            'is_shared': True
+        })
+
+        assert response.status_code == 200
+        assert response.get_json()['data']['is_shared'] is True
+
+        db.session.refresh(shared_list)
+        assert shared_list.guid == original_guid
+        assert shared_list.updated_at == original_updated_at
+
 
 # ============================================================================
 # Get Share URL Tests
@@ -457,6 +605,7 @@ class TestTrashLists:
         assert data['success'] is True
         assert len(data['data']) == 1
         assert data['data'][0]['id'] == deleted_list.id
+        assert data['pagination']['total'] == 1
 
     def test_get_trash_lists_excludes_active_lists(self, client, app, user_headers, sample_list, deleted_list):
         """Test that trash endpoint only returns deleted lists."""
@@ -520,3 +669,30 @@ class TestPermanentDeleteList:
         data = response.get_json()
 
         assert data['success'] is False
+
+    def test_permanent_delete_active_list_returns_404(self, client, app, admin_headers, sample_list):
+        """Test that only lists in the trash can be permanently deleted."""
+        response = client.delete(f'/api/v1/trash/lists/{sample_list.id}', headers=admin_headers)
+
+        assert response.status_code == 404
+
+
+# ============================================================================
+# Print List Tests
+# ============================================================================
+
+class TestPrintList:
+    """Test POST /api/v1/lists/<id>/print endpoint."""
+
+    def test_print_list_with_disabled_printer_returns_400(self, client, app, user_headers, sample_list):
+        """Test that printing reports an unavailable printer."""
+        response = client.post(f'/api/v1/lists/{sample_list.id}/print', headers=user_headers, json={})
+
+        assert response.status_code == 400
+        assert response.get_json()['error']['code'] == 'PRINTER_NOT_AVAILABLE'
+
+    def test_print_other_user_list_returns_403(self, client, app, user_headers, admin_list):
+        """Test that printing another user's private list returns 403."""
+        response = client.post(f'/api/v1/lists/{admin_list.id}/print', headers=user_headers, json={})
+
+        assert response.status_code == 403
@@ -8,6 +8,7 @@ including relationships, methods, and database constraints.
 import pytest
 from datetime import datetime, timezone
 from sqlalchemy.exc import IntegrityError
+from werkzeug.security import generate_password_hash
 
 from app.extensions import db
 from app.models import User, ShoppingList, ShoppingListItem, RevokedToken
@@ -63,6 +64,43 @@ class TestUserModel:
 
         assert user.check_password('WrongPassword') is False
 
+    def test_password_needs_rehash_detects_other_method(self, app):
+        """Test that only hashes with the configured method and cost are current."""
+        user = User(username='testuser', email='test@example.com')
+        user.set_password('CorrectPassword')
+
+        assert user.password_needs_rehash() is False
+
+        user.password_hash = generate_password_hash('CorrectPassword', method='pbkdf2:sha256:500')
+
+        assert user.password_needs_rehash() is True
+
+    def test_password_needs_rehash_with_short_method_name(self, app, monkeypatch):
+        """Test that a short method name matches the full parameters Werkzeug stores."""
+        monkeypatch.setitem(app.config, 'PASSWORD_HASH_METHOD', 'pbkdf2:sha256')
+        user = User(username='testuser', email='test@example.com')
+        user.set_password('CorrectPassword')
+
+        assert user.password_needs_rehash() is False
+
+        user.password_hash = generate_password_hash('CorrectPassword', method='pbkdf2:sha256:500')
+
+        assert user.password_needs_rehash() is True
+
+    def test_authenticate_returns_user_for_valid_credentials(self, app, regular_user):
+        """Test that authenticate() returns the user only for the right password."""
+        assert User.authenticate('regular_test', 'UserPass123') == regular_user
+        assert User.authenticate('regular_test', 'WrongPassword') is None
+
+    def test_authenticate_checks_dummy_hash_for_unknown_user(self, app, monkeypatch):
+        """Test that unknown usernames still cost one hash check."""
+        checked = []
+        monkeypatch.setattr('app.models.check_password_hash', lambda pwhash, password: checked.append(pwhash) or False)
+
+        assert User.authenticate('unknown_user', 'Whatever123') is None
+        assert len(checked) == 1
+        assert checked[0].startswith(app.config['PASSWORD_HASH_METHOD'] + '$')
+
     def test_unique_username_constraint(self, app, regular_user):
         """Test that duplicate usernames are not allowed."""
         duplicate_user = User(
@@ -91,6 +129,22 @@ class TestUserModel:
         with pytest.raises(IntegrityError):
             db.session.commit()
 
+    def test_find_conflict_detects_username_and_email(self, app, regular_user, another_user):
+        """Test that find_conflict reports the taken field, username first."""
+        assert User.find_conflict(username=regular_user.username) == 'username'
+        assert User.find_conflict(email=regular_user.email) == 'email'
+        assert User.find_conflict(username=regular_user.username, email=another_user.email) == 'username'
+        assert User.find_conflict(username='free_name', email='free@example.com') is None
+        assert User.find_conflict() is None
+
+    def test_find_conflict_ignores_excluded_user(self, app, regular_user):
+        """Test that find_conflict skips the user being updated."""
+        assert User.find_conflict(
+            username=regular_user.username,
+            email=regular_user.email,
+            exclude_id=regular_user.id
+        ) is None
+
     def test_user_shopping_lists_relationship(self, app, regular_user):
         """Test that user's shopping lists relationship works."""
         # Create lists for user
@@ -125,6 +179,13 @@ class TestUserModel:
         assert ShoppingList.query.get(list1_id) is None
         assert ShoppingList.query.get(list2_id) is None
 
+    def test_with_list_count_includes_trashed_lists(self, app, regular_user, admin_user, sample_list, deleted_list):
+        """Test that with_list_count() counts active and trashed lists, 0 for none."""
+        rows = dict(User.with_list_count().filter(User.id.in_([regular_user.id, admin_user.id])).all())
+
+        assert rows[regular_user] == 2
+        assert rows[admin_user] == 0
+
     def test_user_repr(self, app, regular_user):
         """Test User __repr__ method."""
         assert repr(regular_user) == f'<User {regular_user.username}>'
@@ -169,6 +230,15 @@ class TestShoppingListModel:
 
         assert list1.guid != list2.guid
 
+    def test_regenerate_guid_replaces_guid(self, app, sample_list):
+        """Test that regenerating the GUID assigns a new UUID."""
+        original_guid = sample_list.guid
+
+        sample_list.regenerate_guid()
+
+        assert sample_list.guid != original_guid
+        assert len(sample_list.guid) == 36  # UUID format
+
     def test_list_items_relationship(self, app, sample_list):
         """Test that list's items relationship works."""
         item1 = ShoppingListItem(
@@ -210,6 +280,10 @@ class TestShoppingListModel:
         db.session.refresh(sample_item)
         assert sample_item.deleted_at is not None
 
+    def test_soft_delete_returns_trashed_item_count(self, app, sample_list, sample_item, checked_item, deleted_item):
+        """Test that soft_delete reports only the items it moved to the trash."""
+        assert sample_list.soft_delete() == 2
+
     def test_restore_list(self, app, deleted_list):
         """Test that restore removes deleted_at timestamp."""
         assert deleted_list.is_deleted is True
@@ -301,6 +375,15 @@ class TestShoppingListModel:
         """Test that list.owner relationship works."""
         assert sample_list.owner == regular_user
 
+    def test_with_item_count_includes_trashed_items(self, app, sample_list, sample_item, deleted_item, shared_list):
+        """Test that with_item_count() counts active and trashed items, 0 for none."""
+        rows = dict(ShoppingList.with_item_count().filter(
+            ShoppingList.id.in_([sample_list.id, shared_list.id])
+        ).all())
+
+        assert rows[sample_list] == 2
+        assert rows[shared_list] == 0
+
     def test_list_repr(self, app, sample_list):
         """Test ShoppingList __repr__ method."""
         assert repr(sample_list) == f'<ShoppingList {sample_list.title}>'
@@ -386,6 +469,51 @@ class TestShoppingListItemModel:
         assert deleted_item in deleted_items
         assert sample_item not in deleted_items
 
+    def test_active_rows_returns_active_items_in_display_order(self, app, sample_list, sample_item, checked_item, deleted_item):
+        """Test that active_rows() skips deleted items and sorts by order_index descending."""
+        rows = ShoppingListItem.active_rows(sample_list.id)
+
+        expected = sorted([sample_item, checked_item], key=lambda item: item.order_index, reverse=True)
+        assert [row.id for row in rows] == [item.id for item in expected]
+        assert rows[0].name == expected[0].name
+
+    def test_next_order_index_ignores_deleted_items(self, app, sample_list, sample_item, deleted_item):
+        """Test that next_order_index() places a new item above the highest active one."""
+        deleted_item.order_index = sample_item.order_index + 50
+        db.session.commit()
+
+        item = ShoppingListItem(
+            shopping_list_id=sample_list.id,
+            name='Neu',
+            order_index=ShoppingListItem.next_order_index(sample_list.id)
+        )
+        db.session.add(item)
+        db.session.commit()
+
+        assert item.order_index == sample_item.order_index + 1
+
+    def test_bulk_set_updates_each_item(self, app, sample_list, sample_item, checked_item):
+        """Test that bulk_set() writes a separate value per item ID."""
+        values = {sample_item.id: 7, checked_item.id: 3}
+
+        assert ShoppingListItem.bulk_set(sample_list.id, 'order_index', values) is True
+        db.session.commit()
+        db.session.expire_all()
+
+        assert db.session.get(ShoppingListItem, sample_item.id).order_index == 7
+        assert db.session.get(ShoppingListItem, checked_item.id).order_index == 3
+
+    def test_bulk_set_rolls_back_on_deleted_item(self, app, sample_list, sample_item, deleted_item):
+        """Test that bulk_set() updates nothing if one ID is not an active item of the list."""
+        original_index = sample_item.order_index
+
+        result = ShoppingListItem.bulk_set(
+            sample_list.id, 'order_index', {sample_item.id: original_index + 10, deleted_item.id: 1}
+        )
+
+        assert result is False
+        assert db.session.get(ShoppingListItem, sample_item.id).order_index == original_index
+
     def test_check_version_with_matching_version(self, app, sample_item):
         """Test that check_version passes with correct version."""
         current_version = sample_item.version
@@ -149,6 +149,18 @@ class TestListAccessRequired:
 
         assert response.status_code == 200
 
+    def test_decorator_and_view_share_one_token_check(self, client, app, user_headers, sample_list, query_counter):
+        """Test that the decorator and get_current_user() in the view don't re-check the token."""
+        list_id = sample_list.id
+
+        query_counter.clear()
+        response = client.put(f'/api/v1/lists/{list_id}', headers=user_headers, json={'title': 'Neu'})
+
+        assert response.status_code == 200
+        # One check by @jwt_required(), one by the first get_current_user()
+        blocklist_queries = [statement for statement in query_counter if 'revoked_tokens' in statement]
+        assert len(blocklist_queries) == 2
+
     def test_non_owner_cannot_view_private_list(self, client, app, another_user_headers, sample_list):
         """Test that non-owners cannot view private lists."""
         response = client.get(f'/api/v1/lists/{sample_list.id}', headers=another_user_headers)
@@ -224,6 +236,23 @@ class TestItemAccessPermissions:
 
         assert response.status_code == 200
 
+    def test_non_owner_cannot_delete_or_toggle_item_in_private_list(self, client, app, another_user_headers, sample_item):
+        """Test that non-owners can neither delete nor toggle items in private lists."""
+        response = client.delete(f'/api/v1/items/{sample_item.id}', headers=another_user_headers)
+        assert response.status_code == 403
+
+        response = client.post(f'/api/v1/items/{sample_item.id}/toggle', headers=another_user_headers)
+        assert response.status_code == 403
+
+    def test_deleted_item_is_not_found(self, client, app, user_headers, sample_item):
+        """Test that items in the trash are reported as not found."""
+        sample_item.soft_delete()
+        db.session.commit()
+
+        response = client.get(f'/api/v1/items/{sample_item.id}', headers=user_headers)
+
+        assert response.status_code == 404
+
     def test_owner_can_reorder_items(self, client, app, user_headers, sample_item):
         """Test that owners can reorder items."""
         response = client.put(f'/api/v1/items/{sample_item.id}/reorder', headers=user_headers, json={
@@ -30,6 +30,57 @@ class TestGetSharedList:
         assert data['data']['title'] == shared_list.title
         assert 'items' in data['data']
 
+    def test_get_shared_list_loads_owner_with_list(self, client, app, shared_list, regular_user, query_counter):
+        """Test that the list (with owner) and its items take two queries."""
+        guid, username = shared_list.guid, regular_user.username
+        client.get(f'/api/v1/shared/{guid}')  # warm up one-time per-app checks
+        db.session.expunge_all()
+        query_counter.clear()
+
+        response = client.get(f'/api/v1/shared/{guid}')
+
+        assert response.status_code == 200
+        assert response.get_json()['data']['owner'] == username
+        assert len(query_counter) == 2
+
+    def test_get_shared_list_with_matching_etag_returns_304(self, client, app, shared_list):
+        """Test that an unchanged shared list is answered with 304 Not Modified."""
+        response = client.get(f'/api/v1/shared/{shared_list.guid}')
+        etag = response.headers.get('ETag')
+
+        assert etag is not None
+
+        response = client.get(f'/api/v1/shared/{shared_list.guid}', headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+
+    def test_get_shared_list_etag_changes_after_item_added(self, client, app, user_headers, shared_list):
+        """Test that the owner adding an item invalidates the shared list's ETag."""
+        guid = shared_list.guid
+        response = client.get(f'/api/v1/shared/{guid}')
+        etag = response.headers.get('ETag')
+
+        client.post(f'/api/v1/lists/{shared_list.id}/items', headers=user_headers, json={'name': 'Brot'})
+
+        response = client.get(f'/api/v1/shared/{guid}', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert [item['name'] for item in response.get_json()['data']['items']] == ['Brot']
+
+    def test_shared_web_page_with_matching_etag_returns_304(self, client, app, shared_list):
+        """Test that anonymous visitors can revalidate the shared list page."""
+        guid = shared_list.guid
+        response = client.get(f'/shared/{guid}')
+        etag = response.headers.get('ETag')
+
+        assert response.status_code == 200
+        assert etag is not None
+        assert response.cache_control.no_cache
+
+        response = client.get(f'/shared/{guid}', headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+
     def test_get_shared_list_includes_owner_username(self, client, app, shared_list, regular_user):
         """Test that shared list response includes owner username."""
         response = client.get(f'/api/v1/shared/{shared_list.guid}')
@@ -218,6 +269,20 @@ class TestGetSharedListInfo:
         assert data['data']['item_count'] == 2
         assert data['data']['checked_count'] == 1
 
+    def test_get_shared_list_info_counts_in_one_query(self, client, app, shared_list, query_counter):
+        """Test that item and checked counts come from a single statement."""
+        guid = shared_list.guid
+        client.get(f'/api/v1/shared/{guid}/info')  # warm up one-time per-app checks
+        db.session.expunge_all()
+        query_counter.clear()
+
+        response = client.get(f'/api/v1/shared/{guid}/info')
+
+        assert response.status_code == 200
+        count_queries = [stmt for stmt in query_counter if 'FROM shopping_list_items' in stmt]
+        assert len(count_queries) == 1
+        assert len(query_counter) == 2
+
     def test_get_shared_list_info_does_not_include_items(self, client, app, shared_list):
         """Test that info endpoint does not include full item list."""
         response = client.get(f'/api/v1/shared/{shared_list.guid}/info')
@@ -507,6 +507,13 @@ class TestTrashQueries:
         item_ids = [item['id'] for item in data['data']]
         assert sample_item.id not in item_ids
 
+    def test_get_trash_items_query_count_does_not_grow_with_lists(self, client, user_headers, add_lists, assert_query_count_constant):
+        """Test that parent lists of trashed items are not loaded one by one."""
+        assert_query_count_constant(
+            client, '/api/v1/trash/items', user_headers,
+            lambda count: add_lists(count, trash_items=True)
+        )
+
     def test_get_trash_items_only_shows_own_items(self, client, user_headers, another_user, regular_user):
         """Test that users only see items from their own lists in trash."""
         # Create list for another user with deleted item